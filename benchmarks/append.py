@@ -0,0 +1,54 @@
+"""
+Benchmarks appending events to an EventList.
+
+With geometric capacity growth the total append time should scale linearly with the
+number of events, i.e. the time per append should stay roughly constant.
+
+Usage: python benchmarks/append.py [max_size]
+"""
+
+import sys
+import time
+import datetime
+from scheduler.event import Event
+from scheduler.eventlist import EventList
+
+
+def generate_events(n: int) -> list:
+    """
+    Generates n non-conflicting events an hour apart.
+    """
+    start_time = datetime.datetime(2025, 1, 1, 9, 0)
+    events = []
+    for i in range(n):
+        event_time = start_time + datetime.timedelta(hours=i)
+        events.append(
+            Event(
+                title=f"Event {i}",
+                date=event_time.strftime("%Y-%m-%d"),
+                time=event_time.strftime("%H:%M"),
+                location=f"Location {i}",
+            )
+        )
+    return events
+
+
+def time_appends(events: list) -> float:
+    """
+    Times appending every event to an empty EventList.
+    """
+    event_list = EventList()
+    start = time.perf_counter()
+    for event in events:
+        event_list.insert(event)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    size = 1000
+    print(f"{'events':>10} {'total (s)':>10} {'per append (us)':>16}")
+    while size <= max_size:
+        elapsed = time_appends(generate_events(size))
+        print(f"{size:>10} {elapsed:>10.3f} {elapsed / size * 1e6:>16.2f}")
+        size *= 10
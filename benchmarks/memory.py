@@ -0,0 +1,45 @@
+"""
+Measures the memory footprint of Event and EventNode objects with tracemalloc.
+
+Usage: python benchmarks/memory.py [number_of_events]
+"""
+
+import sys
+import datetime
+import tracemalloc
+from scheduler.event import Event, EventNode
+
+
+def measure(event_type: type, n: int) -> float:
+    """
+    Measures the average number of bytes allocated per event.
+    The strings passed to each event are created beforehand so only the event itself is measured.
+    """
+    start_time = datetime.datetime(2025, 1, 1, 9, 0)
+    params = []
+    for i in range(n):
+        event_time = start_time + datetime.timedelta(hours=i)
+        params.append(
+            (
+                f"Event {i}",
+                event_time.strftime("%Y-%m-%d"),
+                event_time.strftime("%H:%M"),
+                f"Location {i}",
+            )
+        )
+
+    tracemalloc.start()
+    events = []
+    for i, (title, date, time, location) in enumerate(params):
+        event = event_type(title=title, date=date, time=time, location=location)
+        event.id = i
+        events.append(event)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / n
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for event_type in [Event, EventNode]:
+        print(f"{event_type.__name__:>10}: {measure(event_type, n):.1f} bytes per event")
@@ -0,0 +1,86 @@
+"""
+Benchmarks searching events by ID with the interpolation and exponential searches against the binary search.
+
+Events are searched in a list sorted by ID, with a few IDs missing as if they had been deleted.
+Interpolation search should take O(log log n) steps on the evenly spread IDs, while exponential
+search is fastest for targets near the front, e.g. the most recent events of a list sorted newest first.
+
+Usage: python benchmarks/search.py [number_of_searches]
+"""
+
+import sys
+import time
+import random
+from scheduler.event import Event
+from scheduler.search import SearchAlgorithm
+
+# Sizes used in the final report notebook
+SIZES = [50, 500, 5000, 50000, 100000]
+
+
+def generate_events(n: int) -> list:
+    """
+    Generates n events sorted by ID, with 1% of IDs skipped.
+    """
+    start_time = 1735722000  # 2025-01-01 09:00
+    events = []
+    id = 1
+    for i in range(n):
+        if random.random() < 0.01:
+            id += 1
+        event = Event.from_datetime(
+            title=f"Event {i}", start_time=start_time + i * 3600, location=""
+        )
+        event.id = id
+        events.append(event)
+        id += 1
+    return events
+
+
+def time_searches(algorithm: SearchAlgorithm, events: list, targets: list) -> float:
+    """
+    Times searching for every target, returning the average time per search.
+    """
+    start = time.perf_counter()
+    for target in targets:
+        algorithm.value(data=events, target=target, attribute="_id")
+    return (time.perf_counter() - start) / len(targets)
+
+
+if __name__ == "__main__":
+    searches = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    algorithms = [
+        SearchAlgorithm.BINARY,
+        SearchAlgorithm.INTERPOLATION,
+        SearchAlgorithm.EXPONENTIAL,
+    ]
+    print(
+        f"{'events':>10} {'targets':>8}"
+        + "".join(f" {algorithm.name + ' (us)':>18}" for algorithm in algorithms)
+    )
+    for size in SIZES:
+        events = generate_events(size)
+        ids = [event.id for event in events]
+        # Exponential search looks up recent events at the front of a list sorted newest first,
+        # the other algorithms only support ascending order
+        newest_first = events[::-1]
+        for name, targets in [
+            ("random", random.choices(ids, k=searches)),
+            ("recent", random.choices(ids[-10:], k=searches)),
+        ]:
+            times = [
+                time_searches(
+                    algorithm,
+                    (
+                        newest_first
+                        if algorithm == SearchAlgorithm.EXPONENTIAL and name == "recent"
+                        else events
+                    ),
+                    targets,
+                )
+                for algorithm in algorithms
+            ]
+            print(
+                f"{size:>10} {name:>8}"
+                + "".join(f" {elapsed * 1e6:>18.2f}" for elapsed in times)
+            )
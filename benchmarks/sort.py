@@ -0,0 +1,74 @@
+"""
+Benchmarks sorting events with the natural merge sort against the merge sort.
+
+Events are sorted by start time from presorted, nearly sorted (1% late additions),
+reverse-sorted and shuffled orders. The natural merge sort should stay close to linear
+on the first three while the merge sort pays O(N log N) regardless of order.
+
+Usage: python benchmarks/sort.py [max_size]
+"""
+
+import sys
+import time
+import random
+from scheduler.event import Event
+from scheduler.sort import SortingAlgorithm
+
+
+def generate_events(n: int) -> list:
+    """
+    Generates n non-conflicting events an hour apart, in chronological order.
+    """
+    start_time = 1735722000  # 2025-01-01 09:00
+    return [
+        Event.from_datetime(
+            title=f"Event {i}", start_time=start_time + i * 3600, location=""
+        )
+        for i in range(n)
+    ]
+
+
+def orders(events: list) -> dict:
+    """
+    Arranges the events in each benchmarked order.
+    """
+    # Move 1% of the events to the end, as if they were added late
+    late = set(random.sample(range(len(events)), k=len(events) // 100))
+    nearly_sorted = [e for i, e in enumerate(events) if i not in late] + [
+        events[i] for i in sorted(late)
+    ]
+    shuffled = random.sample(events, k=len(events))
+    return {
+        "presorted": list(events),
+        "nearly sorted": nearly_sorted,
+        "reversed": events[::-1],
+        "shuffled": shuffled,
+    }
+
+
+def time_sort(algorithm: SortingAlgorithm, events: list) -> float:
+    """
+    Times sorting a copy of the events by start time.
+    """
+    data = list(events)
+    start = time.perf_counter()
+    algorithm.value(data=data, attribute="start_time")
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    algorithms = [SortingAlgorithm.MERGE, SortingAlgorithm.NATURAL_MERGE]
+    print(
+        f"{'events':>10} {'order':>14}"
+        + "".join(f" {algorithm.name + ' (s)':>18}" for algorithm in algorithms)
+    )
+    size = 1000
+    while size <= max_size:
+        for order, events in orders(generate_events(size)).items():
+            times = [time_sort(algorithm, events) for algorithm in algorithms]
+            print(
+                f"{size:>10} {order:>14}"
+                + "".join(f" {elapsed:>18.4f}" for elapsed in times)
+            )
+        size *= 10
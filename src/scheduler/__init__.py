@@ -1,5 +1,7 @@
-from .event import Event, EventNode
+from .event import Event, EventNode, RecurringEvent
 from .eventlist import EventList
 from .linkedeventlist import LinkedEventList
+from .columnareventlist import ColumnarEventList
+from .skiplisteventlist import SkipListEventList
 from .search import SearchAlgorithm
 from .sort import SortingAlgorithm
@@ -0,0 +1,591 @@
+import datetime
+import numpy as np
+from scheduler.event import Event, RecurringEvent, DURATION
+from scheduler.sort import SortingAlgorithm
+from scheduler.search import SearchAlgorithm, is_batch
+from scheduler.utils import parse_records, conflict_error, free_slots
+from scheduler.defaults import INITIAL_ID, INITIAL_CAPACITY, GROWTH_FACTOR, EPOCH
+
+# ID stored for events that were set without one
+NO_ID: int = -1
+
+
+def to_datetime64(times: list) -> np.ndarray:
+    """
+    Converts datetime objects to a datetime64 array.
+    Integer arithmetic on the offsets is several times faster than letting NumPy convert each object.
+
+    Parameters
+    ----------
+    times: list
+        A list of datetime.datetime objects
+
+    Returns
+    -------
+    Array of datetime64 values in seconds
+    """
+    second = datetime.timedelta(seconds=1)
+    offsets = np.array([(time - EPOCH) // second for time in times], dtype=np.int64)
+    return offsets.astype("datetime64[s]")
+
+
+class ColumnarEventList:
+    """
+    A list of events stored column by column in parallel NumPy arrays.
+    """
+
+    def __init__(
+        self, capacity: int = INITIAL_CAPACITY, growth_factor: float = GROWTH_FACTOR
+    ):
+        """
+        Attributes
+        ----------
+        capacity: int
+            Base size of the initialized arrays
+        growth_factor: float
+            Factor by which the capacity is multiplied when the arrays are full
+        ids: np.ndarray
+            Event IDs
+        start_times: np.ndarray
+            Event start times as datetime64 values
+        end_times: np.ndarray
+            Event end times as datetime64 values
+        titles: np.ndarray
+            Interned codes of the event titles
+        locations: np.ndarray
+            Interned codes of the event locations
+        size: int
+            The number of events in the event list
+        """
+        if growth_factor <= 1:
+            raise ValueError(
+                f"Growth factor must be greater than 1, got {growth_factor}"
+            )
+        # Initialize event ID counter
+        self._id = INITIAL_ID
+        # Initialize geometric growth factor
+        self.growth_factor = growth_factor
+        # Initialize maximum capacity
+        self.capacity = capacity
+        # Initialize array size
+        self.size = 0
+        # Create columns
+        self.ids = np.full(capacity, NO_ID, dtype=np.int64)
+        self.start_times = np.zeros(capacity, dtype="datetime64[s]")
+        self.end_times = np.zeros(capacity, dtype="datetime64[s]")
+        self.titles = np.zeros(capacity, dtype=np.int32)
+        self.locations = np.zeros(capacity, dtype=np.int32)
+        # Initialize table of interned titles and locations
+        self._strings = []
+        self._codes = {}
+        # Initialize mutation counter and cache of sorted orders
+        self._version = 0
+        self._orders = {}
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield self._event(i)
+
+    def __getitem__(self, index: int) -> Event:
+        if isinstance(index, int):
+            # Validate index
+            if index < 0:
+                index += self.size
+            if index < 0 or index >= self.size:
+                raise IndexError(f"Index {index} is out of range")
+            return self._event(index)
+        else:
+            raise TypeError(f"Invalid index type {type(index)}")
+
+    def __setitem__(self, index: int, value: Event):
+        if isinstance(index, int):
+            # Validate index
+            if index < 0:
+                index += self.size
+            if index < 0 or index >= self.size:
+                raise IndexError(f"Index {index} is out of range")
+            self._write(index, value)
+            self._version += 1
+        else:
+            raise TypeError(f"Invalid index type {type(index)}")
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Number of bytes used by the columns.
+        """
+        return sum(
+            column.nbytes
+            for column in [
+                self.ids,
+                self.start_times,
+                self.end_times,
+                self.titles,
+                self.locations,
+            ]
+        )
+
+    def _intern(self, string: str) -> int:
+        """
+        Gets the code of a title or location, adding it to the string table if needed.
+
+        Parameters
+        ----------
+        string: str
+            The title or location to be interned
+
+        Returns
+        -------
+        The integer code of the string
+        """
+        code = self._codes.get(string)
+        if code is None:
+            code = self._codes[string] = len(self._strings)
+            self._strings.append(string)
+        return code
+
+    def _write(self, index: int, event: Event):
+        """
+        Writes an event to one row of the columns.
+
+        Parameters
+        ----------
+        index: int
+            The row to be written
+        event: Event
+            The event to be stored
+        """
+        self.ids[index] = getattr(event, "_id", NO_ID)
+        self.start_times[index] = np.datetime64(event.start_time, "s")
+        self.end_times[index] = np.datetime64(event.end_time, "s")
+        self.titles[index] = self._intern(event.title)
+        self.locations[index] = self._intern(event.location)
+
+    def _event(self, index: int) -> Event:
+        """
+        Builds an Event object from one row of the columns.
+
+        Parameters
+        ----------
+        index: int
+            The row to be read
+
+        Returns
+        -------
+        A new Event object
+        """
+        event = Event.from_datetime(
+            title=self._strings[self.titles[index]],
+            start_time=self.start_times[index].astype(datetime.datetime),
+            location=self._strings[self.locations[index]],
+        )
+        if self.ids[index] != NO_ID:
+            event.id = int(self.ids[index])
+        return event
+
+    def _resize(self, new_capacity: int):
+        """
+        Increases the capacity of the list.
+
+        Parameters
+        ----------
+        new_capacity: int
+            The event list's new capacity
+        """
+        padding = new_capacity - self.capacity
+        self.ids = np.concatenate([self.ids, np.full(padding, NO_ID, dtype=np.int64)])
+        self.start_times = np.concatenate(
+            [self.start_times, np.zeros(padding, dtype="datetime64[s]")]
+        )
+        self.end_times = np.concatenate(
+            [self.end_times, np.zeros(padding, dtype="datetime64[s]")]
+        )
+        self.titles = np.concatenate([self.titles, np.zeros(padding, dtype=np.int32)])
+        self.locations = np.concatenate(
+            [self.locations, np.zeros(padding, dtype=np.int32)]
+        )
+        self.capacity = new_capacity
+
+    def _collides_with(self, start_times: np.ndarray, end_times: np.ndarray):
+        """
+        Checks which of a batch of time windows overlap with a stored event.
+
+        Parameters
+        ----------
+        start_times: np.ndarray
+            Start times of the windows
+        end_times: np.ndarray
+            End times of the windows
+
+        Returns
+        -------
+        Boolean array, True for every window that overlaps a stored event
+        """
+        if self.size == 0:
+            return np.zeros(len(start_times), dtype=bool)
+        # Sort the stored events by start time once for the whole batch
+        order = self._order("start_time")
+        stored_starts = self.start_times[: self.size][order]
+        stored_ends = self.end_times[: self.size][order]
+        # Stored events are disjoint, so only the neighbours of each window can overlap
+        position = np.searchsorted(stored_starts, start_times, side="right")
+        previous_overlaps = (position > 0) & (
+            stored_ends[np.maximum(position - 1, 0)] > start_times
+        )
+        next_overlaps = (position < self.size) & (
+            stored_starts[np.minimum(position, self.size - 1)] < end_times
+        )
+        return previous_overlaps | next_overlaps
+
+    def _order(self, attribute: str) -> np.ndarray:
+        """
+        Gets the stable order of the events sorted by an attribute, cached until the next change.
+
+        Parameters
+        ----------
+        attribute: str
+            The name of the event attribute to sort by
+
+        Returns
+        -------
+        Array of row indices in sorted order
+        """
+        version, order = self._orders.get(attribute, (None, None))
+        if version != self._version:
+            if attribute == "_id":
+                keys = self.ids[: self.size]
+            elif attribute in ["start_time", "end_time"]:
+                keys = getattr(self, f"{attribute}s")[: self.size]
+            elif attribute in ["title", "location"]:
+                # Order interned codes by the strings they stand for
+                ranks = np.empty(len(self._strings), dtype=np.int64)
+                ranks[np.argsort(np.array(self._strings, dtype=object))] = np.arange(
+                    len(self._strings)
+                )
+                keys = ranks[getattr(self, f"{attribute}s")[: self.size]]
+            else:
+                raise ValueError(f"Cannot sort by attribute {attribute}")
+            order = np.argsort(keys, kind="stable")
+            self._orders[attribute] = (self._version, order)
+        return order
+
+    def insert(self, event: Event, index: int = -1):
+        """
+        Insert an event at a specific index.
+        Defaults to appending an event at the end of the list.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be inserted
+        index: int
+            The index at which the event will be inserted
+        """
+        # Assert type of event, recurring events are not expanded into columns
+        if not isinstance(event, Event) or isinstance(event, RecurringEvent):
+            raise TypeError(f"Cannot insert event of type {type(event)}")
+        # Check if event overlaps with an existing event
+        if np.any(
+            (self.start_times[: self.size] < np.datetime64(event.end_time, "s"))
+            & (np.datetime64(event.start_time, "s") < self.end_times[: self.size])
+        ):
+            raise ValueError("Conflict detected, cannot insert event")
+
+        # Insert event if no conflict detected
+        # Define index at end of list
+        if index == -1:
+            index = self.size
+        # Resize list geometrically if size reaches capacity
+        if self.size == self.capacity:
+            self._resize(
+                max(self.capacity + 1, int(self.capacity * self.growth_factor))
+            )
+        # Validate index
+        if index > self.size:
+            raise IndexError(f"Index {index} is out of range")
+        # Set event ID
+        event.id = self._id
+        # Shift the tail right to make room for the event
+        for column in [
+            self.ids,
+            self.start_times,
+            self.end_times,
+            self.titles,
+            self.locations,
+        ]:
+            column[index + 1 : self.size + 1] = column[index : self.size]
+        self._write(index, event)
+        # Sequentially generate a new ID upon insertion
+        self._id += 1
+        # Increment size
+        self.size += 1
+        self._version += 1
+
+    def extend(self, events):
+        """
+        Bulk inserts events at the end of the list.
+        Events are sorted by date and time and receive sequential IDs in that order.
+
+        Parameters
+        ----------
+        events
+            An iterable of Event objects or of dictionaries of Event parameters
+        """
+        events = parse_records(
+            records=events, event_type=Event, excluded=(RecurringEvent,)
+        )
+        if not events:
+            return
+        start_times = to_datetime64([event.start_time for event in events])
+        end_times = to_datetime64([event.end_time for event in events])
+        # Sort once, remembering each event's position in the original records
+        order = np.argsort(start_times, kind="stable")
+        start_times = start_times[order]
+        end_times = end_times[order]
+
+        # Find conflicts with stored events, then between the events of the batch
+        conflicts = self._collides_with(start_times, end_times)
+        # An event overlaps an earlier one if it starts before all of them have ended
+        latest_end = np.maximum.accumulate(end_times)
+        conflicts[1:] |= start_times[1:] < latest_end[:-1]
+        # An event overlaps a later one if the next event starts before it ends
+        conflicts[:-1] |= start_times[1:] < end_times[:-1]
+        if np.any(conflicts):
+            positions = order[conflicts].tolist()
+            raise conflict_error(
+                positions=positions, events=[events[i] for i in positions]
+            )
+
+        # Resize list once to fit the whole batch
+        if self.size + len(events) > self.capacity:
+            self._resize(
+                max(self.size + len(events), int(self.capacity * self.growth_factor))
+            )
+        rows = slice(self.size, self.size + len(events))
+        self.ids[rows] = np.arange(self._id, self._id + len(events))
+        self.start_times[rows] = start_times
+        self.end_times[rows] = end_times
+        self.titles[rows] = [self._intern(events[i].title) for i in order]
+        self.locations[rows] = [self._intern(events[i].location) for i in order]
+        for i, j in enumerate(order):
+            events[j].id = self._id + i
+        self._id += len(events)
+        self.size += len(events)
+        self._version += 1
+
+    @classmethod
+    def from_records(cls, records, **kwargs):
+        """
+        Creates a columnar event list from a collection of events in a single bulk load.
+
+        Parameters
+        ----------
+        records
+            An iterable of Event objects or of dictionaries of Event parameters
+        kwargs
+            Additional parameters passed to the ColumnarEventList constructor
+
+        Returns
+        -------
+        A new ColumnarEventList containing the events sorted by date and time
+        """
+        event_list = cls(**kwargs)
+        event_list.extend(records)
+        return event_list
+
+    def delete(self, index: int = -1, event: Event | None = None):
+        """
+        Remove an item fom the event list.
+
+        Parameters
+        ----------
+        index: int
+            The index at which to remove an event
+        event: Event | None
+            An event to be removed from the list
+            If None, defaults to index-based deletion
+        """
+        # Delete at specific index
+        if event is None:
+            # Validate index
+            if index < 0:
+                index += self.size
+            if index < 0 or index >= self.size:
+                raise IndexError(f"Index {index} is out of range")
+            keep = np.ones(self.size, dtype=bool)
+            keep[index] = False
+
+        # Delete by matching event attributes
+        else:
+            if event.title not in self._codes or event.location not in self._codes:
+                return
+            keep = ~(
+                (self.ids[: self.size] == getattr(event, "_id", NO_ID))
+                & (
+                    self.start_times[: self.size]
+                    == np.datetime64(event.start_time, "s")
+                )
+                & (self.titles[: self.size] == self._codes[event.title])
+                & (self.locations[: self.size] == self._codes[event.location])
+            )
+
+        # Removes event(s) from list, while preserving array capacity
+        kept = int(np.count_nonzero(keep))
+        if kept < self.size:
+            for column in [
+                self.ids,
+                self.start_times,
+                self.end_times,
+                self.titles,
+                self.locations,
+            ]:
+                column[:kept] = column[: self.size][keep]
+            self.ids[kept : self.size] = NO_ID
+            self.size = kept
+            self._version += 1
+
+    def overlapping(self, start: datetime.datetime, end: datetime.datetime):
+        """
+        Lazily yields the events overlapping a time window, ordered by start time.
+
+        Parameters
+        ----------
+        start: datetime.datetime
+            Beginning of the window (inclusive)
+        end: datetime.datetime
+            End of the window (exclusive)
+        """
+        if self.size == 0:
+            return
+        start = np.datetime64(start, "s")
+        end = np.datetime64(end, "s")
+        order = self._order("start_time")
+        start_times = self.start_times[: self.size]
+        # Stored events are disjoint, so only the last event starting before the window can still be running
+        low = np.searchsorted(start_times, start, side="right", sorter=order)
+        high = np.searchsorted(start_times, end, side="left", sorter=order)
+        for i in order[max(low - 1, 0) : high]:
+            if self.end_times[i] > start:
+                yield self._event(int(i))
+
+    def find_free_slots(
+        self,
+        after: datetime.datetime,
+        duration: datetime.timedelta = DURATION,
+        limit: int | None = 1,
+    ) -> list:
+        """
+        Finds the earliest free time windows long enough to hold an event of a given duration.
+        The cached start time order is bisected, so repeated queries do not sort the columns again.
+
+        Parameters
+        ----------
+        after: datetime.datetime
+            The earliest time a window may start
+        duration: datetime.timedelta
+            The minimum length of a window, defaulting to the length of an event
+        limit: int | None
+            The maximum number of windows to return
+            If None, returns every window
+
+        Returns
+        -------
+        List of (start_time, end_time) pairs of free windows in chronological order
+        The last window is open-ended, with an end time of None
+        """
+        order = self._order("start_time")
+        # Stored events are disjoint, so only the last event starting no later than after can still be running
+        low = np.searchsorted(
+            self.start_times[: self.size],
+            np.datetime64(after, "s"),
+            side="right",
+            sorter=order,
+        )
+
+        def intervals(rows):
+            for i in rows:
+                yield self.start_times[i].item(), self.end_times[i].item()
+
+        return free_slots(
+            intervals=intervals(order[max(low - 1, 0) :]),
+            after=after,
+            duration=duration,
+            limit=limit,
+        )
+
+    def search_by_id(
+        self, id: int | list, algorithm: SearchAlgorithm = SearchAlgorithm.HASH
+    ) -> Event | dict:
+        """
+        Searches for an event using an ID.
+        Linear search scans the ID column; every other algorithm bisects it with searchsorted.
+
+        Parameters
+        ----------
+        id: int | list
+            The target ID to search for
+            If a list, set, frozenset, range or NumPy array of IDs, bisects the ID column for all of them at once
+        algorithm: SearchAlgorithm
+            The SearchAlgorithm enumeration that determines which search algorithm to use
+
+        Returns
+        -------
+        The Event object that was found
+        If searching for a collection of IDs, a dictionary mapping each ID to its Event object or None if not found
+        """
+        # Searches for a batch of IDs at once, mapping missing IDs to None
+        if is_batch(id):
+            ids = np.array(list(id) if isinstance(id, (set, frozenset)) else id)
+            results = dict.fromkeys(ids.tolist())
+            if self.size == 0 or len(ids) == 0:
+                return results
+            order = self._order("_id")
+            positions = np.searchsorted(self.ids[: self.size], ids, sorter=order)
+            rows = order[np.minimum(positions, self.size - 1)]
+            found = (positions < self.size) & (self.ids[rows] == ids)
+            for target, row in zip(ids[found].tolist(), rows[found].tolist()):
+                results[target] = self._event(row)
+            return results
+
+        if algorithm == SearchAlgorithm.LINEAR:
+            matches = np.flatnonzero(self.ids[: self.size] == id)
+            index = int(matches[0]) if len(matches) else None
+        else:
+            order = self._order("_id")
+            position = np.searchsorted(self.ids[: self.size], id, sorter=order)
+            index = None
+            if position < self.size and self.ids[order[position]] == id:
+                index = int(order[position])
+        if index is None:
+            raise ValueError(f"Could not find ID {id} in event list")
+        return self._event(index)
+
+    def list_all(
+        self,
+        sort: bool | SortingAlgorithm = True,
+        attribute: str = "start_time",
+        readonly: bool = False,
+    ) -> list | tuple:
+        """
+        Displays all events in a list.
+        Sorting always uses a stable NumPy argsort, whichever sorting algorithm is requested.
+
+        Parameters
+        ----------
+        sort: bool | SortingAlgorithm
+            Determines if returned list should be sorted by date and time
+        attribute: str
+            The name of the event attribute to sort by
+        readonly: bool
+            If True, returns a tuple instead of a list
+
+        Returns
+        -------
+        List of all events, or a tuple if readonly is True
+        """
+        order = self._order(attribute) if sort else range(self.size)
+        eventlist = [self._event(i) for i in order]
+        return tuple(eventlist) if readonly else eventlist
@@ -1,6 +1,32 @@
+import datetime
+
 # First event ID in an event list
 INITIAL_ID: int = 1
 # Initialized EventList capacity
 INITIAL_CAPACITY: int = 10
+# Factor by which a full EventList grows its capacity
+GROWTH_FACTOR: float = 2.0
+# Maximum number of levels of a SkipListEventList
+SKIPLIST_MAX_LEVEL: int = 32
+# Probability of a skip list node being promoted to the next level
+SKIPLIST_PROBABILITY: float = 0.5
 # Event duration in seconds
 EVENT_DURATION: int = 3600
+# Default time in seconds between occurrences of a recurring event
+RECURRENCE_PERIOD: int = 7 * 24 * 3600
+# Reference point for start times given as seconds
+EPOCH: datetime.datetime = datetime.datetime(1970, 1, 1)
+# Size below which sorting algorithms switch to insertion sort
+SMALL_SORT_SIZE: int = 16
+# Size above which intro sort picks its pivot as the median of three medians
+NINTHER_SIZE: int = 128
+# Number of consecutive wins after which natural merge sort starts galloping
+MIN_GALLOP: int = 7
+# Number of key bits radix sort distributes on in each pass
+RADIX_BITS: int = 8
+# Number of items below which parallel merge sort sorts serially
+PARALLEL_SORT_THRESHOLD: int = 100000
+# Memory budget in bytes for the runs of an external sort
+EXTERNAL_SORT_MEMORY: int = 64 * 2**20
+# Maximum number of runs an external sort merges at once
+EXTERNAL_SORT_FAN_IN: int = 64
@@ -2,7 +2,94 @@
 from __future__ import annotations
 
 import datetime
-from scheduler.defaults import EVENT_DURATION
+from functools import lru_cache
+from scheduler.utils import get_attributes
+from scheduler.defaults import EVENT_DURATION, EPOCH, RECURRENCE_PERIOD
+
+# Event duration shared by every event
+DURATION = datetime.timedelta(seconds=EVENT_DURATION)
+# Default time between occurrences of a recurring event
+PERIOD = datetime.timedelta(seconds=RECURRENCE_PERIOD)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date: str) -> tuple:
+    """
+    Parses a date in the form YYYY-MM-DD. Memoized since many events share the same day.
+    """
+    # Slice the fixed-width form directly, leaving anything else to strptime
+    if (
+        len(date) == 10
+        and date[4] == date[7] == "-"
+        and (date[:4] + date[5:7] + date[8:]).isdecimal()
+        and date.isascii()
+    ):
+        return int(date[:4]), int(date[5:7]), int(date[8:])
+    parsed = datetime.datetime.strptime(date, "%Y-%m-%d")
+    return parsed.year, parsed.month, parsed.day
+
+
+@lru_cache(maxsize=1440)
+def _parse_time(time: str) -> tuple:
+    """
+    Parses a time in the form HH:MM. Memoized since there are only 1440 minutes in a day.
+    """
+    # Slice the fixed-width form directly, leaving anything else to strptime
+    if (
+        len(time) == 5
+        and time[2] == ":"
+        and (time[:2] + time[3:]).isdecimal()
+        and time.isascii()
+    ):
+        return int(time[:2]), int(time[3:])
+    parsed = datetime.datetime.strptime(time, "%H:%M")
+    return parsed.hour, parsed.minute
+
+
+@lru_cache(maxsize=4096)
+def _format_date(year: int, month: int, day: int) -> str:
+    """
+    Formats a date in the form YYYY-MM-DD. Memoized since many events share the same day.
+    """
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+@lru_cache(maxsize=1440)
+def _format_time(hour: int, minute: int) -> str:
+    """
+    Formats a time in the form HH:MM. Memoized since there are only 1440 minutes in a day.
+    """
+    return f"{hour:02d}:{minute:02d}"
+
+
+def parse_start_time(
+    date: str | datetime.datetime | int | float, time: str | None
+) -> datetime.datetime:
+    """
+    Parses the start time of an event.
+
+    Parameters
+    ----------
+    date: str | datetime.datetime | int | float
+        The date the event will take place in the form YYYY-MM-DD
+        Alternatively, a pre-parsed start time as a datetime or as seconds since 1970-01-01
+    time: str | None
+        The time the event will take place in the form HH:MM
+        Must be None if date is a pre-parsed start time
+
+    Returns
+    -------
+    The start time as a datetime object
+    """
+    if isinstance(date, datetime.datetime):
+        start_time = date
+    elif isinstance(date, (int, float)) and not isinstance(date, bool):
+        start_time = EPOCH + datetime.timedelta(seconds=date)
+    else:
+        return datetime.datetime(*_parse_date(date), *_parse_time(time))
+    if time is not None:
+        raise ValueError("Cannot combine a pre-parsed start time with a time")
+    return start_time
 
 
 class Event:
@@ -10,11 +97,14 @@ class Event:
     A unique campus event.
     """
 
+    # Store attributes in fixed slots rather than a per-instance __dict__
+    __slots__ = ("title", "location", "date", "time", "start_time", "end_time", "_id")
+
     def __init__(
         self,
         title: str,
-        date: str,
-        time: str,
+        date: str | datetime.datetime | int | float,
+        time: str | None,
         location: str,
     ):
         """
@@ -22,29 +112,63 @@ class Event:
         ----------
         title: str
             The title of the event
-        date: str
+        date: str | datetime.datetime | int | float
             The date the event will take place in the form YYYY-MM-DD
-        time: str
+            Alternatively, a pre-parsed start time as a datetime or as seconds since 1970-01-01, which skips string parsing
+        time: str | None
             The time the event will take place in the form HH:MM
+            Must be None if date is a pre-parsed start time
         location: str
             The location of the event
         """
         self.title = title
         self.location = location
-        self.date = date
-        self.time = time
 
         # Checks whether date and time are valid inputs
         try:
-            self.start_time = datetime.datetime.strptime(
-                f"{date} {time}", "%Y-%m-%d %H:%M"
-            )
+            self.start_time = parse_start_time(date, time)
             # Create an event end time
             # TODO: Make duration a customizable parameter
-            self.end_time = self.start_time + datetime.timedelta(seconds=EVENT_DURATION)
-        except ValueError:
+            self.end_time = self.start_time + DURATION
+        except (ValueError, TypeError, OverflowError):
             raise ValueError(f"Invalid date '{date}' or time '{time}'")
 
+        if isinstance(date, str):
+            self.date = date
+            self.time = time
+        else:
+            start_time = self.start_time
+            self.date = _format_date(start_time.year, start_time.month, start_time.day)
+            self.time = _format_time(start_time.hour, start_time.minute)
+
+    @classmethod
+    def from_datetime(
+        cls,
+        title: str,
+        start_time: datetime.datetime | int | float,
+        location: str,
+        **kwargs,
+    ):
+        """
+        Creates an event from a pre-parsed start time, skipping string parsing.
+
+        Parameters
+        ----------
+        title: str
+            The title of the event
+        start_time: datetime.datetime | int | float
+            The time the event will start as a datetime or as seconds since 1970-01-01
+        location: str
+            The location of the event
+        kwargs
+            Additional parameters passed to the constructor
+
+        Returns
+        -------
+        A new event
+        """
+        return cls(title=title, date=start_time, time=None, location=location, **kwargs)
+
     @property
     def id(self):
         """
@@ -74,11 +198,27 @@ class Event:
             raise TypeError(
                 f"Cannot establish equality between Event and {type(other)}"
             )
-        checked_attributes = ["title", "date", "time", "location", "id", "_id"]
-        filter_attributes = lambda obj: {
-            k: v for k, v in vars(obj).items() if k in checked_attributes
-        }
-        return filter_attributes(self) == filter_attributes(other)
+        return self.key == other.key
+
+    def __hash__(self):
+        """
+        Hashes an event by its identity key, consistently with equality.
+        NOTE: Setting the ID changes the hash, so events should be hashed only once they are in an event list.
+        """
+        return hash(self.key)
+
+    @property
+    def key(self) -> tuple:
+        """
+        A hashable identity key made of every attribute checked for equality.
+        """
+        return (
+            self.title,
+            self.date,
+            self.time,
+            self.location,
+            getattr(self, "_id", None),
+        )
 
     def collides_with(self, other: Event):
         """
@@ -89,6 +229,9 @@ class Event:
         other: Event
             Another Event object
         """
+        # Recurring events check every one of their occurrences
+        if isinstance(other, RecurringEvent):
+            return other.collides_with(self)
         return self.start_time < other.end_time and other.start_time < self.end_time
 
 
@@ -97,28 +240,36 @@ class EventNode(Event):
     A unique campus event node for storage within a linked list.
     """
 
+    __slots__ = ("next", "prev")
+
     def __init__(
         self,
         title: str,
-        date: str,
-        time: str,
+        date: str | datetime.datetime | int | float,
+        time: str | None,
         location: str,
         next: EventNode | None = None,
+        prev: EventNode | None = None,
     ):
         """
         Parameters
         ----------
         title: str
             The title of the event
-        date: str
+        date: str | datetime.datetime | int | float
             The date the event will take place in the form YYYY-MM-DD
-        time: str
+            Alternatively, a pre-parsed start time as a datetime or as seconds since 1970-01-01, which skips string parsing
+        time: str | None
             The time the event will take place in the form HH:MM
+            Must be None if date is a pre-parsed start time
         location: str
             The location of the event
         next: None | EventNode
             The next event in a linked list of events
             If None, indicates the end of the list
+        prev: None | EventNode
+            The previous event in a doubly linked list of events
+            If None, indicates the start of the list
         """
         super().__init__(
             title=title,
@@ -127,6 +278,7 @@ class EventNode(Event):
             location=location,
         )
         self.next = next
+        self.prev = prev
 
     def copy(self):
         node = EventNode(
@@ -135,7 +287,189 @@ class EventNode(Event):
             time=self.time,
             location=self.location,
         )
-        for k, v in vars(self).items():
-            if k not in ["next"]:
+        for k, v in get_attributes(self).items():
+            if k not in ["next", "prev"]:
                 setattr(node, k, v)
         return node
+
+
+class RecurringEvent(Event):
+    """
+    A campus event repeating at a fixed period, such as a weekly seminar.
+    Occurrences are computed from the first start time and the period rather than stored.
+    """
+
+    __slots__ = ("until", "period", "count")
+
+    def __init__(
+        self,
+        title: str,
+        date: str | datetime.datetime | int | float,
+        time: str | None,
+        location: str,
+        until: str | datetime.datetime,
+        period: datetime.timedelta = PERIOD,
+    ):
+        """
+        Parameters
+        ----------
+        title: str
+            The title of the event
+        date: str | datetime.datetime | int | float
+            The date of the first occurrence in the form YYYY-MM-DD
+            Alternatively, a pre-parsed start time as a datetime or as seconds since 1970-01-01, which skips string parsing
+        time: str | None
+            The time of every occurrence in the form HH:MM
+            Must be None if date is a pre-parsed start time
+        location: str
+            The location of the event
+        until: str | datetime.datetime
+            The date of the last day an occurrence may take place in the form YYYY-MM-DD
+            Alternatively, the latest time an occurrence may start as a datetime
+        period: datetime.timedelta
+            The time between the starts of consecutive occurrences, a week by default
+            Must be at least as long as an event, so occurrences never overlap each other
+        """
+        super().__init__(title=title, date=date, time=time, location=location)
+        if not isinstance(period, datetime.timedelta) or period < DURATION:
+            raise ValueError(f"Invalid period {period}")
+        self.period = period
+
+        # Checks whether the last day is a valid input
+        try:
+            if isinstance(until, datetime.datetime):
+                self.until = until
+            else:
+                self.until = datetime.datetime(*_parse_date(until), 23, 59)
+        except (ValueError, TypeError):
+            raise ValueError(f"Invalid until date '{until}'")
+        if self.until < self.start_time:
+            raise ValueError(f"Invalid until date '{until}'")
+        # Number of occurrences starting no later than until
+        self.count = (self.until - self.start_time) // self.period + 1
+
+    @property
+    def key(self) -> tuple:
+        """
+        A hashable identity key made of every attribute checked for equality.
+        """
+        return super().key + (self.until, self.period)
+
+    @property
+    def last_start_time(self) -> datetime.datetime:
+        """
+        The start time of the last occurrence.
+        """
+        return self.start_time + (self.count - 1) * self.period
+
+    @property
+    def last_end_time(self) -> datetime.datetime:
+        """
+        The end time of the last occurrence.
+        """
+        return self.last_start_time + DURATION
+
+    def _indices(
+        self, start: datetime.datetime | None, end: datetime.datetime | None
+    ) -> range:
+        """
+        Computes which occurrences overlap a time window in O(1).
+
+        Parameters
+        ----------
+        start: datetime.datetime | None
+            Beginning of the window (inclusive)
+            If None, the window is unbounded on that side
+        end: datetime.datetime | None
+            End of the window (exclusive)
+            If None, the window is unbounded on that side
+
+        Returns
+        -------
+        Range of the positions of the overlapping occurrences
+        """
+        first = 0
+        last = self.count
+        # Occurrence i overlaps the window if it ends after start and starts before end
+        if start is not None:
+            first = max(first, (start - DURATION - self.start_time) // self.period + 1)
+        if end is not None:
+            last = min(last, -((self.start_time - end) // self.period))
+        return range(first, max(first, last))
+
+    def occurrence(self, i: int) -> Event:
+        """
+        Builds a single occurrence of the event.
+
+        Parameters
+        ----------
+        i: int
+            The position of the occurrence, starting from 0
+
+        Returns
+        -------
+        A new Event object sharing the ID of the recurring event
+        """
+        event = Event.from_datetime(
+            title=self.title,
+            start_time=self.start_time + i * self.period,
+            location=self.location,
+        )
+        if hasattr(self, "_id"):
+            event.id = self._id
+        return event
+
+    def occurrences(
+        self,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+    ):
+        """
+        Lazily yields the occurrences overlapping a time window, ordered by start time.
+
+        Parameters
+        ----------
+        start: datetime.datetime | None
+            Beginning of the window (inclusive)
+            If None, starts from the first occurrence
+        end: datetime.datetime | None
+            End of the window (exclusive)
+            If None, runs until the last occurrence
+        """
+        for i in self._indices(start, end):
+            yield self.occurrence(i)
+
+    def collides_with(self, other: Event):
+        """
+        Checks if any occurrence overlaps in time with another event or with any occurrence of another recurring event.
+        Occurrences are never built; an event is checked in O(1) and another recurring event in O(1) if both share a period.
+
+        Parameters
+        ----------
+        other: Event
+            Another Event or RecurringEvent object
+        """
+        if not isinstance(other, RecurringEvent):
+            return len(self._indices(other.start_time, other.end_time)) > 0
+        # Only occurrences within the span of both events can overlap
+        if not (
+            self.start_time < other.last_end_time
+            and other.start_time < self.last_end_time
+        ):
+            return False
+        if self.period == other.period:
+            # Occurrence j + lag of this event starts gap before occurrence j of the other one
+            shift, offset = divmod(other.start_time - self.start_time, self.period)
+            for lag, gap in [(shift, offset), (shift + 1, offset - self.period)]:
+                if abs(gap) < DURATION and max(0, -lag) < min(
+                    other.count, self.count - lag
+                ):
+                    return True
+            return False
+        # Otherwise walk the starts of the event with the longer period within the span of the other one
+        sparse, dense = sorted([self, other], key=lambda event: event.period)[::-1]
+        for i in sparse._indices(dense.start_time, dense.last_end_time):
+            start = sparse.start_time + i * sparse.period
+            if dense._indices(start, start + DURATION):
+                return True
+        return False
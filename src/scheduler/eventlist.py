@@ -1,7 +1,17 @@
-from scheduler.event import Event
+import datetime
+from heapq import merge
+from scheduler.event import Event, RecurringEvent, DURATION
+from scheduler.index import (
+    IntervalIndex,
+    PartitionedIndex,
+    SeriesIndex,
+    HashIndex,
+    PrefixIndex,
+)
+from scheduler.utils import prepare_batch, free_slots, parse_object
 from scheduler.sort import sort_data, SortingAlgorithm
-from scheduler.search import search_data, SearchAlgorithm
-from scheduler.defaults import INITIAL_ID, INITIAL_CAPACITY
+from scheduler.search import search_data, SearchAlgorithm, is_batch
+from scheduler.defaults import INITIAL_ID, INITIAL_CAPACITY, GROWTH_FACTOR
 
 
 class EventList:
@@ -9,25 +19,57 @@ class EventList:
     An array-based list of events.
     """
 
-    def __init__(self, capacity: int = INITIAL_CAPACITY):
+    def __init__(
+        self,
+        capacity: int = INITIAL_CAPACITY,
+        growth_factor: float = GROWTH_FACTOR,
+        per_location: bool = False,
+    ):
         """
         Attributes
         ----------
         capacity: int
             Base size of the initialized static array
+        growth_factor: float
+            Factor by which the capacity is multiplied when the array is full
+        per_location: bool
+            If True, events only conflict with events in the same location, each location having its own start time index
         events: list
             List of events
         size: int
             The number of events in the event list
         """
+        if growth_factor <= 1:
+            raise ValueError(
+                f"Growth factor must be greater than 1, got {growth_factor}"
+            )
         # Initialize event ID counter
         self._id = INITIAL_ID
+        # Initialize geometric growth factor
+        self.growth_factor = growth_factor
         # Initialize maximum capacity
         self.capacity = capacity
         # Initialize array size
         self.size = 0
         # Create static array
         self.events = [None] * self.capacity
+        # Initialize start time index for conflict detection and range queries
+        self._index = IntervalIndex()
+        # Initialize start time indexes per location if conflicts are scoped to locations
+        self.per_location = per_location
+        self._locations = (
+            PartitionedIndex(attribute="location") if per_location else None
+        )
+        # Initialize recurring events, stored once each and expanded on demand
+        self._series = SeriesIndex(attribute="location" if per_location else None)
+        # Initialize hash indexes keyed by attribute name
+        self._indexes = {
+            "_id": HashIndex(attribute="_id"),
+            "key": HashIndex(attribute="key"),
+        }
+        # Initialize mutation counter and cache of sorted views
+        self._version = 0
+        self._views = {}
 
     def __iter__(self):
         for i in range(self.size):
@@ -41,14 +83,107 @@ class EventList:
 
     def __setitem__(self, index: int | slice, value: Event | list):
         # TODO: Maybe some conflict detection here?
-        if isinstance(index, (int, slice)):
+        if isinstance(index, int):
+            self._untrack(self.events[index])
+            self.events[index] = value
+            self._track(value)
+        elif isinstance(index, slice):
+            for event in self.events[index]:
+                self._untrack(event)
             self.events[index] = value
+            for event in value:
+                self._track(event)
         else:
             raise TypeError(f"Invalid index type {type(index)}")
 
     def __len__(self):
         return self.size
 
+    def _track(self, event: Event | None):
+        """
+        Adds an event to the list's indexes.
+
+        Parameters
+        ----------
+        event: Event | None
+            The event to be indexed
+            If None, nothing is indexed
+        """
+        if event is not None:
+            self._index.add(event)
+            if self._locations is not None:
+                self._locations.add(event)
+            for index in self._indexes.values():
+                index.add(event)
+            self._version += 1
+
+    def _untrack(self, event: Event | None):
+        """
+        Removes an event from the list's indexes.
+
+        Parameters
+        ----------
+        event: Event | None
+            The event to be removed from the indexes
+            If None, nothing is removed
+        """
+        if event is not None:
+            self._index.remove(event)
+            if self._locations is not None:
+                self._locations.remove(event)
+            for index in self._indexes.values():
+                index.remove(event)
+            self._version += 1
+
+    def _conflict_index(self) -> IntervalIndex | PartitionedIndex:
+        """
+        Gets the index new events are checked against for conflicts.
+
+        Returns
+        -------
+        The start time indexes per location if conflicts are scoped to locations, otherwise the start time index
+        """
+        return self._index if self._locations is None else self._locations
+
+    def _insert_series(self, event: RecurringEvent):
+        """
+        Stores a recurring event once, apart from the list, after checking every one of its occurrences for conflicts.
+        Occurrences are checked arithmetically against the events within the span of the recurring event, without being built.
+
+        Parameters
+        ----------
+        event: RecurringEvent
+            The recurring event to be stored
+        """
+        index = (
+            self._index
+            if self._locations is None
+            else self._locations.get(event.location)
+        )
+        events = index.overlapping(event.start_time, event.last_end_time)
+        if any(event.collides_with(other) for other in events) or (
+            self._series.collides_with(event)
+        ):
+            raise ValueError("Conflict detected, cannot insert event")
+        event.id = self._id
+        self._series.add(event)
+        self._version += 1
+        # Sequentially generate a new ID upon insertion
+        self._id += 1
+
+    def _permute(self, events: list):
+        """
+        Replaces the stored events with a reordering of the same events, as produced by sort_data.
+        The events stay in every index, so nothing is re-indexed.
+
+        Parameters
+        ----------
+        events: list
+            Every stored event, in their new order
+        """
+        self.events[: self.size] = events
+        self._version += 1
+
     def _resize(self, new_capacity: int):
         """
         Increases the capacity of the list.
@@ -58,12 +193,32 @@ class EventList:
         new_capacity: int
             The event list's new capacity
         """
-        new_data = [None] * new_capacity
-        for i in range(self.size):
-            new_data[i] = self.events[i]
-        self.events = new_data
+        # Pad the existing array in place rather than copying it element by element
+        self.events.extend([None] * (new_capacity - self.capacity))
         self.capacity = new_capacity
 
+    def add_index(self, attribute: str, prefix: bool = False):
+        """
+        Attaches a secondary index on an event attribute, kept up to date on insert, delete and setitem.
+        Hash searches on the attribute then look events up in O(1) instead of building an index on every call.
+
+        Parameters
+        ----------
+        attribute: str
+            The name of the event attribute to be indexed, such as location or title
+        prefix: bool
+            If True, indexes case-folded values in sorted order for prefix searches instead of exact values in a hash index
+        """
+        if attribute in self._indexes:
+            raise ValueError(f"Attribute {attribute} is already indexed")
+        if prefix:
+            index = PrefixIndex(attribute=attribute)
+        else:
+            index = HashIndex(attribute=attribute)
+        for event in self:
+            index.add(event)
+        self._indexes[attribute] = index
+
     def insert(self, event: Event, index: int = -1):
         """
         Insert an event at a specific index.
@@ -71,50 +226,109 @@ class EventList:
 
         Parameters
         ----------
-        event: Event
+        event: Event | RecurringEvent
             The event to be inserted
+            If a RecurringEvent, it is stored once apart from the list and index is ignored
         index: int
             The index at which the event will be inserted
         """
+        # Store recurring events apart from the list
+        if isinstance(event, RecurringEvent):
+            self._insert_series(event)
+            return
         # Assert type of event
         if not isinstance(event, Event):
             raise TypeError(f"Cannot insert event of type {type(event)}")
-        # Check if event overlaps with an existing event
-        has_conflict = False
-        for existing_event in self.events:
-            # Reached end of list
-            if existing_event is None:
-                break
-            # Calls collide_with function to check if new event collides with existing events
-            if event.collides_with(existing_event):
-                has_conflict = True
-                break
-        if has_conflict:
+        # Check if event overlaps with an existing event or with an occurrence of a recurring event
+        if self._conflict_index().collides_with(event) or (
+            self._series.collides_with(event)
+        ):
             raise ValueError("Conflict detected, cannot insert event")
 
         # Insert event if no conflict detected
         # Define index at end of list
         if index == -1:
             index = self.size
-        # Resize list if size reaches capacity
+        # Resize list geometrically if size reaches capacity
         if self.size == self.capacity:
-            self._resize(self.capacity + INITIAL_CAPACITY)
+            self._resize(
+                max(self.capacity + 1, int(self.capacity * self.growth_factor))
+            )
         # Validate index
         if index > self.size:
             raise IndexError(f"Index {index} is out of range")
         # Set event ID
         event.id = self._id
         # Add event to list
-        self.events = (
-            list(self.events[:index])
-            + [event]
-            + list(self.events[index : self.capacity])
-        )
+        if index == self.size:
+            self.events[index] = event
+        else:
+            # Shift the tail right in place, dropping one of the trailing empty slots
+            self.events.insert(index, event)
+            self.events.pop()
+        self._track(event)
         # Sequentially generate a new ID upon insertion
         self._id += 1
         # Increment size
         self.size += 1
 
+    def extend(self, events):
+        """
+        Bulk inserts events at the end of the list.
+        Events are sorted by date and time and receive sequential IDs in that order.
+        Recurring events are not accepted and must be inserted one at a time.
+
+        Parameters
+        ----------
+        events
+            An iterable of Event objects or of dictionaries of Event parameters
+        """
+        # Sort and check the whole batch before touching the list
+        events = prepare_batch(
+            records=events,
+            event_type=Event,
+            index=self._conflict_index(),
+            series=self._series,
+            excluded=(RecurringEvent,),
+        )
+        # Resize list once to fit the whole batch
+        if self.size + len(events) > self.capacity:
+            self._resize(
+                max(self.size + len(events), int(self.capacity * self.growth_factor))
+            )
+        for i, event in enumerate(events):
+            event.id = self._id + i
+        self.events[self.size : self.size + len(events)] = events
+        self._index.extend(events)
+        if self._locations is not None:
+            self._locations.extend(events)
+        for index in self._indexes.values():
+            for event in events:
+                index.add(event)
+        self._version += 1
+        self._id += len(events)
+        self.size += len(events)
+
+    @classmethod
+    def from_records(cls, records, **kwargs):
+        """
+        Creates an event list from a collection of events in a single bulk load.
+
+        Parameters
+        ----------
+        records
+            An iterable of Event objects or of dictionaries of Event parameters
+        kwargs
+            Additional parameters passed to the EventList constructor
+
+        Returns
+        -------
+        A new EventList containing the events sorted by date and time
+        """
+        event_list = cls(**kwargs)
+        event_list.extend(records)
+        return event_list
+
     def delete(self, index: int = -1, event: Event | None = None):
         """
         Remove an item fom the event list.
@@ -123,80 +337,232 @@ class EventList:
         ----------
         index: int
             The index at which to remove an event
-        event: Event | None
+        event: Event | RecurringEvent | None
             An event to be removed from the list
             If None, defaults to index-based deletion
         """
+        # Remove recurring events from where they are stored
+        if isinstance(event, RecurringEvent):
+            if self._series.remove(event) is not None:
+                self._version += 1
+            return
         # Delete at specific index
         if event is None:
             # Validate index
             if index + 1 > self.size:
                 raise IndexError(f"Index {index} is out of range")
-            if index == -1:
-                index = self.size
-                if self.size > 0:
-                    index -= 1
-            # Creates a list of indices to remove
-            remove_index = [index]
+            if index < 0:
+                index += self.size
+            # Shifts the tail left in place, while preserving array capacity
+            if 0 <= index < self.size:
+                self._untrack(self.events.pop(index))
+                self.events.append(None)
+                self.size -= 1
 
         # Delete by matching event attributes
         else:
-            # Creates a list of indices to remove
-            remove_index = [i for i in range(self.size) if self.events[i] == event]
+            # Look up matching events by their identity key
+            matches = self._indexes["key"].get(event.key)
+            if not matches:
+                return
+            targets = {id(match) for match in matches}
+            # Removes event(s) from list, while preserving array capacity
+            kept = []
+            for existing_event in self.events[: self.size]:
+                if id(existing_event) in targets:
+                    self._untrack(existing_event)
+                else:
+                    kept.append(existing_event)
+            self.events[: self.size] = kept
+            self.events.extend([None] * (self.size - len(kept)))
+            self.size = len(kept)
+
+    def overlapping(
+        self,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+    ):
+        """
+        Lazily yields the events and the occurrences of recurring events overlapping a time window, ordered by start time.
+        Stored events are found by bisecting the start time index and occurrences are built only as they are reached.
+
+        Parameters
+        ----------
+        start: datetime.datetime | None
+            Beginning of the window (inclusive)
+            If None, the window is unbounded on that side
+        end: datetime.datetime | None
+            End of the window (exclusive)
+            If None, the window is unbounded on that side
+        """
+        yield from merge(
+            self._index.overlapping(start, end),
+            self._series.overlapping(start, end),
+            key=lambda event: event.start_time,
+        )
+
+    def find_free_slots(
+        self,
+        after: datetime.datetime,
+        duration: datetime.timedelta = DURATION,
+        limit: int | None = 1,
+        location: str | None = None,
+    ) -> list:
+        """
+        Finds the earliest free time windows long enough to hold an event of a given duration.
+        Walks the start time index kept for conflict detection, so repeated queries never sort the events.
+        With per-location conflict detection, the windows of a single location can be found from its own index.
+
+        Parameters
+        ----------
+        after: datetime.datetime
+            The earliest time a window may start
+        duration: datetime.timedelta
+            The minimum length of a window, defaulting to the length of an event
+        limit: int | None
+            The maximum number of windows to return
+            If None, returns every window
+        location: str | None
+            The location whose events the windows are found between, requiring per-location conflict detection
+            If None, finds the windows between every event
 
-        # Removes event(s) from list, while preserving array capacity
-        if remove_index:
-            self.events = [
-                e for i, e in enumerate(self.events) if i not in remove_index
-            ] + [None] * len(set(remove_index))
-            self.size -= len(set(remove_index))
+        Returns
+        -------
+        List of (start_time, end_time) pairs of free windows in chronological order
+        The last window is open-ended, with an end time of None
+        """
+        if location is None:
+            index, series = self._index, self._series
+        elif self.per_location:
+            index, series = self._locations.get(location), self._series.get(location)
+        else:
+            raise ValueError(
+                f"Cannot find free slots in location {location} without per-location conflict detection"
+            )
+        if not series:
+            return index.free_slots(after=after, duration=duration, limit=limit)
+        # Walk the gaps between events and occurrences of recurring events alike
+        events = merge(
+            index.overlapping(after, None),
+            *(recurring_event.occurrences(after, None) for recurring_event in series),
+            key=lambda event: event.start_time,
+        )
+        intervals = ((event.start_time, event.end_time) for event in events)
+        return free_slots(
+            intervals=intervals, after=after, duration=duration, limit=limit
+        )
 
     def search_by_id(
-        self, id: int, algorithm: SearchAlgorithm = SearchAlgorithm.BINARY
-    ) -> Event:
+        self, id: int | list, algorithm: SearchAlgorithm = SearchAlgorithm.HASH
+    ) -> Event | RecurringEvent | dict:
         """
         Searches for an event using an ID.
 
         Parameters
         ----------
-        id: int
+        id: int | list
             The target ID to search for
+            If a list, set, frozenset, range or NumPy array of IDs, searches for all of them at once
         algorithm: SearchAlgorithm
             The SearchAlgorithm enumeration that determines which search algorithm to use
 
         Returns
         -------
-        The Event object that was found
+        The Event object that was found, or the RecurringEvent holding the ID
+        If searching for a collection of IDs, a dictionary mapping each ID to its Event object or None if not found
         """
-        # Sort data before performing binary search
-        if algorithm == SearchAlgorithm.BINARY:
-            self = sort_data(data=self, attribute="_id")
-        # Searches for ID in the list of events
-        found_event = search_data(data=self, target=id, algorithm=algorithm)
+        data = self
+        # Searches relying on sorted data run on a sorted copy so the order of the list is left untouched
+        # The copy is cached with the sorted views until the list changes, so repeated lookups only pay for the search
+        if algorithm in [
+            SearchAlgorithm.BINARY,
+            SearchAlgorithm.INTERPOLATION,
+            SearchAlgorithm.EXPONENTIAL,
+        ]:
+            # Unlike list_all views, it holds the stored events only, without occurrences of recurring events
+            version, data = self._views.get((None, "_id"), (None, None))
+            if version != self._version:
+                # IDs are mostly in insertion order already, which the natural merge sort handles in close to O(N)
+                data = tuple(
+                    sort_data(
+                        data=list(self),
+                        algorithm=SortingAlgorithm.NATURAL_MERGE,
+                        attribute="_id",
+                    )
+                )
+                self._views[(None, "_id")] = (self._version, data)
+        # Recurring events are stored apart from the list, so IDs missing from it are looked up among them
+        # Searches for a batch of IDs at once, mapping missing IDs to None
+        if is_batch(id):
+            found_events = search_data(data=data, target=id, algorithm=algorithm)
+            if self._series:
+                series = {event.id: event for event in self._series}
+                for target, found_event in found_events.items():
+                    if found_event is None:
+                        found_events[target] = series.get(target)
+            return found_events
+        found_event = search_data(data=data, target=id, algorithm=algorithm)
+        if found_event is None:
+            found_event = next(
+                (event for event in self._series if event.id == id), None
+            )
         if found_event is None:
             raise ValueError(f"Could not find ID {id} in event list")
         return found_event
 
-    def list_all(self, sort: bool | SortingAlgorithm = True) -> list:
+    def list_all(
+        self,
+        sort: bool | SortingAlgorithm = True,
+        attribute: str = "start_time",
+        readonly: bool = False,
+    ) -> list | tuple:
         """
         Displays all events in a list.
+        Sorted views are cached until the next insert, delete or setitem, so repeated calls only pay for a copy.
+        Views by start time are read from the start time index; views by any other attribute sort a copy of the list.
 
         Parameters
         ----------
         sort: bool | SortingAlgorithm
             Determines if returned list should be sorted by date and time
-            If True, defaults to using the quick sort algorithm
+            If True, defaults to using the natural merge sort algorithm
+            Ignored when sorting by start time
+        attribute: str
+            The name of the event attribute to sort by
+        readonly: bool
+            If True, returns the cached view itself as a tuple instead of copying it into a list
 
         Returns
         -------
-        List of all events
+        List of all events and occurrences of recurring events, or a tuple if readonly is True
         """
-        # Remove None values
-        eventlist = self.events[: self.size]
-
         # Determine sorting algorithm
         if sort is True:
-            sort = SortingAlgorithm.QUICK
-        if sort:
-            eventlist = sort_data(data=self, algorithm=sort).events[: self.size]
-        return eventlist
+            sort = SortingAlgorithm.NATURAL_MERGE
+        if not sort:
+            eventlist = self.events[: self.size] + list(self._series.overlapping())
+            return tuple(eventlist) if readonly else eventlist
+
+        # Sort the events only if the list changed since the last call
+        version, view = self._views.get((sort, attribute), (None, None))
+        if version != self._version:
+            if attribute == "start_time":
+                # The start time index and the occurrences of recurring events are already in start time order
+                events = self.overlapping()
+            else:
+                # Sort a copy so the order of the list and the other cached views are left untouched
+                events = sort_data(data=list(self), algorithm=sort, attribute=attribute)
+                if self._series:
+                    occurrences = sort_data(
+                        data=list(self._series.overlapping()),
+                        algorithm=sort,
+                        attribute=attribute,
+                    )
+                    events = merge(
+                        events,
+                        occurrences,
+                        key=lambda event: parse_object(event, attribute),
+                    )
+            view = tuple(events)
+            self._views[(sort, attribute)] = (self._version, view)
+        return view if readonly else list(view)
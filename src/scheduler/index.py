@@ -0,0 +1,641 @@
+# For use with type hints,,,
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scheduler.event import Event, RecurringEvent
+
+import datetime
+from heapq import merge
+from bisect import bisect_left, bisect_right
+from scheduler.utils import parse_object, free_slots
+
+
+class IntervalIndex:
+    """
+    An ordered index of events keyed by start time, used for fast conflict detection.
+    """
+
+    def __init__(self):
+        """
+        Attributes
+        ----------
+        starts: list
+            Sorted start times of every indexed event
+        events: list
+            Indexed events, in the same order as starts
+        max_duration: datetime.timedelta
+            The longest duration of any event added to the index
+        """
+        self.starts = []
+        self.events = []
+        # Bounds how far back an overlapping event can start
+        self.max_duration = datetime.timedelta(0)
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __len__(self):
+        return len(self.events)
+
+    def add(self, event: Event):
+        """
+        Adds an event to the index.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be indexed
+        """
+        i = bisect_right(self.starts, event.start_time)
+        self.starts.insert(i, event.start_time)
+        self.events.insert(i, event)
+        self.max_duration = max(self.max_duration, event.end_time - event.start_time)
+
+    def remove(self, event: Event):
+        """
+        Removes a single occurrence of an event from the index.
+        Events are matched by identity, so equal but distinct events are left untouched.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be removed
+        """
+        i = bisect_left(self.starts, event.start_time)
+        while i < len(self.starts) and self.starts[i] == event.start_time:
+            if self.events[i] is event:
+                del self.starts[i]
+                del self.events[i]
+                return
+            i += 1
+
+    def overlapping(
+        self, start: datetime.datetime | None, end: datetime.datetime | None
+    ):
+        """
+        Lazily yields the indexed events overlapping a time window, ordered by start time.
+
+        Parameters
+        ----------
+        start: datetime.datetime | None
+            Beginning of the window (inclusive)
+            If None, the window is unbounded on that side
+        end: datetime.datetime | None
+            End of the window (exclusive)
+            If None, the window is unbounded on that side
+        """
+        # Nothing starting at or before this point can still be running at start
+        low = (
+            0 if start is None else bisect_right(self.starts, start - self.max_duration)
+        )
+        high = len(self.starts) if end is None else bisect_left(self.starts, end)
+        for i in range(low, high):
+            event = self.events[i]
+            if start is None or event.end_time > start:
+                yield event
+
+    def free_slots(
+        self,
+        after: datetime.datetime,
+        duration: datetime.timedelta,
+        limit: int | None = None,
+    ) -> list:
+        """
+        Finds the free time windows between indexed events in O(log n) plus O(1) per event walked past.
+
+        Parameters
+        ----------
+        after: datetime.datetime
+            The earliest time a window may start
+        duration: datetime.timedelta
+            The minimum length of a window
+        limit: int | None
+            The maximum number of windows to return
+            If None, returns every window
+
+        Returns
+        -------
+        List of (start_time, end_time) pairs of free windows in chronological order, the last one ending with None
+        """
+        # Nothing starting at or before this point can still be running at after
+        low = bisect_right(self.starts, after - self.max_duration)
+        intervals = (
+            (self.events[i].start_time, self.events[i].end_time)
+            for i in range(low, len(self.events))
+        )
+        return free_slots(
+            intervals=intervals, after=after, duration=duration, limit=limit
+        )
+
+    def collides_with(self, event: Event) -> bool:
+        """
+        Checks if an event overlaps in time with any indexed event.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be checked
+
+        Returns
+        -------
+        True if a conflict was found, False otherwise
+        """
+        for other in self.overlapping(event.start_time, event.end_time):
+            if event.collides_with(other):
+                return True
+        return False
+
+    def find_conflicts(self, events: list) -> list:
+        """
+        Finds every event in a batch that overlaps with an indexed event or with another event of the batch.
+
+        Parameters
+        ----------
+        events: list
+            A batch of events sorted by start time
+
+        Returns
+        -------
+        Sorted positions within the batch of every conflicting event
+        """
+        conflicts = set()
+        for i, event in enumerate(events):
+            if self.collides_with(event):
+                conflicts.add(i)
+            # Sweep forward only while later events start before this one ends
+            j = i + 1
+            while j < len(events) and events[j].start_time < event.end_time:
+                if event.collides_with(events[j]):
+                    conflicts.update((i, j))
+                j += 1
+        return sorted(conflicts)
+
+    def extend(self, events: list):
+        """
+        Adds a batch of events to the index in a single merge.
+
+        Parameters
+        ----------
+        events: list
+            A batch of events sorted by start time
+        """
+        self.events = list(
+            merge(self.events, events, key=lambda event: event.start_time)
+        )
+        self.starts = [event.start_time for event in self.events]
+        for event in events:
+            self.max_duration = max(
+                self.max_duration, event.end_time - event.start_time
+            )
+
+
+class PartitionedIndex:
+    """
+    An index of events partitioned by the value of one of their attributes, such as location.
+    Each partition is an interval index, so conflicts are only detected between events sharing a value.
+    """
+
+    def __init__(self, attribute: str):
+        """
+        Attributes
+        ----------
+        attribute: str
+            The name of the attribute the events are partitioned by
+        partitions: dict
+            Mapping of each attribute value to the interval index of the events holding it
+        """
+        self.attribute = attribute
+        self.partitions = {}
+
+    def __iter__(self):
+        for partition in self.partitions.values():
+            yield from partition
+
+    def __len__(self):
+        return sum(len(partition) for partition in self.partitions.values())
+
+    def get(self, value) -> IntervalIndex:
+        """
+        Gets the interval index of the events holding an attribute value.
+
+        Parameters
+        ----------
+        value
+            The attribute value to look up
+
+        Returns
+        -------
+        The IntervalIndex of the partition, empty if no event holds the value
+        """
+        return self.partitions.get(value, IntervalIndex())
+
+    def add(self, event: Event):
+        """
+        Adds an event to the index of its partition.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be indexed
+        """
+        value = parse_object(event, self.attribute)
+        self.partitions.setdefault(value, IntervalIndex()).add(event)
+
+    def remove(self, event: Event):
+        """
+        Removes a single occurrence of an event from the index of its partition.
+        Events are matched by identity, so equal but distinct events are left untouched.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be removed
+        """
+        value = parse_object(event, self.attribute)
+        partition = self.partitions.get(value)
+        if partition is None:
+            return
+        partition.remove(event)
+        # Drop empty partitions so the index does not grow with every value ever seen
+        if not partition:
+            del self.partitions[value]
+
+    def collides_with(self, event: Event) -> bool:
+        """
+        Checks if an event overlaps in time with any indexed event of the same partition.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be checked
+
+        Returns
+        -------
+        True if a conflict was found, False otherwise
+        """
+        value = parse_object(event, self.attribute)
+        partition = self.partitions.get(value)
+        return partition is not None and partition.collides_with(event)
+
+    def _group(self, events: list) -> dict:
+        """
+        Groups the positions of a batch of events by partition.
+
+        Parameters
+        ----------
+        events: list
+            A batch of events
+
+        Returns
+        -------
+        Mapping of each attribute value to the positions of the events holding it, in batch order
+        """
+        groups = {}
+        for i, event in enumerate(events):
+            groups.setdefault(parse_object(event, self.attribute), []).append(i)
+        return groups
+
+    def find_conflicts(self, events: list) -> list:
+        """
+        Finds every event in a batch that overlaps with an indexed event or with another event of the batch in the same partition.
+
+        Parameters
+        ----------
+        events: list
+            A batch of events sorted by start time
+
+        Returns
+        -------
+        Sorted positions within the batch of every conflicting event
+        """
+        conflicts = []
+        for value, positions in self._group(events).items():
+            partition = self.get(value)
+            group = [events[i] for i in positions]
+            conflicts.extend(positions[i] for i in partition.find_conflicts(group))
+        return sorted(conflicts)
+
+    def extend(self, events: list):
+        """
+        Adds a batch of events to the indexes of their partitions, merging each partition once.
+
+        Parameters
+        ----------
+        events: list
+            A batch of events sorted by start time
+        """
+        for value, positions in self._group(events).items():
+            self.partitions.setdefault(value, IntervalIndex()).extend(
+                [events[i] for i in positions]
+            )
+
+
+class HashIndex:
+    """
+    An index of events grouped by the value of one of their attributes, used for constant-time lookups.
+    """
+
+    def __init__(self, attribute: str | None):
+        """
+        Attributes
+        ----------
+        attribute: str | None
+            The name of the attribute used as the index key
+            If None, uses each event itself as the key
+        buckets: dict
+            Mapping of each attribute value to the list of events holding it
+        """
+        self.attribute = attribute
+        self.buckets = {}
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.buckets.values())
+
+    def add(self, event: Event):
+        """
+        Adds an event to the index. Events without a value for the attribute are not indexed.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be indexed
+        """
+        value = parse_object(event, self.attribute)
+        if value is not None:
+            self.buckets.setdefault(value, []).append(event)
+
+    def remove(self, event: Event):
+        """
+        Removes a single occurrence of an event from the index.
+        Events are matched by identity, so equal but distinct events are left untouched.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be removed
+        """
+        value = parse_object(event, self.attribute)
+        bucket = self.buckets.get(value, [])
+        for i, indexed_event in enumerate(bucket):
+            if indexed_event is event:
+                del bucket[i]
+                if not bucket:
+                    del self.buckets[value]
+                return
+
+    def get(self, value) -> list:
+        """
+        Gets every indexed event holding an attribute value.
+
+        Parameters
+        ----------
+        value
+            The attribute value to look up
+
+        Returns
+        -------
+        List of matching events in the order they were indexed
+        """
+        return self.buckets.get(value, [])
+
+
+class PrefixIndex:
+    """
+    An index of events sorted by the normalized value of a string attribute, used for exact and prefix lookups.
+    """
+
+    def __init__(self, attribute: str, normalize=str.casefold):
+        """
+        Attributes
+        ----------
+        attribute: str
+            The name of the string attribute used as the index key
+        normalize
+            Function normalizing attribute values and looked up values before they are compared
+            Defaults to case folding, which makes lookups case-insensitive
+        keys: list
+            Sorted normalized values of every indexed event
+        events: list
+            Indexed events, in the same order as keys
+        """
+        self.attribute = attribute
+        self.normalize = normalize
+        self.keys = []
+        self.events = []
+
+    def __len__(self):
+        return len(self.events)
+
+    def add(self, event: Event):
+        """
+        Adds an event to the index. Events without a value for the attribute are not indexed.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be indexed
+        """
+        value = parse_object(event, self.attribute)
+        if value is not None:
+            key = self.normalize(value)
+            i = bisect_right(self.keys, key)
+            self.keys.insert(i, key)
+            self.events.insert(i, event)
+
+    def remove(self, event: Event):
+        """
+        Removes a single occurrence of an event from the index.
+        Events are matched by identity, so equal but distinct events are left untouched.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be removed
+        """
+        value = parse_object(event, self.attribute)
+        if value is None:
+            return
+        key = self.normalize(value)
+        i = bisect_left(self.keys, key)
+        while i < len(self.keys) and self.keys[i] == key:
+            if self.events[i] is event:
+                del self.keys[i]
+                del self.events[i]
+                return
+            i += 1
+
+    def get(self, value) -> list:
+        """
+        Gets every indexed event whose normalized attribute value matches a value.
+
+        Parameters
+        ----------
+        value
+            The attribute value to look up
+
+        Returns
+        -------
+        List of matching events in the order they were indexed
+        """
+        key = self.normalize(value)
+        return self.events[bisect_left(self.keys, key) : bisect_right(self.keys, key)]
+
+    def prefix(self, prefix: str) -> list:
+        """
+        Gets every indexed event whose normalized attribute value starts with a prefix, in O(log n) plus O(1) per match.
+
+        Parameters
+        ----------
+        prefix: str
+            The beginning of the attribute values to look up
+
+        Returns
+        -------
+        List of matching events sorted by normalized attribute value
+        """
+        prefix = self.normalize(prefix)
+        low = high = bisect_left(self.keys, prefix)
+        while high < len(self.keys) and self.keys[high].startswith(prefix):
+            high += 1
+        return self.events[low:high]
+
+
+class SeriesIndex:
+    """
+    An index of recurring events, each stored once however many times it occurs.
+    """
+
+    def __init__(self, attribute: str | None = None):
+        """
+        Attributes
+        ----------
+        attribute: str | None
+            The name of the attribute scoping conflicts, such as location
+            If None, every recurring event can conflict with any event
+        partitions: dict
+            Mapping of each attribute value to the list of recurring events holding it
+        """
+        self.attribute = attribute
+        self.partitions = {}
+
+    def __iter__(self):
+        for partition in self.partitions.values():
+            yield from partition
+
+    def __len__(self):
+        return sum(len(partition) for partition in self.partitions.values())
+
+    def _value(self, event: Event):
+        """
+        Gets the partition an event belongs to.
+        """
+        return None if self.attribute is None else parse_object(event, self.attribute)
+
+    def get(self, value) -> list:
+        """
+        Gets the recurring events holding an attribute value.
+
+        Parameters
+        ----------
+        value
+            The attribute value to look up
+
+        Returns
+        -------
+        List of the recurring events of the partition, empty if no recurring event holds the value
+        """
+        return self.partitions.get(value, [])
+
+    def add(self, event: RecurringEvent):
+        """
+        Adds a recurring event to the index.
+
+        Parameters
+        ----------
+        event: RecurringEvent
+            The recurring event to be indexed
+        """
+        self.partitions.setdefault(self._value(event), []).append(event)
+
+    def remove(self, event: RecurringEvent) -> RecurringEvent | None:
+        """
+        Removes the first indexed recurring event equal to an event.
+
+        Parameters
+        ----------
+        event: RecurringEvent
+            The recurring event to be removed
+
+        Returns
+        -------
+        The removed recurring event, or None if no indexed recurring event is equal to it
+        """
+        value = self._value(event)
+        partition = self.partitions.get(value, [])
+        for i, indexed_event in enumerate(partition):
+            if indexed_event.key == event.key:
+                del partition[i]
+                # Drop empty partitions so the index does not grow with every value ever seen
+                if not partition:
+                    del self.partitions[value]
+                return indexed_event
+        return None
+
+    def collides_with(self, event: Event) -> bool:
+        """
+        Checks if an event or recurring event overlaps in time with any occurrence of an indexed recurring event.
+        Each recurring event is checked arithmetically, without building its occurrences.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be checked
+
+        Returns
+        -------
+        True if a conflict was found, False otherwise
+        """
+        return any(
+            series.collides_with(event)
+            for series in self.partitions.get(self._value(event), [])
+        )
+
+    def find_conflicts(self, events: list) -> list:
+        """
+        Finds every event in a batch that overlaps with an occurrence of an indexed recurring event.
+
+        Parameters
+        ----------
+        events: list
+            A batch of events
+
+        Returns
+        -------
+        Sorted positions within the batch of every conflicting event
+        """
+        if not self.partitions:
+            return []
+        return [i for i, event in enumerate(events) if self.collides_with(event)]
+
+    def overlapping(
+        self,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+    ):
+        """
+        Lazily yields the occurrences of every indexed recurring event overlapping a time window, ordered by start time.
+
+        Parameters
+        ----------
+        start: datetime.datetime | None
+            Beginning of the window (inclusive)
+            If None, the window is unbounded on that side
+        end: datetime.datetime | None
+            End of the window (exclusive)
+            If None, the window is unbounded on that side
+        """
+        yield from merge(
+            *(series.occurrences(start, end) for series in self),
+            key=lambda event: event.start_time,
+        )
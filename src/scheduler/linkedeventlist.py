@@ -1,20 +1,37 @@
-from scheduler.event import EventNode
+import datetime
+from heapq import merge
+from scheduler.event import EventNode, RecurringEvent, DURATION
+from scheduler.index import (
+    IntervalIndex,
+    PartitionedIndex,
+    SeriesIndex,
+    HashIndex,
+    PrefixIndex,
+)
+from scheduler.utils import prepare_batch, free_slots, parse_object, get_attributes
 from scheduler.defaults import INITIAL_ID
 from scheduler.sort import sort_data, SortingAlgorithm
-from scheduler.search import SearchAlgorithm, search_data
+from scheduler.search import SearchAlgorithm, search_data, is_batch
 
 
 class LinkedEventList:
     """
-    A singly linked list of events.
+    A linked list of events, singly linked by default and optionally doubly linked.
     """
 
-    def __init__(self):
+    def __init__(self, doubly_linked: bool = False, per_location: bool = False):
         """
         Attributes
         ----------
+        doubly_linked: bool
+            If True, nodes also link to their previous node, so removing the last node
+            or a given node does not walk the list
+        per_location: bool
+            If True, events only conflict with events in the same location, each location having its own start time index
         head: EventNode | Node
             The first event in the linked list
+        tail: EventNode | Node
+            The last event in the linked list
         size: int
             The number of events in the event list
         """
@@ -22,8 +39,27 @@ class LinkedEventList:
         self._id = INITIAL_ID
         # Initialize array size
         self.size = 0
-        # Initialize first event in list
+        # Initialize first and last events in list
+        self.doubly_linked = doubly_linked
         self.head = None
+        self.tail = None
+        # Initialize start time index for conflict detection and range queries
+        self._index = IntervalIndex()
+        # Initialize start time indexes per location if conflicts are scoped to locations
+        self.per_location = per_location
+        self._locations = (
+            PartitionedIndex(attribute="location") if per_location else None
+        )
+        # Initialize recurring events, stored once each and expanded on demand
+        self._series = SeriesIndex(attribute="location" if per_location else None)
+        # Initialize hash indexes keyed by attribute name
+        self._indexes = {
+            "_id": HashIndex(attribute="_id"),
+            "key": HashIndex(attribute="key"),
+        }
+        # Initialize mutation counter and cache of sorted views
+        self._version = 0
+        self._views = {}
 
     def __iter__(self):
         node = self.head
@@ -31,65 +67,262 @@ class LinkedEventList:
             yield node
             node = node.next
 
+    def __reversed__(self):
+        if not self.doubly_linked:
+            yield from reversed(list(self))
+            return
+        node = self.tail
+        while node:
+            yield node
+            node = node.prev
+
     def __getitem__(self, index: int) -> EventNode:
         if isinstance(index, int):
-            # Validate index
-            if index < 0:
-                index += self.size
-            if index < 0 or index >= self.size:
-                raise IndexError(f"Index {index} is out of range")
-            # Get node
-            node = self.head
-            for _ in range(index):
-                node = node.next
-            return node.copy()
+            return self._node(self._validate(index)).copy()
         else:
             raise TypeError(f"Invalid index type {type(index)}")
 
     def __setitem__(self, index: int, value: EventNode):
         # TODO: Maybe some conflict detection here?
         if isinstance(index, int):
-            # Validate index
-            if index < 0:
-                index += self.size
-            if index < 0 or index >= self.size:
-                raise IndexError(f"Index {index} is out of range")
-            # Set node
-            node = self.head
-            for _ in range(index):
-                node = node.next
-            for k, v in vars(value).items():
-                if k not in ["next"]:
+            node = self._node(self._validate(index))
+            self._untrack(node)
+            attributes = get_attributes(value)
+            for k, v in attributes.items():
+                if k not in ["next", "prev"]:
                     setattr(node, k, v)
-            if "_id" not in vars(value):
+            if "_id" not in attributes and hasattr(node, "_id"):
                 delattr(node, "_id")
+            self._track(node)
         else:
             raise TypeError(f"Invalid index type {type(index)}")
 
     def __len__(self):
         return self.size
 
+    def _validate(self, index: int) -> int:
+        """
+        Validates an index, converting negative indices to positive ones.
+
+        Parameters
+        ----------
+        index: int
+            The index to be validated
+
+        Returns
+        -------
+        The equivalent non-negative index
+        """
+        if index < 0:
+            index += self.size
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Index {index} is out of range")
+        return index
+
+    def _node(self, index: int) -> EventNode:
+        """
+        Gets the node at an index, walking back from the tail if the list is doubly linked and that is shorter.
+
+        Parameters
+        ----------
+        index: int
+            A valid, non-negative index
+
+        Returns
+        -------
+        The EventNode at the index
+        """
+        if index == self.size - 1:
+            return self.tail
+        if self.doubly_linked and index > self.size // 2:
+            node = self.tail
+            for _ in range(self.size - 1 - index):
+                node = node.prev
+            return node
+        node = self.head
+        for _ in range(index):
+            node = node.next
+        return node
+
+    def _track(self, event: EventNode):
+        """
+        Adds an event to the list's indexes.
+
+        Parameters
+        ----------
+        event: EventNode
+            The event to be indexed
+        """
+        self._index.add(event)
+        if self._locations is not None:
+            self._locations.add(event)
+        for index in self._indexes.values():
+            index.add(event)
+        self._version += 1
+
+    def _untrack(self, event: EventNode):
+        """
+        Removes an event from the list's indexes.
+
+        Parameters
+        ----------
+        event: EventNode
+            The event to be removed from the indexes
+        """
+        self._index.remove(event)
+        if self._locations is not None:
+            self._locations.remove(event)
+        for index in self._indexes.values():
+            index.remove(event)
+        self._version += 1
+
+    def _conflict_index(self) -> IntervalIndex | PartitionedIndex:
+        """
+        Gets the index new events are checked against for conflicts.
+
+        Returns
+        -------
+        The start time indexes per location if conflicts are scoped to locations, otherwise the start time index
+        """
+        return self._index if self._locations is None else self._locations
+
+    def _insert_series(self, event: RecurringEvent):
+        """
+        Stores a recurring event once, apart from the list, after checking every one of its occurrences for conflicts.
+        Occurrences are checked arithmetically against the events within the span of the recurring event, without being built.
+
+        Parameters
+        ----------
+        event: RecurringEvent
+            The recurring event to be stored
+        """
+        index = (
+            self._index
+            if self._locations is None
+            else self._locations.get(event.location)
+        )
+        events = index.overlapping(event.start_time, event.last_end_time)
+        if any(event.collides_with(other) for other in events) or (
+            self._series.collides_with(event)
+        ):
+            raise ValueError("Conflict detected, cannot insert event")
+        event.id = self._id
+        self._series.add(event)
+        self._version += 1
+        # Sequentially generate a new ID upon insertion
+        self._id += 1
+
+    def _link(self, event: EventNode, previous_node: EventNode | None):
+        """
+        Links an event into the list right after a node.
+
+        Parameters
+        ----------
+        event: EventNode
+            The event to be linked
+        previous_node: EventNode | None
+            The node the event will follow
+            If None, the event becomes the head of the list
+        """
+        next_node = self.head if previous_node is None else previous_node.next
+        event.next = next_node
+        event.prev = previous_node if self.doubly_linked else None
+        if previous_node is None:
+            self.head = event
+        else:
+            previous_node.next = event
+        if next_node is None:
+            self.tail = event
+        elif self.doubly_linked:
+            next_node.prev = event
+
+    def _unlink(self, node: EventNode, previous_node: EventNode | None):
+        """
+        Unlinks a node from the list.
+
+        Parameters
+        ----------
+        node: EventNode
+            The node to be unlinked
+        previous_node: EventNode | None
+            The node right before it
+            If None, the node is the head of the list
+        """
+        if previous_node is None:
+            self.head = node.next
+        else:
+            previous_node.next = node.next
+        if node.next is None:
+            self.tail = previous_node
+        elif self.doubly_linked:
+            node.next.prev = previous_node
+        node.next = node.prev = None
+
+    def _relink(self, head: EventNode | None):
+        """
+        Replaces the chain of nodes with a reordering of the same nodes, as produced by linked_merge_sort.
+
+        Parameters
+        ----------
+        head: EventNode | None
+            The first node of the reordered chain
+        """
+        self.head = head
+        self.tail = None
+        node = head
+        while node is not None:
+            node.prev = self.tail if self.doubly_linked else None
+            self.tail = node
+            node = node.next
+        self._version += 1
+
+    def add_index(self, attribute: str, prefix: bool = False):
+        """
+        Attaches a secondary index on an event attribute, kept up to date on insert, delete and setitem.
+        Hash searches on the attribute then look events up in O(1) instead of building an index on every call.
+
+        Parameters
+        ----------
+        attribute: str
+            The name of the event attribute to be indexed, such as location or title
+        prefix: bool
+            If True, indexes case-folded values in sorted order for prefix searches instead of exact values in a hash index
+        """
+        if attribute in self._indexes:
+            raise ValueError(f"Attribute {attribute} is already indexed")
+        if prefix:
+            index = PrefixIndex(attribute=attribute)
+        else:
+            index = HashIndex(attribute=attribute)
+        for event in self:
+            index.add(event)
+        self._indexes[attribute] = index
+
     def insert(self, event: EventNode, index: int = -1):
         """
         Insert an event at a specific index.
-        Defaults to appending an event at the end of the list.
+        Defaults to appending an event at the end of the list, which does not walk the list.
 
         Parameters
         ----------
-        event: EventNode
+        event: EventNode | RecurringEvent
             The event to be inserted
+            If a RecurringEvent, it is stored once apart from the list and index is ignored
         index: int
             The index at which the event will be inserted
         """
+        # Store recurring events apart from the list
+        if isinstance(event, RecurringEvent):
+            self._insert_series(event)
+            return
         # Assert type of event
         if not isinstance(event, EventNode):
             raise TypeError(f"Cannot insert event of type {type(event)}")
-        # Check if event overlaps with an existing event
-        node = self.head
-        while node:
-            if event.collides_with(node):
-                raise ValueError("Conflict detected, cannot insert event")
-            node = node.next
+        # Check if event overlaps with an existing event or with an occurrence of a recurring event
+        if self._conflict_index().collides_with(event) or (
+            self._series.collides_with(event)
+        ):
+            raise ValueError("Conflict detected, cannot insert event")
 
         # Insert event if no conflict detected
         # Set event ID
@@ -102,131 +335,313 @@ class LinkedEventList:
         if index > self.size:
             raise IndexError(f"Index {index} is out of range")
 
-        # Iterate through linked list to insert index
-        node = self.head
-        if node is None or index == 0:
-            event.next = self.head
-            self.head = event
-        else:
-            node = self.head
-            for _ in range(index - 1):
-                node = node.next
-            event.next = node.next
-            node.next = event
+        # Link the event after the node preceding the insert index
+        self._link(event, self._node(index - 1) if index > 0 else None)
+        self._track(event)
 
         # Sequentially generate a new ID upon insertion
         self._id += 1
         # Increment size
         self.size += 1
 
+    def extend(self, events):
+        """
+        Bulk inserts events at the end of the list.
+        Events are sorted by date and time and receive sequential IDs in that order.
+
+        Parameters
+        ----------
+        events
+            An iterable of EventNode objects or of dictionaries of EventNode parameters
+        """
+        # Sort and check the whole batch before touching the list
+        events = prepare_batch(
+            records=events,
+            event_type=EventNode,
+            index=self._conflict_index(),
+            series=self._series,
+        )
+        if not events:
+            return
+        # Link the batch to the end of the list
+        for i, event in enumerate(events):
+            event.id = self._id + i
+            self._link(event, self.tail)
+        self._index.extend(events)
+        if self._locations is not None:
+            self._locations.extend(events)
+        for index in self._indexes.values():
+            for event in events:
+                index.add(event)
+        self._version += 1
+        self._id += len(events)
+        self.size += len(events)
+
+    @classmethod
+    def from_records(cls, records, **kwargs):
+        """
+        Creates a linked event list from a collection of events in a single bulk load.
+
+        Parameters
+        ----------
+        records
+            An iterable of EventNode objects or of dictionaries of EventNode parameters
+        kwargs
+            Additional parameters passed to the LinkedEventList constructor
+
+        Returns
+        -------
+        A new LinkedEventList containing the events sorted by date and time
+        """
+        event_list = cls(**kwargs)
+        event_list.extend(records)
+        return event_list
+
     def delete(self, index: int = -1, event: EventNode | None = None):
         """
         Remove an item fom the event list.
+        If the list is doubly linked, removing the last node or a node stored in the list does not walk the list.
 
         Parameters
         ----------
         index: int
             The index at which to remove an event
-        event: EventNode | None
+        event: EventNode | RecurringEvent | None
             An event to be removed from the list
             If None, defaults to index-based deletion
         """
+        # Remove recurring events from where they are stored
+        if isinstance(event, RecurringEvent):
+            if self._series.remove(event) is not None:
+                self._version += 1
+            return
         # Deal with empty list
         if self.head is None:
             raise IndexError("Trying to delete from empty list")
         # Delete at specific index
         if event is None:
-            # Validate index
-            if index < 0:
-                index += self.size
-            if index < 0 or index >= self.size:
-                raise IndexError(f"Index {index} is out of range")
-
-            # Remove node at specific index
-            if index == 0:
-                self.head = self.head.next
+            index = self._validate(index)
+            if self.doubly_linked:
+                node = self._node(index)
+                previous_node = node.prev
             else:
+                previous_node = self._node(index - 1) if index > 0 else None
+                node = self.head if previous_node is None else previous_node.next
+
+        # Delete by matching event attributes
+        else:
+            # Look up matching events by their identity key
+            matches = self._indexes["key"].get(event.key)
+            if not matches:
+                return
+            if self.doubly_linked and (
+                len(matches) == 1 or any(match is event for match in matches)
+            ):
+                # The node to remove is known, so unlink it directly
+                node = event if len(matches) > 1 else matches[0]
+                previous_node = node.prev
+            else:
+                # Remove the first matching node in the list
+                targets = {id(match) for match in matches}
                 node = self.head
-                prev_node = None
-                if node is not None:
-                    for _ in range(index):
-                        prev_node = node
-                        node = node.next
-                    prev_node.next = node.next
+                previous_node = None
+                while node is not None and id(node) not in targets:
+                    previous_node = node
+                    node = node.next
+                if node is None:
+                    return
 
-            # Decrease size of list
-            self.size -= 1
+        self._unlink(node, previous_node)
+        self._untrack(node)
+        # Decrease size of list
+        self.size -= 1
 
-        # Delete by matching event attributes
+    def overlapping(
+        self,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+    ):
+        """
+        Lazily yields the events and the occurrences of recurring events overlapping a time window, ordered by start time.
+        Stored events are found by bisecting the start time index and occurrences are built only as they are reached.
+
+        Parameters
+        ----------
+        start: datetime.datetime | None
+            Beginning of the window (inclusive)
+            If None, the window is unbounded on that side
+        end: datetime.datetime | None
+            End of the window (exclusive)
+            If None, the window is unbounded on that side
+        """
+        yield from merge(
+            self._index.overlapping(start, end),
+            self._series.overlapping(start, end),
+            key=lambda event: event.start_time,
+        )
+
+    def find_free_slots(
+        self,
+        after: datetime.datetime,
+        duration: datetime.timedelta = DURATION,
+        limit: int | None = 1,
+        location: str | None = None,
+    ) -> list:
+        """
+        Finds the earliest free time windows long enough to hold an event of a given duration.
+        Walks the start time index kept for conflict detection, so repeated queries never sort the events.
+        With per-location conflict detection, the windows of a single location can be found from its own index.
+
+        Parameters
+        ----------
+        after: datetime.datetime
+            The earliest time a window may start
+        duration: datetime.timedelta
+            The minimum length of a window, defaulting to the length of an event
+        limit: int | None
+            The maximum number of windows to return
+            If None, returns every window
+        location: str | None
+            The location whose events the windows are found between, requiring per-location conflict detection
+            If None, finds the windows between every event
+
+        Returns
+        -------
+        List of (start_time, end_time) pairs of free windows in chronological order
+        The last window is open-ended, with an end time of None
+        """
+        if location is None:
+            index, series = self._index, self._series
+        elif self.per_location:
+            index, series = self._locations.get(location), self._series.get(location)
         else:
-            node = self.head
-            prev_node = None
-            while node:
-                if node == event:
-                    if prev_node is None:
-                        self.head = node.next
-                        # Decrease size of list
-                        self.size -= 1
-                        break
-                    else:
-                        prev_node.next = node.next
-                        # Decrease size of list
-                        self.size -= 1
-                        break
-                prev_node = node
-                node = node.next
+            raise ValueError(
+                f"Cannot find free slots in location {location} without per-location conflict detection"
+            )
+        if not series:
+            return index.free_slots(after=after, duration=duration, limit=limit)
+        # Walk the gaps between events and occurrences of recurring events alike
+        events = merge(
+            index.overlapping(after, None),
+            *(recurring_event.occurrences(after, None) for recurring_event in series),
+            key=lambda event: event.start_time,
+        )
+        intervals = ((event.start_time, event.end_time) for event in events)
+        return free_slots(
+            intervals=intervals, after=after, duration=duration, limit=limit
+        )
 
     def search_by_id(
-        self, id: int, algorithm: SearchAlgorithm = SearchAlgorithm.BINARY
-    ) -> EventNode:
+        self, id: int | list, algorithm: SearchAlgorithm = SearchAlgorithm.HASH
+    ) -> EventNode | RecurringEvent | dict:
         """
         Searches for an event using an ID.
 
         Parameters
         ----------
-        id: int
+        id: int | list
             The target ID to search for
+            If a list, set, frozenset, range or NumPy array of IDs, searches for all of them at once
         algorithm: SearchAlgorithm
             The SearchAlgorithm enumeration that determines which search algorithm to use
 
         Returns
         -------
-        The EventNode object that was found
+        The EventNode object that was found, or the RecurringEvent holding the ID
+        If searching for a collection of IDs, a dictionary mapping each ID to its EventNode object or None if not found
         """
-        # Sort data before performing binary search
-        if algorithm == SearchAlgorithm.BINARY:
-            self = sort_data(data=self, attribute="_id")
-        found_event = search_data(data=self, target=id, algorithm=algorithm)
+        data = self
+        # Searches relying on sorted data run on a sorted copy so the order of the list is left untouched
+        # The copy is cached with the sorted views until the list changes, so repeated lookups only pay for the search
+        if algorithm in [
+            SearchAlgorithm.BINARY,
+            SearchAlgorithm.INTERPOLATION,
+            SearchAlgorithm.EXPONENTIAL,
+        ]:
+            # Unlike list_all views, it holds the stored events only, without occurrences of recurring events
+            version, data = self._views.get((None, "_id"), (None, None))
+            if version != self._version:
+                # IDs are mostly in insertion order already, which the natural merge sort handles in close to O(N)
+                data = tuple(
+                    sort_data(
+                        data=list(self),
+                        algorithm=SortingAlgorithm.NATURAL_MERGE,
+                        attribute="_id",
+                    )
+                )
+                self._views[(None, "_id")] = (self._version, data)
+        # Recurring events are stored apart from the list, so IDs missing from it are looked up among them
+        # Searches for a batch of IDs at once, mapping missing IDs to None
+        if is_batch(id):
+            found_events = search_data(data=data, target=id, algorithm=algorithm)
+            if self._series:
+                series = {event.id: event for event in self._series}
+                for target, found_event in found_events.items():
+                    if found_event is None:
+                        found_events[target] = series.get(target)
+            return found_events
+        found_event = search_data(data=data, target=id, algorithm=algorithm)
+        if found_event is None:
+            found_event = next(
+                (event for event in self._series if event.id == id), None
+            )
         if found_event is None:
             raise ValueError(f"Could not find ID {id} in event list")
         return found_event
 
-    def list_all(self, sort: bool | SortingAlgorithm = True) -> list:
+    def list_all(
+        self,
+        sort: bool | SortingAlgorithm = True,
+        attribute: str = "start_time",
+        readonly: bool = False,
+    ) -> list | tuple:
         """
         Displays all events in a list.
+        Sorted views are cached until the next insert, delete or setitem, so repeated calls only pay for a copy.
+        Views by start time are read from the start time index; views by any other attribute sort a copy of the list.
 
         Parameters
         ----------
         sort: bool | SortingAlgorithm
             Determines if returned list should be sorted by date and time
-            If True, defaults to using the quick sort algorithm
+            If True, defaults to using the natural merge sort algorithm
+            Ignored when sorting by start time
+        attribute: str
+            The name of the event attribute to sort by
+        readonly: bool
+            If True, returns the cached view itself as a tuple instead of copying it into a list
 
         Returns
         -------
-        List of all events
+        List of all events and occurrences of recurring events, or a tuple if readonly is True
         """
-        # Initialize an empty list
-        eventlist = []
-
         # Determine sorting algorithm
         if sort is True:
-            sort = SortingAlgorithm.QUICK
-        if sort:
-            node = sort_data(data=self, algorithm=sort).head
-        else:
-            node = self.head
-        # Construct list
-        while node:
-            eventlist.append(node)
-            node = node.next
-        return eventlist
+            sort = SortingAlgorithm.NATURAL_MERGE
+        if not sort:
+            eventlist = list(self) + list(self._series.overlapping())
+            return tuple(eventlist) if readonly else eventlist
+
+        # Sort the events only if the list changed since the last call
+        version, view = self._views.get((sort, attribute), (None, None))
+        if version != self._version:
+            if attribute == "start_time":
+                # The start time index and the occurrences of recurring events are already in start time order
+                events = self.overlapping()
+            else:
+                # Sort a copy so the order of the list and the other cached views are left untouched
+                events = sort_data(data=list(self), algorithm=sort, attribute=attribute)
+                if self._series:
+                    occurrences = sort_data(
+                        data=list(self._series.overlapping()),
+                        algorithm=sort,
+                        attribute=attribute,
+                    )
+                    events = merge(
+                        events,
+                        occurrences,
+                        key=lambda event: parse_object(event, attribute),
+                    )
+            view = tuple(events)
+            self._views[(sort, attribute)] = (self._version, view)
+        return view if readonly else list(view)
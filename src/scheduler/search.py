@@ -6,8 +6,12 @@ if TYPE_CHECKING:
     from scheduler.eventlist import EventList
     from scheduler.linkedeventlist import LinkedEventList
 
+import datetime
+import numpy as np
 from enum import Enum, member
 from scheduler.utils import parse_object
+from scheduler.index import IntervalIndex, HashIndex, PrefixIndex
+from scheduler.sort import sort_data, SortingAlgorithm
 from scheduler.event import Event, EventNode
 
 
@@ -75,9 +79,342 @@ def binary_search(data, target, attribute: str | None = None):
     return None
 
 
+def interpolation_search(data, target, attribute: str | None = None):
+    """
+    Searches through an iterable for an item matching the target by estimating its position from the values at the ends of the range.
+    Takes O(log log n) steps on evenly spread values such as sequential IDs.
+    NOTE: This algorithm assumes that data is already sorted and that its values support subtraction, like numbers and datetimes.
+
+    Parameters
+    ----------
+    data
+        An iterable object
+    target
+        Any item to match with an item of data
+    attribute: str | None
+        The name of the attribute to parse in each item of the iterable to be matched with the target
+        If None, matches each item
+
+    Returns
+    -------
+    The found item or None if not found
+    """
+    # Initialize min and max indices
+    low = 0
+    high = len(data) - 1
+    while low <= high:
+        low_value = parse_object(data[low], attribute)
+        high_value = parse_object(data[high], attribute)
+        # The target cannot be outside of the range
+        if target < low_value or high_value < target:
+            return None
+        if low_value == high_value:
+            return data[low] if low_value == target else None
+        # Estimate the index assuming values are evenly spread
+        mid = low + int(
+            (high - low) * ((target - low_value) / (high_value - low_value))
+        )
+        datum = data[mid]
+        # If target is found, return the item
+        if parse_object(datum, attribute) == target:
+            return datum
+        # Keep narrowing the range
+        elif parse_object(datum, attribute) < target:
+            low = mid + 1
+        else:
+            high = mid - 1
+    return None
+
+
+def exponential_search(data, target, attribute: str | None = None):
+    """
+    Searches through an iterable for an item matching the target by doubling a bound from the front, then binary searching below it.
+    Takes O(log i) steps for a target at index i, so targets near the front are found fastest.
+    NOTE: This algorithm assumes that data is already sorted, in either ascending or descending order.
+
+    Parameters
+    ----------
+    data
+        An iterable object
+    target
+        Any item to match with an item of data
+    attribute: str | None
+        The name of the attribute to parse in each item of the iterable to be matched with the target
+        If None, matches each item
+
+    Returns
+    -------
+    The found item or None if not found
+    """
+    if len(data) == 0:
+        return None
+    # Data sorted in descending order, such as most recent events first, is searched from the front too
+    descending = parse_object(data[len(data) - 1], attribute) < parse_object(
+        data[0], attribute
+    )
+
+    def _before(value):
+        """
+        Check if a value comes before the target in the order of the data.
+        """
+        return target < value if descending else value < target
+
+    # Double the bound until it passes the target
+    bound = 1
+    while bound < len(data) and _before(parse_object(data[bound], attribute)):
+        bound *= 2
+
+    # Binary search between the last two bounds
+    low = bound // 2
+    high = min(bound, len(data) - 1)
+    while low <= high:
+        mid = (low + high) // 2
+        datum = data[mid]
+        if parse_object(datum, attribute) == target:
+            return datum
+        elif _before(parse_object(datum, attribute)):
+            low = mid + 1
+        else:
+            high = mid - 1
+    return None
+
+
+def _get_index(data, attribute: str | None, index_type: type):
+    """
+    Gets the index an event list maintains on an attribute, or builds one on the fly in O(n).
+
+    Parameters
+    ----------
+    data
+        An iterable object
+    attribute: str | None
+        The name of the indexed attribute
+    index_type: type
+        The type of index needed, either HashIndex or PrefixIndex
+
+    Returns
+    -------
+    An index of the data on the attribute
+    """
+    index = getattr(data, "_indexes", {}).get(attribute)
+    if not isinstance(index, index_type):
+        index = index_type(attribute=attribute)
+        for datum in data:
+            index.add(datum)
+    return index
+
+
+def hash_search(data, target, attribute: str | None = None):
+    """
+    Searches through an iterable for an item matching the target using a hash index.
+    Event lists maintain their own index on IDs, and on any attribute given to add_index, which makes lookups O(1).
+    For any other iterable or attribute, an index is built on the fly in O(n).
+
+    Parameters
+    ----------
+    data
+        An iterable object
+    target
+        Any item to match with an item of data
+    attribute: str | None
+        The name of the attribute to parse in each item of the iterable to be matched with the target
+        If None, matches each item
+
+    Returns
+    -------
+    The found item or None if not found
+    """
+    matches = _get_index(data, attribute, HashIndex).get(target)
+    return matches[0] if matches else None
+
+
+def prefix_search(data, target: str, attribute: str | None = None):
+    """
+    Searches through an iterable for an item whose attribute starts with the target, ignoring case.
+    Event lists given a prefix index with add_index are searched in O(log n).
+    For any other iterable or attribute, an index is built on the fly in O(n log n).
+
+    Parameters
+    ----------
+    data
+        An iterable object
+    target: str
+        The beginning of the string to match with an item of data
+    attribute: str | None
+        The name of the string attribute to parse in each item of the iterable to be matched with the target
+        If None, matches each item
+
+    Returns
+    -------
+    The found item with the alphabetically first matching attribute, or None if not found
+    """
+    matches = _get_index(data, attribute, PrefixIndex).prefix(target)
+    return matches[0] if matches else None
+
+
+def match_all(data, target, attribute: str | None = None) -> list:
+    """
+    Searches through an iterable for every item matching the target using a hash index, such as all events in a location.
+
+    Parameters
+    ----------
+    data
+        An iterable object
+    target
+        Any item to match with items of data
+    attribute: str | None
+        The name of the attribute to parse in each item of the iterable to be matched with the target
+        If None, matches each item
+
+    Returns
+    -------
+    List of the found items in the order they were indexed
+    """
+    return list(_get_index(data, attribute, HashIndex).get(target))
+
+
+def match_prefix(data, target: str, attribute: str | None = None) -> list:
+    """
+    Searches through an iterable for every item whose attribute starts with the target, ignoring case,
+    such as all events with a title starting with 'Career'.
+
+    Parameters
+    ----------
+    data
+        An iterable object
+    target: str
+        The beginning of the string to match with items of data
+    attribute: str | None
+        The name of the string attribute to parse in each item of the iterable to be matched with the target
+        If None, matches each item
+
+    Returns
+    -------
+    List of the found items sorted by their attribute, ignoring case
+    """
+    return _get_index(data, attribute, PrefixIndex).prefix(target)
+
+
 class SearchAlgorithm(Enum):
     LINEAR = member(linear_search)
     BINARY = member(binary_search)
+    HASH = member(hash_search)
+    INTERPOLATION = member(interpolation_search)
+    EXPONENTIAL = member(exponential_search)
+    PREFIX = member(prefix_search)
+
+
+def is_batch(target) -> bool:
+    """
+    Checks if a search target is a collection of targets rather than a single target.
+    Tuples are single targets, since they are used as keys such as Event.key.
+
+    Parameters
+    ----------
+    target
+        A search target
+
+    Returns
+    -------
+    True if the target is a list, set, frozenset, range or NumPy array, False otherwise
+    """
+    return isinstance(target, (list, set, frozenset, range, np.ndarray))
+
+
+def _search_batch(data, targets, algorithm: SearchAlgorithm, attribute: str | None):
+    """
+    Searches for every target of a batch in a single pass over the data.
+
+    Parameters
+    ----------
+    data
+        An iterable object
+    targets
+        A list, set, frozenset, range or NumPy array of targets
+    algorithm: SearchAlgorithm
+        Enumeration value for a search algorithm
+        Linear, hash and prefix searches do not need sorted data, every other algorithm does
+    attribute: str | None
+        The name of the attribute to parse in each item of the iterable to be matched with the targets
+        If None, matches each item
+
+    Returns
+    -------
+    Dictionary mapping each target to its found item, or to None if not found
+    """
+    values = targets.tolist() if isinstance(targets, np.ndarray) else list(targets)
+    results = dict.fromkeys(values)
+    if not results:
+        return results
+
+    # Look up every target in a single hash or prefix index
+    if algorithm in [SearchAlgorithm.HASH, SearchAlgorithm.PREFIX]:
+        if algorithm == SearchAlgorithm.HASH:
+            lookup = _get_index(data, attribute, HashIndex).get
+        else:
+            lookup = _get_index(data, attribute, PrefixIndex).prefix
+        for target in results:
+            matches = lookup(target)
+            results[target] = matches[0] if matches else None
+        return results
+
+    # Scan unsorted data once, keeping the first match of each target
+    if algorithm == SearchAlgorithm.LINEAR:
+        remaining = len(results)
+        for datum in data:
+            value = parse_object(datum, attribute)
+            if value in results and results[value] is None:
+                results[value] = datum
+                remaining -= 1
+                if remaining == 0:
+                    break
+        return results
+
+    items = list(data)
+    # Data sorted in descending order, such as most recent events first, is detected like a single search
+    descending = len(items) > 1 and parse_object(items[-1], attribute) < parse_object(
+        items[0], attribute
+    )
+
+    # Bisect the sorted keys for every target at once if the targets come as an array
+    if isinstance(targets, np.ndarray):
+        keys = np.array([parse_object(item, attribute) for item in items])
+        targets = np.unique(targets)
+        if descending:
+            # Bisect the reversed keys from the right to find the first match in the original order
+            positions = np.searchsorted(keys[::-1], targets, side="right")
+            positions = len(items) - positions
+        else:
+            positions = np.searchsorted(keys, targets)
+        for target, position in zip(targets.tolist(), positions.tolist()):
+            if position < len(items) and keys[position] == target:
+                results[target] = items[position]
+        return results
+
+    # Merge-join the sorted targets against the sorted data, in the order of the data
+    targets = sort_data(
+        data=list(results), algorithm=SortingAlgorithm.NATURAL_MERGE, attribute=None
+    )
+    if descending:
+        targets.reverse()
+
+    def _before(value, target):
+        """
+        Check if a value comes before a target in the order of the data.
+        """
+        return target < value if descending else value < target
+
+    i = j = 0
+    while i < len(items) and j < len(targets):
+        value = parse_object(items[i], attribute)
+        if _before(value, targets[j]):
+            i += 1
+        elif _before(targets[j], value):
+            j += 1
+        else:
+            results[targets[j]] = items[i]
+            j += 1
+    return results
 
 
 def search_data(
@@ -85,9 +422,11 @@ def search_data(
     target,
     algorithm: SearchAlgorithm = SearchAlgorithm.BINARY,
     attribute: str | None = "_id",
-) -> Event | EventNode | None:
+) -> Event | EventNode | dict | None:
     """
     Searches for an event using a specific algorithm.
+    A collection of targets is searched for in a single pass: sorted data is merge-joined against the sorted targets,
+    or bisected with NumPy if the targets are an array, in O((n + m) log m) for m targets.
 
     Parameters
     ----------
@@ -95,6 +434,7 @@ def search_data(
         List of events
     target
         Any item to match with an item of data
+        If a list, set, frozenset, range or NumPy array, searches for each of its items
     algorithm: SearchAlgorithm
         Enumeration value for a search algorithm
     attribute: str | None
@@ -104,10 +444,74 @@ def search_data(
     Returns
     -------
     Found event as either an Event object, an EventNode object, or None if not found
+    If searching for a collection of targets, a dictionary mapping each target to its found event or None
     """
     # Further enforces the algorithm enumeration
     if algorithm not in list(SearchAlgorithm):
         raise ValueError(f"{algorithm} is an invalid or undefined search algorithm.")
 
+    # Searches for a batch of targets at once
+    if is_batch(target):
+        return _search_batch(
+            data=data, targets=target, algorithm=algorithm, attribute=attribute
+        )
+
     # Searches the data using the specified algorithm
     return algorithm.value(data=data, target=target, attribute=attribute)
+
+
+def iter_range(
+    data: EventList | LinkedEventList, start: datetime.datetime, end: datetime.datetime
+):
+    """
+    Lazily yields the events overlapping a time window, ordered by start time.
+    Event lists are searched by bisecting their start time index in O(log n) plus O(1) per event yielded.
+    Any other iterable is sorted by start time first. The data must not change while iterating.
+
+    Parameters
+    ----------
+    data: EventList | LinkedEventList
+        List of events
+    start: datetime.datetime
+        Beginning of the window (inclusive)
+    end: datetime.datetime
+        End of the window (exclusive)
+    """
+    # Containers kept in start time order search themselves
+    if hasattr(data, "overlapping"):
+        yield from data.overlapping(start, end)
+        return
+    # Use the index maintained by the event list if there is one
+    index = getattr(data, "_index", None)
+    if index is None:
+        index = IntervalIndex()
+        index.extend(
+            sort_data(
+                data=list(data),
+                algorithm=SortingAlgorithm.NATURAL_MERGE,
+                attribute="start_time",
+            )
+        )
+    yield from index.overlapping(start, end)
+
+
+def search_range(
+    data: EventList | LinkedEventList, start: datetime.datetime, end: datetime.datetime
+) -> list:
+    """
+    Searches for every event overlapping a time window.
+
+    Parameters
+    ----------
+    data: EventList | LinkedEventList
+        List of events
+    start: datetime.datetime
+        Beginning of the window (inclusive)
+    end: datetime.datetime
+        End of the window (exclusive)
+
+    Returns
+    -------
+    List of the overlapping events, ordered by start time
+    """
+    return list(iter_range(data=data, start=start, end=end))
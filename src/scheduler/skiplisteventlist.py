@@ -0,0 +1,493 @@
+# For use with type hints,,,
+from __future__ import annotations
+
+import random
+import datetime
+from scheduler.event import Event, RecurringEvent, DURATION
+from scheduler.index import HashIndex, PrefixIndex
+from scheduler.utils import free_slots
+from scheduler.sort import sort_data, SortingAlgorithm
+from scheduler.search import SearchAlgorithm, search_data, is_batch
+from scheduler.defaults import INITIAL_ID, SKIPLIST_MAX_LEVEL, SKIPLIST_PROBABILITY
+
+
+class SkipNode:
+    """
+    A node of a skip list holding a single event.
+    """
+
+    __slots__ = ("event", "next", "width")
+
+    def __init__(self, event: Event | None, level: int):
+        """
+        Parameters
+        ----------
+        event: Event | None
+            The event held by the node
+            If None, the node is the head of the skip list
+        level: int
+            The number of levels the node is linked into
+        """
+        self.event = event
+        # Next node at each level
+        self.next = [None] * level
+        # Number of events each link skips over, used for positional access
+        self.width = [1] * level
+
+
+class SkipListEventList:
+    """
+    An indexable skip list of events, always ordered by start time.
+    """
+
+    # Attribute the events are always sorted by
+    ordered_by = "start_time"
+
+    def __init__(self, max_level: int = SKIPLIST_MAX_LEVEL):
+        """
+        Attributes
+        ----------
+        max_level: int
+            The maximum number of levels of the skip list
+        head: SkipNode
+            Sentinel node linking to the first event at every level
+        size: int
+            The number of events in the event list
+        """
+        # Initialize event ID counter
+        self._id = INITIAL_ID
+        # Initialize array size
+        self.size = 0
+        # Initialize sentinel node
+        self.max_level = max_level
+        self.head = SkipNode(event=None, level=max_level)
+        # Initialize hash indexes keyed by attribute name
+        self._indexes = {
+            "_id": HashIndex(attribute="_id"),
+            "key": HashIndex(attribute="key"),
+        }
+        # Initialize mutation counter and cache of sorted views
+        self._version = 0
+        self._views = {}
+
+    def __iter__(self):
+        node = self.head.next[0]
+        while node:
+            yield node.event
+            node = node.next[0]
+
+    def __getitem__(self, index: int) -> Event:
+        if isinstance(index, int):
+            return self._node(self._validate(index)).event
+        else:
+            raise TypeError(f"Invalid index type {type(index)}")
+
+    def __setitem__(self, index: int, value: Event):
+        if isinstance(index, int):
+            index = self._validate(index)
+            node = self._node(index)
+            # The replacement must fit between its neighbours
+            previous_node = self._node(index - 1) if index > 0 else None
+            next_node = node.next[0]
+            if (
+                previous_node is not None
+                and value.start_time < previous_node.event.start_time
+            ) or (
+                next_node is not None and next_node.event.start_time < value.start_time
+            ):
+                raise ValueError("Cannot set event out of start time order")
+            for neighbour in [previous_node, next_node]:
+                if neighbour is not None and value.collides_with(neighbour.event):
+                    raise ValueError("Conflict detected, cannot set event")
+            self._untrack(node.event)
+            node.event = value
+            self._track(value)
+        else:
+            raise TypeError(f"Invalid index type {type(index)}")
+
+    def __len__(self):
+        return self.size
+
+    def _validate(self, index: int) -> int:
+        """
+        Validates an index, converting negative indices to positive ones.
+
+        Parameters
+        ----------
+        index: int
+            The index to be validated
+
+        Returns
+        -------
+        The equivalent non-negative index
+        """
+        if index < 0:
+            index += self.size
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Index {index} is out of range")
+        return index
+
+    def _node(self, index: int) -> SkipNode:
+        """
+        Gets the node at an index in O(log n) by following the widest links first.
+
+        Parameters
+        ----------
+        index: int
+            A valid, non-negative index
+
+        Returns
+        -------
+        The SkipNode at the index
+        """
+        # The head sits at position 0, so events start at position 1
+        target = index + 1
+        node = self.head
+        position = 0
+        for level in reversed(range(self.max_level)):
+            while node.next[level] and position + node.width[level] <= target:
+                position += node.width[level]
+                node = node.next[level]
+        return node
+
+    def _random_level(self) -> int:
+        """
+        Draws the number of levels of a new node from a geometric distribution.
+        """
+        level = 1
+        while level < self.max_level and random.random() < SKIPLIST_PROBABILITY:
+            level += 1
+        return level
+
+    def _track(self, event: Event):
+        """
+        Adds an event to the list's indexes.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be indexed
+        """
+        for index in self._indexes.values():
+            index.add(event)
+        self._version += 1
+
+    def _untrack(self, event: Event):
+        """
+        Removes an event from the list's indexes.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be removed from the indexes
+        """
+        for index in self._indexes.values():
+            index.remove(event)
+        self._version += 1
+
+    def add_index(self, attribute: str, prefix: bool = False):
+        """
+        Attaches a secondary index on an event attribute, kept up to date on insert, delete and setitem.
+        Hash searches on the attribute then look events up in O(1) instead of building an index on every call.
+
+        Parameters
+        ----------
+        attribute: str
+            The name of the event attribute to be indexed, such as location or title
+        prefix: bool
+            If True, indexes case-folded values in sorted order for prefix searches instead of exact values in a hash index
+        """
+        if attribute in self._indexes:
+            raise ValueError(f"Attribute {attribute} is already indexed")
+        if prefix:
+            index = PrefixIndex(attribute=attribute)
+        else:
+            index = HashIndex(attribute=attribute)
+        for event in self:
+            index.add(event)
+        self._indexes[attribute] = index
+
+    def insert(self, event: Event):
+        """
+        Insert an event in start time order.
+
+        Parameters
+        ----------
+        event: Event
+            The event to be inserted
+        """
+        # Assert type of event, recurring events are not expanded into nodes
+        if not isinstance(event, Event) or isinstance(event, RecurringEvent):
+            raise TypeError(f"Cannot insert event of type {type(event)}")
+
+        # Find the last node at each level starting no later than the event
+        update = [self.head] * self.max_level
+        positions = [0] * self.max_level
+        node = self.head
+        position = 0
+        for level in reversed(range(self.max_level)):
+            while (
+                node.next[level]
+                and node.next[level].event.start_time <= event.start_time
+            ):
+                position += node.width[level]
+                node = node.next[level]
+            update[level] = node
+            positions[level] = position
+
+        # Check if event overlaps with its neighbours, which is enough since stored events never overlap
+        for neighbour in [node, node.next[0]]:
+            if (
+                neighbour is not None
+                and neighbour.event is not None
+                and event.collides_with(neighbour.event)
+            ):
+                raise ValueError("Conflict detected, cannot insert event")
+
+        # Insert event if no conflict detected
+        # Set event ID
+        event.id = self._id
+        new_node = SkipNode(event=event, level=self._random_level())
+        for level in range(self.max_level):
+            previous_node = update[level]
+            if level < len(new_node.next):
+                # Split the link skipping over the new node in two
+                skipped = positions[0] - positions[level]
+                new_node.next[level] = previous_node.next[level]
+                new_node.width[level] = previous_node.width[level] - skipped
+                previous_node.next[level] = new_node
+                previous_node.width[level] = skipped + 1
+            else:
+                # Links above the new node now skip over one more event
+                previous_node.width[level] += 1
+        self._track(event)
+        # Sequentially generate a new ID upon insertion
+        self._id += 1
+        # Increment size
+        self.size += 1
+
+    def delete(self, index: int = -1, event: Event | None = None):
+        """
+        Remove an item fom the event list.
+
+        Parameters
+        ----------
+        index: int
+            The index at which to remove an event
+        event: Event | None
+            An event to be removed from the list
+            If None, defaults to index-based deletion
+        """
+        # Deal with empty list
+        if self.size == 0:
+            raise IndexError("Trying to delete from empty list")
+        # Delete at specific index
+        if event is None:
+            index = self._validate(index)
+
+        # Delete by matching event attributes
+        else:
+            # Look up matching events by their identity key
+            matches = self._indexes["key"].get(event.key)
+            if not matches:
+                return
+            index = self._position(matches[0])
+
+        # Find the last node at each level before the index
+        update = [self.head] * self.max_level
+        node = self.head
+        position = 0
+        for level in reversed(range(self.max_level)):
+            while node.next[level] and position + node.width[level] <= index:
+                position += node.width[level]
+                node = node.next[level]
+            update[level] = node
+
+        # Unlink the node at every level it appears in
+        removed_node = node.next[0]
+        for level in range(self.max_level):
+            previous_node = update[level]
+            if previous_node.next[level] is removed_node:
+                previous_node.width[level] += removed_node.width[level] - 1
+                previous_node.next[level] = removed_node.next[level]
+            else:
+                previous_node.width[level] -= 1
+        self._untrack(removed_node.event)
+        # Decrease size of list
+        self.size -= 1
+
+    def _position(self, event: Event) -> int:
+        """
+        Gets the index of an event stored in the list.
+
+        Parameters
+        ----------
+        event: Event
+            An event stored in the list
+
+        Returns
+        -------
+        The index of the event
+        """
+        # Find the last node starting before the event
+        node = self.head
+        position = 0
+        for level in reversed(range(self.max_level)):
+            while (
+                node.next[level]
+                and node.next[level].event.start_time < event.start_time
+            ):
+                position += node.width[level]
+                node = node.next[level]
+        # Walk past any other events starting at the same time
+        node = node.next[0]
+        while node.event is not event:
+            position += 1
+            node = node.next[0]
+        return position
+
+    def overlapping(self, start: datetime.datetime, end: datetime.datetime):
+        """
+        Lazily yields the events overlapping a time window, ordered by start time.
+
+        Parameters
+        ----------
+        start: datetime.datetime
+            Beginning of the window (inclusive)
+        end: datetime.datetime
+            End of the window (exclusive)
+        """
+        # Find the last node starting no later than the window
+        node = self.head
+        for level in reversed(range(self.max_level)):
+            while node.next[level] and node.next[level].event.start_time <= start:
+                node = node.next[level]
+        # Stored events never overlap, so no earlier event can still be running
+        if node is self.head:
+            node = node.next[0]
+        while node is not None and node.event.start_time < end:
+            if node.event.end_time > start:
+                yield node.event
+            node = node.next[0]
+
+    def find_free_slots(
+        self,
+        after: datetime.datetime,
+        duration: datetime.timedelta = DURATION,
+        limit: int | None = 1,
+    ) -> list:
+        """
+        Finds the earliest free time windows long enough to hold an event of a given duration.
+        The list is kept in start time order, so the gaps are walked from the event running at after in O(log n).
+
+        Parameters
+        ----------
+        after: datetime.datetime
+            The earliest time a window may start
+        duration: datetime.timedelta
+            The minimum length of a window, defaulting to the length of an event
+        limit: int | None
+            The maximum number of windows to return
+            If None, returns every window
+
+        Returns
+        -------
+        List of (start_time, end_time) pairs of free windows in chronological order
+        The last window is open-ended, with an end time of None
+        """
+        # Find the last node starting no later than after, the only one that can still be running
+        node = self.head
+        for level in reversed(range(self.max_level)):
+            while node.next[level] and node.next[level].event.start_time <= after:
+                node = node.next[level]
+        if node is self.head:
+            node = node.next[0]
+
+        def intervals(node):
+            while node is not None:
+                yield node.event.start_time, node.event.end_time
+                node = node.next[0]
+
+        return free_slots(
+            intervals=intervals(node), after=after, duration=duration, limit=limit
+        )
+
+    def search_by_id(
+        self, id: int | list, algorithm: SearchAlgorithm = SearchAlgorithm.HASH
+    ) -> Event | dict:
+        """
+        Searches for an event using an ID.
+
+        Parameters
+        ----------
+        id: int | list
+            The target ID to search for
+            If a list, set, frozenset, range or NumPy array of IDs, searches for all of them at once
+        algorithm: SearchAlgorithm
+            The SearchAlgorithm enumeration that determines which search algorithm to use
+
+        Returns
+        -------
+        The Event object that was found
+        If searching for a collection of IDs, a dictionary mapping each ID to its Event object or None if not found
+        """
+        data = self
+        # Searches relying on sorted data run on a sorted copy since the list is ordered by start time
+        # IDs are mostly in insertion order already, which the natural merge sort handles in close to O(N)
+        if algorithm in [
+            SearchAlgorithm.BINARY,
+            SearchAlgorithm.INTERPOLATION,
+            SearchAlgorithm.EXPONENTIAL,
+        ]:
+            data = sort_data(
+                data=list(self),
+                algorithm=SortingAlgorithm.NATURAL_MERGE,
+                attribute="_id",
+            )
+        # Searches for a batch of IDs at once, mapping missing IDs to None
+        if is_batch(id):
+            return search_data(data=data, target=id, algorithm=algorithm)
+        found_event = search_data(data=data, target=id, algorithm=algorithm)
+        if found_event is None:
+            raise ValueError(f"Could not find ID {id} in event list")
+        return found_event
+
+    def list_all(
+        self,
+        sort: bool | SortingAlgorithm = True,
+        attribute: str = "start_time",
+        readonly: bool = False,
+    ) -> list | tuple:
+        """
+        Displays all events in a list.
+        The list is always ordered by start time, so only other attributes need sorting.
+
+        Parameters
+        ----------
+        sort: bool | SortingAlgorithm
+            Determines if returned list should be sorted by date and time
+            If True, defaults to using the natural merge sort algorithm
+        attribute: str
+            The name of the event attribute to sort by
+        readonly: bool
+            If True, returns the cached view itself as a tuple instead of copying it into a list
+
+        Returns
+        -------
+        List of all events, or a tuple if readonly is True
+        """
+        # Determine sorting algorithm
+        if sort is True:
+            sort = SortingAlgorithm.NATURAL_MERGE
+        if not sort or attribute == self.ordered_by:
+            eventlist = list(self)
+            return tuple(eventlist) if readonly else eventlist
+
+        # Sort a copy of the events only if the list changed since the last call
+        version, view = self._views.get((sort, attribute), (None, None))
+        if version != self._version:
+            view = tuple(
+                sort_data(data=list(self), algorithm=sort, attribute=attribute)
+            )
+            self._views[(sort, attribute)] = (self._version, view)
+        return view if readonly else list(view)
@@ -5,9 +5,32 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from scheduler.eventlist import EventList
     from scheduler.linkedeventlist import LinkedEventList
+    from scheduler.skiplisteventlist import SkipListEventList
 
+import os
+import sys
+import json
+import struct
+import datetime
+import tempfile
+from heapq import merge
+from itertools import count
+from math import log2, gcd
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_left, bisect_right
 from enum import Enum, member
+from scheduler.event import Event
 from scheduler.utils import parse_object
+from scheduler.defaults import (
+    SMALL_SORT_SIZE,
+    NINTHER_SIZE,
+    MIN_GALLOP,
+    RADIX_BITS,
+    EPOCH,
+    PARALLEL_SORT_THRESHOLD,
+    EXTERNAL_SORT_MEMORY,
+    EXTERNAL_SORT_FAN_IN,
+)
 
 
 def insertion_sort(data, attribute: str | None = None):
@@ -141,6 +164,481 @@ def quick_sort(data, attribute: str | None = None):
     return data
 
 
+def intro_sort(data, attribute: str | None = None):
+    """
+    Sorts data using the intro sorting algorithm, a quick sort that cannot degrade to O(N^2).
+    Pivots are the median of three items, or of three medians of three on large ranges,
+    so sorted and reverse-sorted data split evenly. Ranges are kept on an explicit stack instead of recursing,
+    ranges past a depth bound fall back to heap sort and small ranges are finished with insertion sort.
+
+    Parameters
+    ----------
+    data
+        The data to be sorted
+    attribute: str | None
+        The name of the attribute to parse in each item of the iterable to be used for sorting
+        If None, matches each item
+
+    Returns
+    -------
+    Sorted data
+    """
+
+    def _value(i):
+        """
+        Get the sorting value of an item.
+        """
+        return parse_object(data[i], attribute)
+
+    def _median(i, j, k):
+        """
+        Get the index of the median of three items.
+        """
+        a, b, c = _value(i), _value(j), _value(k)
+        if a < b:
+            return j if b < c else (k if a < c else i)
+        return i if a < c else (k if b < c else j)
+
+    def _partition(low, high):
+        """
+        Get partition index, splitting items around a pivot with Hoare's scheme.
+        """
+        # Choose a pivot
+        middle = (low + high) // 2
+        if high - low > NINTHER_SIZE:
+            step = (high - low) // 8
+            pivot_index = _median(
+                _median(low, low + step, low + 2 * step),
+                _median(middle - step, middle, middle + step),
+                _median(high - 2 * step, high - step, high),
+            )
+        else:
+            pivot_index = _median(low, middle, high)
+        data[low], data[pivot_index] = data[pivot_index], data[low]
+        pivot = _value(low)
+        i, j = low - 1, high + 1
+        while True:
+            i += 1
+            while _value(i) < pivot:
+                i += 1
+            j -= 1
+            while pivot < _value(j):
+                j -= 1
+            if i >= j:
+                return j
+            data[i], data[j] = data[j], data[i]
+
+    def _heap_sort(low, high):
+        """
+        Sort a range using the heap sorting algorithm.
+        """
+
+        def _sift_down(root, end):
+            while 2 * root + 1 < end:
+                child = 2 * root + 1
+                if child + 1 < end and _value(low + child) < _value(low + child + 1):
+                    child += 1
+                if not _value(low + root) < _value(low + child):
+                    return
+                data[low + root], data[low + child] = (
+                    data[low + child],
+                    data[low + root],
+                )
+                root = child
+
+        size = high - low + 1
+        for root in reversed(range(size // 2)):
+            _sift_down(root, size)
+        for end in reversed(range(1, size)):
+            data[low], data[low + end] = data[low + end], data[low]
+            _sift_down(0, end)
+
+    def _insertion_sort(low, high):
+        """
+        Sort a small range using the insertion sorting algorithm.
+        """
+        for i in range(low + 1, high + 1):
+            item = data[i]
+            value = parse_object(item, attribute)
+            j = i - 1
+            while j >= low and value < _value(j):
+                data[j + 1] = data[j]
+                j -= 1
+            data[j + 1] = item
+
+    if len(data) < 2:
+        return data
+    # Ranges still to be sorted, along with how many more partitions they may go through
+    stack = [(0, len(data) - 1, 2 * int(log2(len(data))))]
+    while stack:
+        low, high, depth = stack.pop()
+        while high - low + 1 > SMALL_SORT_SIZE:
+            if depth == 0:
+                _heap_sort(low, high)
+                break
+            depth -= 1
+            partition_index = _partition(low, high)
+            # Keep splitting the smaller side so the stack stays O(log N) deep
+            if partition_index - low < high - partition_index:
+                stack.append((partition_index + 1, high, depth))
+                high = partition_index
+            else:
+                stack.append((low, partition_index, depth))
+                low = partition_index + 1
+        else:
+            _insertion_sort(low, high)
+    return data
+
+
+def natural_merge_sort(data, attribute: str | None = None):
+    """
+    Sorts data using an adaptive natural merge sorting algorithm.
+    Existing ascending and strictly descending runs are detected and merged pairwise,
+    galloping through stretches of one run that all come before the next item of the other.
+    Already sorted data is checked in a single O(N) pass and nearly sorted data is sorted in close to O(N).
+    Items comparing equal keep their relative order.
+
+    Parameters
+    ----------
+    data
+        The data to be sorted
+    attribute: str | None
+        The name of the attribute to parse in each item of the iterable to be used for sorting
+        If None, matches each item
+
+    Returns
+    -------
+    Sorted data
+    """
+    # Extract every key once, keeping items and keys in parallel lists
+    items = list(data)
+    keys = [parse_object(item, attribute) for item in items]
+
+    def _gallop(sorted_keys, key, low, high, after):
+        """
+        Get the position of a key within a sorted range by exponential search from its start.
+        If after is True, the position is after any equal keys, otherwise before them.
+        """
+        previous = position = low
+        offset = 1
+        while position < high and (
+            not key < sorted_keys[position] if after else sorted_keys[position] < key
+        ):
+            previous = position + 1
+            position = low + offset
+            offset *= 2
+        search = bisect_right if after else bisect_left
+        return search(sorted_keys, key, previous, min(position, high))
+
+    def _merge(low, middle, high):
+        """
+        Merge the adjacent sorted runs [low, middle) and [middle, high).
+        """
+        # Items of the left run before the first right item are already in place
+        low = _gallop(keys, keys[middle], low, middle, after=True)
+        if low == middle:
+            return
+        # Items of the right run after the last left item are already in place
+        high = _gallop(keys, keys[middle - 1], middle, high, after=False)
+
+        left_items, left_keys = items[low:middle], keys[low:middle]
+        i, j, k = 0, middle, low
+        left_wins = right_wins = 0
+        while i < len(left_items) and j < high:
+            # Take from the left run on ties to keep the sort stable
+            if keys[j] < left_keys[i]:
+                items[k], keys[k] = items[j], keys[j]
+                j += 1
+                k += 1
+                right_wins += 1
+                left_wins = 0
+                if right_wins >= MIN_GALLOP:
+                    # Move every right item before the next left item at once
+                    end = _gallop(keys, left_keys[i], j, high, after=False)
+                    items[k : k + end - j] = items[j:end]
+                    keys[k : k + end - j] = keys[j:end]
+                    k += end - j
+                    j = end
+                    right_wins = 0
+            else:
+                items[k], keys[k] = left_items[i], left_keys[i]
+                i += 1
+                k += 1
+                left_wins += 1
+                right_wins = 0
+                if left_wins >= MIN_GALLOP:
+                    # Move every left item up to the next right item at once
+                    end = _gallop(left_keys, keys[j], i, len(left_items), after=True)
+                    items[k : k + end - i] = left_items[i:end]
+                    keys[k : k + end - i] = left_keys[i:end]
+                    k += end - i
+                    i = end
+                    left_wins = 0
+        # Remaining right items are already in place
+        items[k : k + len(left_items) - i] = left_items[i:]
+        keys[k : k + len(left_keys) - i] = left_keys[i:]
+
+    # Find the boundaries of every run, reversing descending runs
+    boundaries = []
+    i = 0
+    while i < len(items):
+        boundaries.append(i)
+        j = i + 1
+        if j < len(items) and keys[j] < keys[i]:
+            # Only strictly descending runs are reversed so equal items keep their order
+            while j < len(items) and keys[j] < keys[j - 1]:
+                j += 1
+            items[i:j] = items[i:j][::-1]
+            keys[i:j] = keys[i:j][::-1]
+        else:
+            while j < len(items) and not keys[j] < keys[j - 1]:
+                j += 1
+        i = j
+    boundaries.append(len(items))
+
+    # Merge pairs of adjacent runs until a single run is left
+    while len(boundaries) > 2:
+        merged_boundaries = boundaries[::2]
+        for i in range(0, len(boundaries) - 2, 2):
+            _merge(boundaries[i], boundaries[i + 1], boundaries[i + 2])
+        if merged_boundaries[-1] != len(items):
+            merged_boundaries.append(len(items))
+        boundaries = merged_boundaries
+
+    # Write the sorted items back
+    if isinstance(data, list):
+        data[:] = items
+    else:
+        for i, item in enumerate(items):
+            data[i] = item
+    return data
+
+
+def radix_sort(data, attribute: str | None = None):
+    """
+    Sorts data using the least significant digit radix sorting algorithm, in O(N) time for bounded keys.
+    Keys must be integers or datetimes. They are offset by the smallest key and divided by their
+    greatest common step, so minute-granularity start times over a term take only a few passes.
+    Items comparing equal keep their relative order.
+
+    Parameters
+    ----------
+    data
+        The data to be sorted
+    attribute: str | None
+        The name of the attribute to parse in each item of the iterable to be used for sorting
+        If None, matches each item
+        Items that are tuples, as decorated by sort_data, are sorted by their first element
+
+    Returns
+    -------
+    Sorted data
+    """
+
+    def _integer(value) -> int:
+        """
+        Get the integer form of a key.
+        """
+        # Ties between decorated keys are already in position order, which the sort preserves
+        if isinstance(value, tuple):
+            value = value[0]
+        if isinstance(value, datetime.datetime):
+            return (value - EPOCH) // datetime.timedelta(microseconds=1)
+        if isinstance(value, int):
+            return value
+        raise TypeError(f"Cannot radix sort values of type {type(value)}")
+
+    items = list(data)
+    if len(items) < 2:
+        return data
+    keys = [_integer(parse_object(item, attribute)) for item in items]
+    # Shrink keys to small non-negative integers
+    low = min(keys)
+    keys = [key - low for key in keys]
+    step = gcd(*keys) or 1
+    keys = [key // step for key in keys]
+
+    # Distribute positions into buckets by each digit in turn, least significant first
+    mask = (1 << RADIX_BITS) - 1
+    order = range(len(items))
+    shift = 0
+    while max(keys) >> shift:
+        buckets = [[] for _ in range(mask + 1)]
+        for i in order:
+            buckets[(keys[i] >> shift) & mask].append(i)
+        order = [i for bucket in buckets for i in bucket]
+        shift += RADIX_BITS
+
+    # Write the sorted items back
+    items = [items[i] for i in order]
+    if isinstance(data, list):
+        data[:] = items
+    else:
+        for i, item in enumerate(items):
+            data[i] = item
+    return data
+
+
+def _sort_chunk(keys: list) -> list:
+    """
+    Sorts a chunk of keys in a worker process.
+
+    Parameters
+    ----------
+    keys: list
+        The keys of a chunk of items
+
+    Returns
+    -------
+    Positions of the keys within the chunk, in sorted order
+    """
+    decorated = [(key, i) for i, key in enumerate(keys)]
+    natural_merge_sort(data=decorated)
+    return [i for _, i in decorated]
+
+
+def parallel_merge_sort(
+    data,
+    attribute: str | None = None,
+    workers: int | None = None,
+    threshold: int = PARALLEL_SORT_THRESHOLD,
+):
+    """
+    Sorts data using a parallel merge sorting algorithm.
+    Only the keys are sent to a pool of worker processes, which each sort one chunk,
+    and the sorted chunks are then merged in a single k-way merge.
+    Items comparing equal keep their relative order.
+
+    Parameters
+    ----------
+    data
+        The data to be sorted
+    attribute: str | None
+        The name of the attribute to parse in each item of the iterable to be used for sorting
+        If None, matches each item
+    workers: int | None
+        The number of worker processes
+        If None, uses one per CPU
+    threshold: int
+        The number of items below which the data is sorted serially with the natural merge sorting algorithm
+
+    Returns
+    -------
+    Sorted data
+    """
+    workers = workers or os.cpu_count() or 1
+    if len(data) < max(threshold, 2) or workers == 1:
+        return natural_merge_sort(data=data, attribute=attribute)
+
+    # Split the keys into one chunk per worker
+    items = list(data)
+    keys = [parse_object(item, attribute) for item in items]
+    chunk_size = -(-len(keys) // workers)
+    offsets = range(0, len(keys), chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(
+            _sort_chunk, [keys[offset : offset + chunk_size] for offset in offsets]
+        )
+        runs = [[offset + i for i in chunk] for offset, chunk in zip(offsets, chunks)]
+
+    # Merge the sorted chunks, taking from earlier chunks on ties
+    order = merge(*runs, key=keys.__getitem__)
+
+    # Write the sorted items back
+    items = [items[i] for i in order]
+    if isinstance(data, list):
+        data[:] = items
+    else:
+        for i, item in enumerate(items):
+            data[i] = item
+    return data
+
+
+def linked_merge_sort(head, attribute: str | None = None):
+    """
+    Sorts a linked list of nodes using a bottom-up merge sort that relinks the existing nodes.
+    No nodes are copied and the list is never indexed, so sorting is O(N log N).
+    Nodes comparing equal keep their relative order.
+
+    Parameters
+    ----------
+    head
+        The first node of the linked list, or None if the list is empty
+    attribute: str | None
+        The name of the attribute to parse in each node to be used for sorting
+        If None, matches each node
+
+    Returns
+    -------
+    The first node of the sorted linked list
+    """
+
+    def _split(node, width):
+        """
+        Cuts the list after a number of nodes and returns the first node of the rest.
+        """
+        for _ in range(width - 1):
+            if node is None:
+                return None
+            node = node.next
+        if node is None:
+            return None
+        rest = node.next
+        node.next = None
+        return rest
+
+    def _merge(left, right):
+        """
+        Merges two sorted runs, returning the first and last nodes of the merged run.
+        """
+        first = last = None
+        while left is not None and right is not None:
+            # Take from the left run on ties to keep the sort stable
+            if parse_object(right, attribute) < parse_object(left, attribute):
+                node, right = right, right.next
+            else:
+                node, left = left, left.next
+            if last is None:
+                first = node
+            else:
+                last.next = node
+            last = node
+        rest = left if left is not None else right
+        if last is None:
+            first = last = rest
+        else:
+            last.next = rest
+        # Walk to the end of the leftover run
+        while last.next is not None:
+            last = last.next
+        return first, last
+
+    # Count nodes
+    length = 0
+    node = head
+    while node is not None:
+        length += 1
+        node = node.next
+
+    # Merge runs of doubling width until a single run is left
+    width = 1
+    while width < length:
+        node = head
+        head = tail = None
+        while node is not None:
+            left = node
+            right = _split(left, width)
+            node = _split(right, width)
+            first, last = _merge(left, right)
+            if tail is None:
+                head = first
+            else:
+                tail.next = first
+            tail = last
+        width *= 2
+    return head
+
+
 class SortingAlgorithm(Enum):
     """
     Enumeration of different sorting algorithms
@@ -149,32 +647,358 @@ class SortingAlgorithm(Enum):
     INSERTION = member(insertion_sort)
     MERGE = member(merge_sort)
     QUICK = member(quick_sort)
+    INTRO = member(intro_sort)
+    NATURAL_MERGE = member(natural_merge_sort)
+    RADIX = member(radix_sort)
+    PARALLEL_MERGE = member(parallel_merge_sort)
+
+
+def _attribute_key(attribute: str | tuple | None):
+    """
+    Builds a function extracting the sorting key of an item from one or more attribute names.
+
+    Parameters
+    ----------
+    attribute: str | tuple | None
+        The name of the attribute to parse in each item, or a tuple of names compared in order
+        If None, matches each item
+
+    Returns
+    -------
+    A function mapping an item to its sorting key
+    """
+    if isinstance(attribute, tuple):
+        return lambda item: tuple(parse_object(item, name) for name in attribute)
+    return lambda item: parse_object(item, attribute)
+
+
+def _reorder(data, items: list):
+    """
+    Applies a sorted order of items to the container they were taken from.
+
+    Parameters
+    ----------
+    data
+        The container the items were taken from
+    items: list
+        Every item of the container, in sorted order
+
+    Returns
+    -------
+    The reordered container, or the sorted items as a list if the container keeps its own order
+    """
+    # Linked containers relink their existing nodes
+    if hasattr(data, "_relink"):
+        for node, next_node in zip(items, items[1:] + [None]):
+            node.next = next_node
+        data._relink(items[0] if items else None)
+        return data
+    # Array-based containers overwrite their events without re-indexing them
+    if hasattr(data, "_permute"):
+        data._permute(items)
+        return data
+    # Containers kept in order by an attribute cannot be reordered
+    if hasattr(data, "ordered_by"):
+        return items
+    if isinstance(data, list):
+        data[:] = items
+        return data
+    for i, item in enumerate(items):
+        data[i] = item
+    return data
 
 
 def sort_data(
-    data: EventList | LinkedEventList,
+    data: EventList | LinkedEventList | SkipListEventList,
     algorithm: SortingAlgorithm = SortingAlgorithm.QUICK,
-    attribute: str | None = "start_time",
-) -> EventList | LinkedEventList:
+    attribute: str | tuple | None = "start_time",
+    key=None,
+    reverse: bool = False,
+    **kwargs,
+) -> EventList | LinkedEventList | list:
     """
     Sorts an event list by date and time using a specific algorithm.
+    The sorting key of each event is extracted once and the algorithm sorts the precomputed keys,
+    so the container is only reordered once the final order is known and equal keys keep their order.
+    Linked event lists sorted by a single attribute are sorted in place with linked_merge_sort,
+    whichever comparison sorting algorithm is chosen.
 
     Parameters
     ----------
-    data: EventList | LinkedEventList
+    data: EventList | LinkedEventList | SkipListEventList
         An event list object
     algorithm: SortingAlgorithm
         Enumeration value for a sorting algorithm
-    attribute: str | None
+    attribute: str | tuple | None
         The name of the attribute to parse in each item of the iterable to be used for sorting
+        If a tuple of names, sorts by each attribute in turn
+    key
+        A function mapping each item to its sorting key, used instead of attribute
+    reverse: bool
+        If True, sorts in descending order
+    kwargs
+        Additional parameters passed to the sorting algorithm, such as the workers of the parallel merge sorting algorithm
 
     Returns
     -------
-    Sorted data as a list
+    Sorted data, or a sorted list of events if the container keeps its own order
     """
     # Further enforces the algorithm enumeration
     if algorithm not in list(SortingAlgorithm):
         raise ValueError(f"{algorithm} is an invalid or undefined sorting algorithm.")
 
-    # Sorts the data using the specified algorithm
-    return algorithm.value(data=data, attribute=attribute)
+    if key is None and not reverse:
+        # Containers kept in order by an attribute are already sorted by it
+        if hasattr(data, "ordered_by") and data.ordered_by == attribute:
+            return data
+
+        # Linked containers are sorted by relinking their nodes rather than indexing into them
+        # Radix and parallel merge sorts work on the extracted keys instead
+        if (
+            hasattr(data, "_relink")
+            and not isinstance(attribute, tuple)
+            and algorithm
+            not in [SortingAlgorithm.RADIX, SortingAlgorithm.PARALLEL_MERGE]
+        ):
+            data._relink(linked_merge_sort(head=data.head, attribute=attribute))
+            return data
+
+    # Extract every key once, tagging it with its position to break ties without comparing items
+    if key is None:
+        key = _attribute_key(attribute)
+    items = list(data)
+    # Sorting the reversed items ascending and reversing the result keeps equal keys in order
+    if reverse:
+        items.reverse()
+    decorated = [(key(item), i) for i, item in enumerate(items)]
+
+    # Sorts the keys using the specified algorithm
+    algorithm.value(data=decorated, attribute=None, **kwargs)
+    items = [items[i] for _, i in decorated]
+    if reverse:
+        items.reverse()
+    return _reorder(data, items)
+
+
+# Header of an event record in the runs of an external sort:
+# start time in microseconds since EPOCH, ID (-1 if unset), and byte lengths of the title and location
+RECORD_HEADER = struct.Struct("<qqII")
+
+
+def _encode(event: Event) -> tuple:
+    """
+    Encodes an event as a compact binary record.
+
+    Parameters
+    ----------
+    event: Event
+        The event to be encoded
+
+    Returns
+    -------
+    The start time of the event in microseconds since EPOCH and the encoded record
+    """
+    start = (event.start_time - EPOCH) // datetime.timedelta(microseconds=1)
+    title = event.title.encode()
+    location = event.location.encode()
+    id = event.id if getattr(event, "_id", None) is not None else -1
+    header = RECORD_HEADER.pack(start, id, len(title), len(location))
+    return start, header + title + location
+
+
+def _decode(record: bytes, event_type: type) -> Event:
+    """
+    Decodes a binary record back into an event.
+
+    Parameters
+    ----------
+    record: bytes
+        A record produced by _encode
+    event_type: type
+        The type of event to create
+
+    Returns
+    -------
+    The decoded event
+    """
+    start, id, title_length, location_length = RECORD_HEADER.unpack_from(record)
+    offset = RECORD_HEADER.size
+    event = event_type.from_datetime(
+        title=record[offset : offset + title_length].decode(),
+        start_time=EPOCH + datetime.timedelta(microseconds=start),
+        location=record[offset + title_length :].decode(),
+    )
+    if id != -1:
+        event.id = id
+    return event
+
+
+def _write_run(path: str, records):
+    """
+    Writes the records of a sorted run to a file.
+
+    Parameters
+    ----------
+    path: str
+        The path of the file holding the run
+    records
+        An iterable of records produced by _encode, in sorted order
+    """
+    with open(path, "wb") as file:
+        file.writelines(records)
+
+
+def _read_run(path: str):
+    """
+    Lazily reads the records of a sorted run back from a file.
+    The file is only open while the run is being read.
+
+    Parameters
+    ----------
+    path: str
+        The path of the file holding the run
+
+    Yields
+    ------
+    The start time and the record of each event
+    """
+    with open(path, "rb") as file:
+        while header := file.read(RECORD_HEADER.size):
+            start, _, title_length, location_length = RECORD_HEADER.unpack(header)
+            yield start, header + file.read(title_length + location_length)
+
+
+def _read_records(records):
+    """
+    Lazily converts records to events, reading them from a JSON Lines file if given a path.
+
+    Parameters
+    ----------
+    records
+        An iterable of events or of dictionaries of event parameters,
+        or the path to a JSON Lines file with one dictionary of event parameters per line
+
+    Yields
+    ------
+    Each record as an event
+    """
+    if isinstance(records, (str, os.PathLike)):
+        with open(records) as file:
+            for line in file:
+                if line.strip():
+                    yield Event(**json.loads(line))
+        return
+    for record in records:
+        if isinstance(record, dict):
+            record = Event(**record)
+        elif not isinstance(record, Event):
+            raise TypeError(f"Cannot sort event of type {type(record)}")
+        yield record
+
+
+def external_sort(
+    records,
+    memory: int = EXTERNAL_SORT_MEMORY,
+    algorithm: SortingAlgorithm = SortingAlgorithm.NATURAL_MERGE,
+    event_type: type = Event,
+    fan_in: int = EXTERNAL_SORT_FAN_IN,
+):
+    """
+    Sorts events that may not fit in memory by start time.
+    Events are streamed in and encoded as compact binary records, and each memory budget's worth of records
+    is sorted and written to a temporary file as a run, which is closed until it is merged. The runs are then
+    lazily merged back, in several passes if there are more runs than the fan-in, so that at most fan_in files
+    are open at once.
+    Memory use is bounded by the budget regardless of the number of events.
+    Events starting at the same time keep their relative order.
+
+    Parameters
+    ----------
+    records
+        An iterable of events or of dictionaries of event parameters,
+        or the path to a JSON Lines file with one dictionary of event parameters per line
+    memory: int
+        The approximate number of bytes of records held in memory at once
+    algorithm: SortingAlgorithm
+        Enumeration value for the sorting algorithm used to sort each run
+    event_type: type
+        The type of the events created from the merged records
+    fan_in: int
+        The maximum number of run files open at once, at least 3
+        Passes before the last one merge fan_in - 1 runs, leaving room for the file being written
+
+    Returns
+    -------
+    A generator of events ordered by start time
+    Only the title, location, start time and ID of each event are kept
+    """
+    # Further enforces the algorithm enumeration
+    if algorithm not in list(SortingAlgorithm):
+        raise ValueError(f"{algorithm} is an invalid or undefined sorting algorithm.")
+    if memory <= 0:
+        raise ValueError(f"Memory budget must be positive, got {memory}")
+    if fan_in < 3:
+        raise ValueError(f"Fan-in must be at least 3, got {fan_in}")
+
+    def _sort():
+        sources = []
+        with tempfile.TemporaryDirectory() as directory:
+            paths = (os.path.join(directory, f"{i}.run") for i in count())
+            try:
+                # Sort each budget's worth of records into a run, closing its file once written
+                runs = []
+                buffer = []
+                size = 0
+                for event in _read_records(records):
+                    start, record = _encode(event)
+                    # Sequence numbers keep records starting at the same time in order
+                    entry = (start, len(buffer), record)
+                    buffer.append(entry)
+                    size += (
+                        sys.getsizeof(entry)
+                        + sys.getsizeof(start)
+                        + sys.getsizeof(record)
+                    )
+                    if size >= memory:
+                        algorithm.value(data=buffer, attribute=None)
+                        runs.append(next(paths))
+                        _write_run(runs[-1], (record for _, _, record in buffer))
+                        buffer = []
+                        size = 0
+                algorithm.value(data=buffer, attribute=None)
+
+                # Merge consecutive groups of runs into longer runs until the rest can be merged at once,
+                # leaving room for the file being written so that at most fan_in files are open
+                while len(runs) > fan_in:
+                    merged = []
+                    for i in range(0, len(runs), fan_in - 1):
+                        group = runs[i : i + fan_in - 1]
+                        if len(group) == 1:
+                            merged.append(group[0])
+                            continue
+                        merged.append(next(paths))
+                        sources = [_read_run(run) for run in group]
+                        _write_run(
+                            merged[-1],
+                            (
+                                record
+                                for _, record in merge(
+                                    *sources, key=lambda item: item[0]
+                                )
+                            ),
+                        )
+                        for run in group:
+                            os.remove(run)
+                    runs = merged
+
+                # Merge the runs with the records still in memory, taking from earlier runs on ties
+                sources = [_read_run(run) for run in runs]
+                sources.append((start, record) for start, _, record in buffer)
+                for _, record in merge(*sources, key=lambda item: item[0]):
+                    yield _decode(record, event_type)
+            finally:
+                # Close runs left open if the events are not read to the end
+                for source in sources:
+                    source.close()
+
+    return _sort()
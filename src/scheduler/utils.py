@@ -1,3 +1,6 @@
+import datetime
+
+
 def parse_object(item, attribute: str | None):
     """
     Parses the attribute of the object.
@@ -15,4 +18,164 @@ def parse_object(item, attribute: str | None):
     """
     if attribute is None:
         return item
-    return vars(item).get(attribute, None)
+    return getattr(item, attribute, None)
+
+
+def get_attributes(item) -> dict:
+    """
+    Gets every attribute set on an object, whether it is stored in a __dict__ or in __slots__.
+
+    Parameters
+    ----------
+    item
+        The object to be parsed
+
+    Returns
+    -------
+    Dictionary of attribute names and values
+    """
+    if hasattr(item, "__dict__"):
+        return dict(vars(item))
+    attributes = {}
+    for cls in type(item).__mro__:
+        for name in getattr(cls, "__slots__", []):
+            if hasattr(item, name):
+                attributes[name] = getattr(item, name)
+    return attributes
+
+
+def parse_records(records, event_type: type, excluded: tuple = ()) -> list:
+    """
+    Converts a collection of records to events.
+
+    Parameters
+    ----------
+    records
+        An iterable of events or of dictionaries of event parameters
+    event_type: type
+        The type of event accepted by the event list
+    excluded: tuple
+        Subclasses of event_type that cannot be inserted in bulk, such as RecurringEvent
+
+    Returns
+    -------
+    List of events in the same order as the records
+    """
+    events = []
+    for record in records:
+        if isinstance(record, dict):
+            record = event_type(**record)
+        elif not isinstance(record, event_type) or isinstance(record, excluded):
+            raise TypeError(f"Cannot insert event of type {type(record)}")
+        events.append(record)
+    return events
+
+
+def conflict_error(positions: list, events: list) -> ValueError:
+    """
+    Builds the error reported when records of a batch conflict.
+
+    Parameters
+    ----------
+    positions: list
+        Positions of the conflicting records in the original batch
+    events: list
+        The conflicting events, in the same order as positions
+
+    Returns
+    -------
+    A ValueError listing every conflicting record
+    """
+    details = ", ".join(
+        f"{position} ('{event.title}' at {event.start_time:%Y-%m-%d %H:%M})"
+        for position, event in sorted(zip(positions, events), key=lambda item: item[0])
+    )
+    return ValueError(f"Conflict detected, cannot insert records {details}")
+
+
+def prepare_batch(
+    records, event_type: type, index, series=None, excluded: tuple = ()
+) -> list:
+    """
+    Prepares a batch of records for bulk insertion into an event list.
+    Records are converted to events, sorted once by start time and checked for conflicts in a single sweep.
+
+    Parameters
+    ----------
+    records
+        An iterable of events or of dictionaries of event parameters
+    event_type: type
+        The type of event accepted by the event list
+    index: IntervalIndex
+        The start time index of the event list
+    series: SeriesIndex | None
+        The recurring events of the event list
+        If None, the batch is only checked against the start time index
+    excluded: tuple
+        Subclasses of event_type that cannot be inserted in bulk, such as RecurringEvent
+
+    Returns
+    -------
+    List of events sorted by start time
+    """
+    events = parse_records(records=records, event_type=event_type, excluded=excluded)
+
+    # Sort once, remembering each event's position in the original records
+    order = sorted(range(len(events)), key=lambda i: events[i].start_time)
+    events = [events[i] for i in order]
+
+    # Report every conflicting record at once
+    conflicts = index.find_conflicts(events)
+    if series is not None:
+        conflicts = sorted(set(conflicts).union(series.find_conflicts(events)))
+    if conflicts:
+        raise conflict_error(
+            positions=[order[i] for i in conflicts],
+            events=[events[i] for i in conflicts],
+        )
+    return events
+
+
+def free_slots(
+    intervals,
+    after: datetime.datetime,
+    duration: datetime.timedelta,
+    limit: int | None,
+) -> list:
+    """
+    Finds the free time windows long enough to hold a given duration by walking the gaps between intervals.
+    Stops as soon as enough windows are found, so only the intervals before the last window are visited.
+
+    Parameters
+    ----------
+    intervals
+        An iterable of (start_time, end_time) pairs sorted by start time
+        Must include every interval still running at after
+    after: datetime.datetime
+        The earliest time a window may start
+    duration: datetime.timedelta
+        The minimum length of a window
+    limit: int | None
+        The maximum number of windows to return
+        If None, returns every window
+
+    Returns
+    -------
+    List of (start_time, end_time) pairs of free windows in chronological order
+    The last window is open-ended, with an end time of None
+    """
+    if duration <= datetime.timedelta(0):
+        raise ValueError(f"Invalid duration {duration}")
+    if limit is not None and limit < 1:
+        raise ValueError(f"Invalid limit {limit}")
+    slots = []
+    # The earliest time not covered by any interval seen so far
+    cursor = after
+    for start_time, end_time in intervals:
+        if start_time - cursor >= duration:
+            slots.append((cursor, start_time))
+            if len(slots) == limit:
+                return slots
+        cursor = max(cursor, end_time)
+    slots.append((cursor, None))
+    return slots
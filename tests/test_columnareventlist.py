@@ -0,0 +1,239 @@
+import pytest
+import numpy as np
+from random import shuffle
+from scheduler.event import Event, RecurringEvent
+from datetime import datetime, timedelta
+from scheduler.search import SearchAlgorithm
+from scheduler.columnareventlist import ColumnarEventList
+
+
+# Initialize event list
+event_list = ColumnarEventList()
+num_events = 25
+
+# Create random indices
+indices = list(range(num_events))
+shuffle(indices)
+
+# Add events to list (unsorted in time)
+for i, idx in enumerate(indices):
+    dt = datetime.strftime(
+        datetime(2025, 10, 15) + timedelta(hours=idx), "%Y-%m-%d %H:%M"
+    )
+    date, time = dt.split(" ")
+    event_list.insert(
+        Event(
+            title=f"Event {i + 1}", date=date, time=time, location=f"Location {idx + 1}"
+        )
+    )
+
+new_event = Event(title="", date="2050-10-15", time="23:59", location="")
+
+
+def test_magic_functions():
+    # Length
+    assert len(event_list) == num_events
+
+    # Iterator
+    for e in event_list:
+        assert isinstance(e, Event)
+
+    # Getitem
+    assert isinstance(event_list[0], Event)
+    assert event_list[-1] == event_list[num_events - 1]
+
+    # Setitem
+    original_event = event_list[2]
+    event_list[2] = new_event
+    assert event_list[2] != original_event
+    assert event_list[2] == new_event
+    event_list[2] = original_event
+    assert event_list[2] == original_event
+    # Catch type errors
+    with pytest.raises(TypeError) as exception:
+        event_list["invalid_index"] = new_event
+    assert f"Invalid index type {str}" == str(exception.value)
+
+
+def test_insert():
+    # Check the order of the IDs
+    expected_ids = sorted([i + 1 for i in indices])
+    actual_ids = [event.id for event in event_list]
+    assert actual_ids == expected_ids
+
+    # Catch invalid types
+    with pytest.raises(TypeError) as exception:
+        event_list.insert("invalid event")
+    assert f"Cannot insert event of type {str}" == str(exception.value)
+    recurring_event = RecurringEvent(
+        title="", date="2025-09-03", time="09:00", location="", until="2025-12-01"
+    )
+    with pytest.raises(TypeError) as exception:
+        event_list.insert(recurring_event)
+    assert f"Cannot insert event of type {RecurringEvent}" == str(exception.value)
+    with pytest.raises(TypeError) as exception:
+        event_list.extend([recurring_event])
+    assert f"Cannot insert event of type {RecurringEvent}" == str(exception.value)
+
+    # Catch conflicts
+    with pytest.raises(ValueError) as exception:
+        event_list.insert(
+            Event(title="Conflicting Event", date=date, time=time, location="Anywhere")
+        )
+    assert "Conflict detected, cannot insert event" == str(exception.value)
+
+    # Insert at index
+    event_list.insert(event=new_event, index=1)
+    assert event_list[1] == new_event
+    assert event_list[2].id == expected_ids[1]
+    event_list.delete(event=new_event)
+    with pytest.raises(IndexError) as exception:
+        event_list.insert(
+            event=new_event,
+            index=1000,
+        )
+    assert "Index 1000 is out of range" == str(exception.value)
+    event_list.delete(event=new_event)
+    assert len(event_list) == num_events
+
+
+def test_extend():
+    # Bulk load from unsorted records
+    records = [
+        {
+            "title": f"Event {idx + 1}",
+            "date": f"2025-11-{str(idx + 1).zfill(2)}",
+            "time": "12:00",
+            "location": f"Location {idx + 1}",
+        }
+        for idx in indices[:20]
+    ]
+    another_event_list = ColumnarEventList.from_records(records)
+    assert len(another_event_list) == 20
+    assert [event.title for event in another_event_list] == [
+        f"Event {idx + 1}" for idx in sorted(indices[:20])
+    ]
+    assert [event.id for event in another_event_list] == list(range(1, 21))
+
+    # Every conflicting record is reported at once
+    conflicting_records = [
+        records[0],
+        {"title": "A", "date": "2025-12-01", "time": "10:00", "location": ""},
+        {"title": "B", "date": "2025-12-01", "time": "10:30", "location": ""},
+        {"title": "C", "date": "2025-12-02", "time": "10:30", "location": ""},
+    ]
+    with pytest.raises(ValueError) as exception:
+        another_event_list.extend(conflicting_records)
+    assert (
+        f"Conflict detected, cannot insert records 0 ('{records[0]['title']}' at "
+        f"{records[0]['date']} 12:00), 1 ('A' at 2025-12-01 10:00), "
+        "2 ('B' at 2025-12-01 10:30)" == str(exception.value)
+    )
+    assert len(another_event_list) == 20
+
+
+def test_delete():
+    # Delete by index
+    index = 5
+    original_event = event_list[index]
+    event_list.delete(index=index)
+    assert event_list[index] != original_event
+    assert sum([event == original_event for event in event_list]) == 0
+    event_list.insert(original_event, index=index)
+
+    # Delete by event
+    event_list.delete(event=original_event)
+    assert event_list[index] != original_event
+    assert sum([event == original_event for event in event_list]) == 0
+    event_list.insert(original_event, index=index)
+
+
+def test_search_by_id():
+    event_id = 10
+    dt = datetime.strftime(
+        datetime(2025, 10, 15) + timedelta(hours=indices[event_id - 1]),
+        "%Y-%m-%d %H:%M",
+    )
+    date, time = dt.split(" ")
+    expected_event = Event(
+        title=f"Event {event_id}",
+        date=date,
+        time=time,
+        location=f"Location {indices[event_id-1] + 1}",
+    )
+    expected_event.id = event_id
+    for algorithm in SearchAlgorithm:
+        assert event_list.search_by_id(id=event_id, algorithm=algorithm) == (
+            expected_event
+        )
+    with pytest.raises(ValueError) as exception:
+        event_list.search_by_id(id=1000)
+    assert "Could not find ID 1000 in event list" == str(exception.value)
+
+    # Batches of IDs, with missing IDs mapped to None
+    for ids in [
+        [event_id, 1000, 1],
+        {event_id, 1000, 1},
+        np.array([event_id, 1000, 1]),
+    ]:
+        found_events = event_list.search_by_id(id=ids)
+        assert set(found_events) == {event_id, 1000, 1}
+        assert found_events[event_id] == expected_event
+        assert found_events[1].id == 1
+        assert found_events[1000] is None
+    assert event_list.search_by_id(id=[]) == {}
+    assert ColumnarEventList().search_by_id(id=range(3)) == dict.fromkeys(range(3))
+
+
+def test_list_all():
+    # Check unsorted list
+    actual = [event.location for event in event_list.list_all(sort=False)]
+    expected = [f"Location {i + 1}" for i in indices]
+    assert actual == expected
+
+    # Check sorted list
+    actual = [event.location for event in event_list.list_all()]
+    expected = [f"Location {i + 1}" for i in range(num_events)]
+    assert actual == expected
+
+    # Sort by other attributes
+    actual = [event.id for event in event_list.list_all(attribute="_id")]
+    assert actual == sorted(actual)
+    actual = [event.title for event in event_list.list_all(attribute="title")]
+    assert actual == sorted(actual)
+    assert isinstance(event_list.list_all(readonly=True), tuple)
+    with pytest.raises(ValueError) as exception:
+        event_list.list_all(attribute="date")
+    assert "Cannot sort by attribute date" == str(exception.value)
+
+
+def test_find_free_slots():
+    free_list = ColumnarEventList()
+    assert free_list.find_free_slots(after=datetime(2025, 11, 3, 8)) == [
+        (datetime(2025, 11, 3, 8), None)
+    ]
+    for time in ["12:30", "09:00", "15:00", "10:00"]:
+        free_list.insert(Event(title="", date="2025-11-03", time=time, location=""))
+
+    # Windows between back-to-back events are skipped
+    assert free_list.find_free_slots(
+        after=datetime(2025, 11, 3, 8), duration=timedelta(hours=1), limit=None
+    ) == [
+        (datetime(2025, 11, 3, 8), datetime(2025, 11, 3, 9)),
+        (datetime(2025, 11, 3, 11), datetime(2025, 11, 3, 12, 30)),
+        (datetime(2025, 11, 3, 13, 30), datetime(2025, 11, 3, 15)),
+        (datetime(2025, 11, 3, 16), None),
+    ]
+    # Windows start once the event running at after ends
+    assert free_list.find_free_slots(after=datetime(2025, 11, 3, 9, 30)) == [
+        (datetime(2025, 11, 3, 11), datetime(2025, 11, 3, 12, 30))
+    ]
+    assert free_list.find_free_slots(
+        after=datetime(2025, 11, 3, 8), duration=timedelta(hours=2), limit=2
+    ) == [(datetime(2025, 11, 3, 16), None)]
+
+    # Catch invalid durations and limits
+    with pytest.raises(ValueError):
+        free_list.find_free_slots(after=datetime(2025, 11, 3), duration=timedelta(0))
+    with pytest.raises(ValueError):
+        free_list.find_free_slots(after=datetime(2025, 11, 3), limit=0)
@@ -1,6 +1,6 @@
 import pytest
-from datetime import datetime
-from scheduler.event import Event, EventNode
+from datetime import datetime, timedelta
+from scheduler.event import Event, EventNode, RecurringEvent, parse_start_time
 
 
 def test_event():
@@ -18,6 +18,7 @@ def test_event():
     assert event.end_time == datetime(2025, 10, 16, 00, 59)
     assert event.location == "Education Building, Miramontes Baca 157"
     assert hasattr(event, "_id") is False
+    assert hasattr(event, "__dict__") is False
 
     # Setting an ID
     event.id = 1234
@@ -59,6 +60,17 @@ def test_event():
     another_event.id = 1234
     assert event == another_event
 
+    # Hashing
+    assert event.key == (
+        "A Sample Event!",
+        "2025-10-15",
+        "23:59",
+        "Education Building, Miramontes Baca 157",
+        1234,
+    )
+    assert hash(event) == hash(another_event)
+    assert len({event, another_event}) == 1
+
 
 def test_eventnode():
     # General event
@@ -76,6 +88,7 @@ def test_eventnode():
     assert event.location == "Education Building, Miramontes Baca 157"
     assert event.next is None
     assert hasattr(event, "_id") is False
+    assert hasattr(event, "__dict__") is False
 
     # Setting an ID
     event.id = 1234
@@ -145,3 +158,156 @@ def test_collides_with():
     )
     assert event1.collides_with(event2)
     assert not event1.collides_with(event3)
+
+
+def test_parse_start_time():
+    # Fixed-width dates and times
+    assert parse_start_time("2025-10-15", "23:59") == datetime(2025, 10, 15, 23, 59)
+    # Other forms accepted by strptime
+    assert parse_start_time("2025-1-5", "9:05") == datetime(2025, 1, 5, 9, 5)
+    # Pre-parsed start times
+    assert parse_start_time(datetime(2025, 10, 15, 23, 59), None) == datetime(
+        2025, 10, 15, 23, 59
+    )
+    assert parse_start_time(0, None) == datetime(1970, 1, 1)
+    assert parse_start_time(90.0, None) == datetime(1970, 1, 1, 0, 1, 30)
+
+    # Catch invalid inputs
+    for date, time in [
+        ("2025-13-01", "00:00"),
+        ("2025-10-15", "24:00"),
+        ("2025-1x-01", "00:00"),
+        ("2025-10-15", "００:００"),
+    ]:
+        with pytest.raises(ValueError):
+            parse_start_time(date, time)
+    with pytest.raises(ValueError) as exception:
+        parse_start_time(datetime(2025, 10, 15), "23:59")
+    assert "Cannot combine a pre-parsed start time with a time" == str(
+        exception.value
+    )
+
+
+def test_from_datetime():
+    event = Event(
+        title="A Sample Event!",
+        date="2025-10-15",
+        time="23:59",
+        location="Education Building, Miramontes Baca 157",
+    )
+    for start_time in [datetime(2025, 10, 15, 23, 59), 1760572740]:
+        another_event = Event.from_datetime(
+            title="A Sample Event!",
+            start_time=start_time,
+            location="Education Building, Miramontes Baca 157",
+        )
+        assert another_event == event
+        assert another_event.start_time == event.start_time
+        assert another_event.end_time == event.end_time
+
+    # Event nodes
+    node = EventNode.from_datetime(
+        title="", start_time=datetime(2025, 10, 15), location=""
+    )
+    assert node.date == "2025-10-15"
+    assert node.time == "00:00"
+    assert node.next is None
+
+    # Catch invalid inputs
+    with pytest.raises(ValueError) as exception:
+        Event(title="", date=datetime(2025, 10, 15), time="23:59", location="")
+    assert "Invalid date '2025-10-15 00:00:00' or time '23:59'" == str(
+        exception.value
+    )
+
+
+def test_recurring_event():
+    # Every Tuesday at 14:00 until 2026-12-15
+    seminar = RecurringEvent(
+        title="Seminar",
+        date="2026-09-01",
+        time="14:00",
+        location="X",
+        until="2026-12-15",
+    )
+    assert seminar.count == 16
+    assert seminar.last_start_time == datetime(2026, 12, 15, 14)
+    assert seminar.last_end_time == datetime(2026, 12, 15, 15)
+    occurrences = list(seminar.occurrences())
+    assert len(occurrences) == seminar.count
+    assert all(type(occurrence) is Event for occurrence in occurrences)
+    assert occurrences[1].date == "2026-09-08"
+    assert occurrences[1].time == "14:00"
+
+    # Occurrences overlapping a window
+    window = seminar.occurrences(
+        datetime(2026, 9, 8, 14, 30), datetime(2026, 9, 22, 14)
+    )
+    assert [occurrence.date for occurrence in window] == ["2026-09-08", "2026-09-15"]
+    assert list(seminar.occurrences(datetime(2026, 12, 15, 15))) == []
+
+    # Conflicts with events are checked in both directions
+    conflict = Event(title="", date="2026-10-13", time="13:30", location="")
+    no_conflict = Event(title="", date="2026-10-14", time="14:00", location="")
+    after_last = Event(title="", date="2026-12-22", time="14:00", location="")
+    assert seminar.collides_with(conflict)
+    assert conflict.collides_with(seminar)
+    assert not seminar.collides_with(no_conflict)
+    assert not after_last.collides_with(seminar)
+
+    # Conflicts with other recurring events, with the same and different periods
+    assert seminar.collides_with(
+        RecurringEvent(
+            title="", date="2026-08-04", time="14:30", location="", until="2026-09-01"
+        )
+    )
+    assert not seminar.collides_with(
+        RecurringEvent(
+            title="", date="2026-08-04", time="14:30", location="", until="2026-08-31"
+        )
+    )
+    assert seminar.collides_with(
+        RecurringEvent(
+            title="",
+            date="2026-11-01",
+            time="14:00",
+            location="",
+            until="2026-11-30",
+            period=timedelta(days=1),
+        )
+    )
+    assert not seminar.collides_with(
+        RecurringEvent(
+            title="",
+            date="2026-11-01",
+            time="15:00",
+            location="",
+            until="2026-11-30",
+            period=timedelta(days=1),
+        )
+    )
+
+    # Equality includes the recurrence
+    assert seminar != RecurringEvent(
+        title="Seminar",
+        date="2026-09-01",
+        time="14:00",
+        location="X",
+        until="2026-12-08",
+    )
+
+    # Catch periods shorter than an event and until dates before the first occurrence
+    with pytest.raises(ValueError):
+        RecurringEvent(
+            title="",
+            date="2026-09-01",
+            time="14:00",
+            location="",
+            until="2026-12-15",
+            period=timedelta(minutes=30),
+        )
+    with pytest.raises(ValueError) as exception:
+        RecurringEvent(
+            title="", date="2026-09-01", time="14:00", location="", until="2026-08-31"
+        )
+    assert "Invalid until date '2026-08-31'" == str(exception.value)
@@ -0,0 +1,178 @@
+from datetime import datetime
+from scheduler.event import Event, RecurringEvent
+from scheduler.index import (
+    IntervalIndex,
+    PartitionedIndex,
+    SeriesIndex,
+    HashIndex,
+    PrefixIndex,
+)
+
+
+# Test parameters
+events = []
+for i in range(25):
+    event = Event(
+        title="",
+        date=f"2025-10-{str(1 + i).zfill(2)}",
+        time="01:30",
+        location="",
+    )
+    event.id = i
+    events.append(event)
+
+
+def test_intervalindex():
+    index = IntervalIndex()
+    for event in reversed(events):
+        index.add(event)
+    assert len(index) == len(events)
+    assert list(index) == events
+
+    # Overlapping window
+    overlapping = index.overlapping(datetime(2025, 10, 3, 2), datetime(2025, 10, 5, 1))
+    assert list(overlapping) == [events[2], events[3]]
+
+    # Conflicts
+    conflict = Event(title="", date="2025-10-10", time="02:00", location="")
+    no_conflict = Event(title="", date="2025-10-10", time="02:30", location="")
+    assert index.collides_with(conflict)
+    assert not index.collides_with(no_conflict)
+
+    # Removal is by identity
+    copied_event = Event(title="", date="2025-10-10", time="01:30", location="")
+    copied_event.id = 9
+    index.remove(copied_event)
+    assert len(index) == len(events)
+    index.remove(events[9])
+    assert len(index) == len(events) - 1
+    assert not index.collides_with(conflict)
+
+
+def test_find_conflicts():
+    index = IntervalIndex()
+    index.extend(events[:10])
+    assert list(index) == events[:10]
+
+    batch = [
+        Event(title="", date="2025-10-05", time="02:00", location=""),
+        Event(title="", date="2025-11-01", time="10:00", location=""),
+        Event(title="", date="2025-11-01", time="10:30", location=""),
+        Event(title="", date="2025-11-02", time="10:00", location=""),
+    ]
+    assert index.find_conflicts(batch) == [0, 1, 2]
+
+    index.extend(batch[3:])
+    assert list(index) == events[:10] + batch[3:]
+
+
+def test_partitionedindex():
+    index = PartitionedIndex(attribute="location")
+    index.extend(
+        [
+            Event(title="", date="2025-10-01", time="10:00", location="Hall"),
+            Event(title="", date="2025-10-01", time="10:00", location="Gallery"),
+        ]
+    )
+    assert len(index) == 2
+
+    # Conflicts are only detected within a location
+    conflict = Event(title="", date="2025-10-01", time="10:30", location="Hall")
+    no_conflict = Event(title="", date="2025-10-01", time="10:30", location="Library")
+    assert index.collides_with(conflict)
+    assert not index.collides_with(no_conflict)
+    assert index.find_conflicts([conflict, no_conflict, conflict]) == [0, 2]
+    assert index.find_conflicts([no_conflict]) == []
+
+    # Empty partitions are dropped on removal
+    index.add(no_conflict)
+    assert len(index.get("Library")) == 1
+    index.remove(no_conflict)
+    assert "Library" not in index.partitions
+    assert len(index.get("Library")) == 0
+
+
+def test_seriesindex():
+    index = SeriesIndex(attribute="location")
+    seminar = RecurringEvent(
+        title="", date="2026-09-01", time="14:00", location="Hall", until="2026-09-15"
+    )
+    office_hours = RecurringEvent(
+        title="",
+        date="2026-09-01",
+        time="14:30",
+        location="Gallery",
+        until="2026-09-15",
+    )
+    index.add(seminar)
+    index.add(office_hours)
+    assert len(index) == 2
+
+    # Conflicts are only detected within a location
+    conflict = Event(title="", date="2026-09-08", time="14:00", location="Hall")
+    no_conflict = Event(title="", date="2026-09-08", time="14:00", location="Library")
+    assert index.collides_with(conflict)
+    assert not index.collides_with(no_conflict)
+    assert index.find_conflicts([no_conflict, conflict]) == [1]
+
+    # Occurrences of every recurring event in start time order
+    occurrences = index.overlapping(datetime(2026, 9, 8), datetime(2026, 9, 9))
+    assert [occurrence.location for occurrence in occurrences] == ["Hall", "Gallery"]
+    assert len(list(index.overlapping())) == 6
+
+    # Removal is by equality
+    assert index.remove(conflict) is None
+    assert index.remove(seminar) is seminar
+    assert not index.collides_with(conflict)
+    assert "Hall" not in index.partitions
+
+
+def test_hashindex():
+    index = HashIndex(attribute="_id")
+    for event in events:
+        index.add(event)
+    assert len(index) == len(events)
+    assert index.get(3) == [events[3]]
+    assert index.get(100) == []
+
+    # Events without a value are not indexed
+    index.add(Event(title="", date="2025-10-10", time="01:30", location=""))
+    assert len(index) == len(events)
+
+    # Removal is by identity
+    copied_event = Event(title="", date="2025-10-04", time="01:30", location="")
+    copied_event.id = 3
+    index.remove(copied_event)
+    assert index.get(3) == [events[3]]
+    index.remove(events[3])
+    assert index.get(3) == []
+
+
+def test_prefixindex():
+    index = PrefixIndex(attribute="title")
+    titles = ["Career Fair", "career workshop", "Concert", "Careers Panel", "Art Show"]
+    titled_events = [
+        Event(title=title, date="2025-10-01", time="01:30", location="")
+        for title in titles
+    ]
+    for event in titled_events:
+        index.add(event)
+    assert len(index) == len(titles)
+
+    # Lookups ignore case and return events sorted by title
+    assert index.prefix("CAREER") == [
+        titled_events[0],
+        titled_events[1],
+        titled_events[3],
+    ]
+    assert index.prefix("careers") == [titled_events[3]]
+    assert index.prefix("") == sorted(titled_events, key=lambda e: e.title.casefold())
+    assert index.prefix("Zoo") == []
+    assert index.get("concert") == [titled_events[2]]
+    assert index.get("Con") == []
+
+    # Removal is by identity
+    index.remove(Event(title="Concert", date="2025-10-01", time="01:30", location=""))
+    assert index.get("concert") == [titled_events[2]]
+    index.remove(titled_events[2])
+    assert index.get("concert") == []
@@ -1,8 +1,10 @@
 import pytest
 from random import shuffle
-from scheduler.event import EventNode
+from scheduler.event import EventNode, RecurringEvent
 from datetime import datetime, timedelta
-from scheduler.search import SearchAlgorithm
+from scheduler.defaults import EPOCH
+from scheduler.sort import sort_data, SortingAlgorithm
+from scheduler.search import SearchAlgorithm, search_range
 from scheduler.linkedeventlist import LinkedEventList
 
 
@@ -101,7 +103,7 @@ def test_delete():
     event_list.insert(original_event, index=index)
 
 
-def test_search_by_id():
+def test_search_by_id(monkeypatch):
     event_id = 10
     found_event = event_list.search_by_id(id=event_id, algorithm=SearchAlgorithm.LINEAR)
     dt = datetime.strftime(
@@ -118,6 +120,30 @@ def test_search_by_id():
     expected_event.id = event_id
     assert found_event == expected_event
 
+    # Default hash search and binary search leave the order of the list untouched
+    order = [event.id for event in event_list]
+    assert event_list.search_by_id(id=event_id) == expected_event
+    assert (
+        event_list.search_by_id(id=event_id, algorithm=SearchAlgorithm.BINARY)
+        == expected_event
+    )
+    assert [event.id for event in event_list] == order
+
+    # The sorted copy is reused until the list changes
+    sorts = []
+    monkeypatch.setattr(
+        "scheduler.linkedeventlist.sort_data",
+        lambda **kwargs: sorts.append(kwargs) or sort_data(**kwargs),
+    )
+    for _ in range(3):
+        event_list.search_by_id(id=event_id, algorithm=SearchAlgorithm.INTERPOLATION)
+    assert sorts == []
+    monkeypatch.undo()
+
+    with pytest.raises(ValueError) as exception:
+        event_list.search_by_id(id=1000)
+    assert "Could not find ID 1000 in event list" == str(exception.value)
+
 
 def test_list_all():
     # Check unsorted list
@@ -129,3 +155,357 @@ def test_list_all():
     actual = [event.location for event in event_list.list_all()]
     expected = [f"Location {i + 1}" for i in range(num_events)]
     assert actual == expected
+
+    # Sorting leaves the order of the list untouched
+    actual = [event.location for event in event_list]
+    expected = [f"Location {i + 1}" for i in indices]
+    assert actual == expected
+
+    # Sorted views are cached until the list changes
+    view = event_list.list_all(readonly=True)
+    assert isinstance(view, tuple)
+    assert event_list.list_all(readonly=True) is view
+    assert event_list.list_all() == list(view)
+    assert event_list.list_all(attribute="_id", readonly=True) is not view
+    event_list.insert(new_event)
+    assert event_list.list_all(readonly=True) is not view
+    assert event_list.list_all()[-1] is new_event
+    event_list.delete(event=new_event)
+    assert event_list.list_all(readonly=True) == view
+
+
+def test_extend():
+    # Bulk load from unsorted records
+    records = [
+        {
+            "title": f"Event {idx + 1}",
+            "date": f"2025-11-{str(idx + 1).zfill(2)}",
+            "time": "12:00",
+            "location": f"Location {idx + 1}",
+        }
+        for idx in indices[:20]
+    ]
+    another_event_list = LinkedEventList.from_records(records)
+    assert len(another_event_list) == 20
+    assert [event.title for event in another_event_list] == [
+        f"Event {idx + 1}" for idx in sorted(indices[:20])
+    ]
+    assert [event.id for event in another_event_list] == list(range(1, 21))
+
+    # Extending an existing list
+    another_event_list.extend([new_event])
+    assert another_event_list[20] == new_event
+    assert new_event.id == 21
+    another_event_list.delete(event=new_event)
+
+    # Every conflicting record is reported at once
+    conflicting_records = [
+        records[0],
+        {"title": "A", "date": "2025-12-01", "time": "10:00", "location": ""},
+        {"title": "B", "date": "2025-12-01", "time": "10:30", "location": ""},
+    ]
+    with pytest.raises(ValueError) as exception:
+        another_event_list.extend(conflicting_records)
+    assert (
+        f"Conflict detected, cannot insert records 0 ('{records[0]['title']}' at "
+        f"{records[0]['date']} 12:00), 1 ('A' at 2025-12-01 10:00), "
+        "2 ('B' at 2025-12-01 10:30)" == str(exception.value)
+    )
+    assert len(another_event_list) == 20
+
+    # Catch invalid types
+    with pytest.raises(TypeError) as exception:
+        another_event_list.extend(["invalid event"])
+    assert f"Cannot insert event of type {str}" == str(exception.value)
+
+
+def test_doubly_linked():
+    # Bulk load into a doubly linked list
+    records = [
+        {
+            "title": f"Event {idx + 1}",
+            "date": f"2025-11-{str(idx + 1).zfill(2)}",
+            "time": "12:00",
+            "location": f"Location {idx + 1}",
+        }
+        for idx in indices[:20]
+    ]
+    doubly_linked_list = LinkedEventList.from_records(records, doubly_linked=True)
+    events = list(doubly_linked_list)
+    assert list(reversed(doubly_linked_list)) == events[::-1]
+    assert doubly_linked_list.head is events[0]
+    assert doubly_linked_list.tail is events[-1]
+    assert all(event.prev is previous for previous, event in zip(events, events[1:]))
+
+    # Appending links the event after the tail
+    appended_event = EventNode(
+        title="Appended", date="2025-12-01", time="12:00", location=""
+    )
+    doubly_linked_list.insert(appended_event)
+    assert doubly_linked_list.tail is appended_event
+    assert appended_event.prev is events[-1]
+    assert doubly_linked_list[-1] == appended_event
+
+    # Popping unlinks the tail
+    doubly_linked_list.delete()
+    assert doubly_linked_list.tail is events[-1]
+    assert events[-1].next is None
+
+    # Deleting a stored node unlinks it directly
+    doubly_linked_list.delete(event=events[10])
+    assert events[11].prev is events[9]
+    assert events[9].next is events[11]
+    assert list(reversed(doubly_linked_list)) == (events[:10] + events[11:])[::-1]
+
+    # Inserting in the middle keeps both directions consistent
+    middle_event = EventNode(
+        title="Middle", date="2025-12-02", time="12:00", location=""
+    )
+    doubly_linked_list.insert(middle_event, index=5)
+    assert doubly_linked_list[5] == middle_event
+    assert middle_event.prev is events[4]
+    assert events[5].prev is middle_event
+    assert list(reversed(doubly_linked_list)) == list(doubly_linked_list)[::-1]
+    assert doubly_linked_list[15] == events[15]
+
+    # Deleting the head leaves no dangling link
+    doubly_linked_list.delete(index=0)
+    assert doubly_linked_list.head is events[1]
+    assert events[1].prev is None
+
+    # The singly linked list still tracks its tail and iterates in reverse
+    assert event_list.tail is list(event_list)[-1]
+    assert list(reversed(event_list)) == list(event_list)[::-1]
+
+
+def test_find_free_slots():
+    free_list = LinkedEventList()
+    assert free_list.find_free_slots(after=datetime(2025, 11, 3, 8)) == [
+        (datetime(2025, 11, 3, 8), None)
+    ]
+    for time in ["12:30", "09:00", "15:00", "10:00"]:
+        free_list.insert(EventNode(title="", date="2025-11-03", time=time, location=""))
+
+    # Windows between back-to-back events are skipped
+    assert free_list.find_free_slots(
+        after=datetime(2025, 11, 3, 8), duration=timedelta(hours=1), limit=None
+    ) == [
+        (datetime(2025, 11, 3, 8), datetime(2025, 11, 3, 9)),
+        (datetime(2025, 11, 3, 11), datetime(2025, 11, 3, 12, 30)),
+        (datetime(2025, 11, 3, 13, 30), datetime(2025, 11, 3, 15)),
+        (datetime(2025, 11, 3, 16), None),
+    ]
+    # Windows start once the event running at after ends
+    assert free_list.find_free_slots(after=datetime(2025, 11, 3, 9, 30)) == [
+        (datetime(2025, 11, 3, 11), datetime(2025, 11, 3, 12, 30))
+    ]
+    assert free_list.find_free_slots(
+        after=datetime(2025, 11, 3, 8), duration=timedelta(hours=2), limit=2
+    ) == [(datetime(2025, 11, 3, 16), None)]
+
+    # Catch invalid durations and limits
+    with pytest.raises(ValueError):
+        free_list.find_free_slots(after=datetime(2025, 11, 3), duration=timedelta(0))
+    with pytest.raises(ValueError):
+        free_list.find_free_slots(after=datetime(2025, 11, 3), limit=0)
+
+
+def test_per_location():
+    for per_location_list in [
+        LinkedEventList(per_location=True),
+        LinkedEventList.from_records([], per_location=True),
+    ]:
+        for location in ["Hall", "Gallery"]:
+            per_location_list.insert(
+                EventNode(title="", date="2025-11-03", time="10:00", location=location)
+            )
+        # Events only conflict with events in the same location
+        with pytest.raises(ValueError):
+            per_location_list.insert(
+                EventNode(title="", date="2025-11-03", time="10:30", location="Hall")
+            )
+        with pytest.raises(ValueError) as exception:
+            per_location_list.extend(
+                [
+                    EventNode(
+                        title="", date="2025-11-03", time="10:30", location="Library"
+                    ),
+                    EventNode(
+                        title="", date="2025-11-03", time="10:30", location="Gallery"
+                    ),
+                ]
+            )
+        assert "records 1" in str(exception.value)
+        per_location_list.extend(
+            [EventNode(title="", date="2025-11-03", time="10:30", location="Library")]
+        )
+        assert len(per_location_list) == 3
+
+        # Range queries still span every location
+        overlapping = search_range(
+            per_location_list, datetime(2025, 11, 3, 10), datetime(2025, 11, 3, 11)
+        )
+        assert sorted(event.location for event in overlapping) == [
+            "Gallery",
+            "Hall",
+            "Library",
+        ]
+
+        # Deleted events no longer conflict
+        per_location_list.delete(index=0)
+        per_location_list.insert(
+            EventNode(title="", date="2025-11-03", time="10:30", location="Hall")
+        )
+        assert len(per_location_list) == 3
+
+        # Free slots can be found between the events of a single location
+        per_location_list.insert(
+            RecurringEvent(
+                title="",
+                date="2025-11-03",
+                time="08:00",
+                location="Hall",
+                until="2025-12-01",
+            )
+        )
+        after = datetime(2025, 11, 3, 8)
+        duration = timedelta(minutes=90)
+        assert per_location_list.find_free_slots(
+            after=after, duration=duration, location="Hall"
+        ) == [(datetime(2025, 11, 3, 9), datetime(2025, 11, 3, 10, 30))]
+        assert per_location_list.find_free_slots(
+            after=after, duration=duration, location="Gallery"
+        ) == [(after, datetime(2025, 11, 3, 10))]
+        assert per_location_list.find_free_slots(
+            after=after, duration=duration, location="Lobby"
+        ) == [(after, None)]
+        assert per_location_list.find_free_slots(after=after, duration=duration) == [
+            (datetime(2025, 11, 3, 11, 30), datetime(2025, 11, 10, 8))
+        ]
+
+    # Free slots are only found by location with per-location conflict detection
+    with pytest.raises(ValueError) as exception:
+        LinkedEventList().find_free_slots(after=datetime(2025, 11, 3), location="Hall")
+    assert (
+        "Cannot find free slots in location Hall without per-location conflict detection"
+        == str(exception.value)
+    )
+
+    # Conflicts are campus-wide by default
+    with pytest.raises(ValueError):
+        LinkedEventList().extend(
+            [
+                EventNode(title="", date="2025-11-03", time="10:00", location="Hall"),
+                EventNode(
+                    title="", date="2025-11-03", time="10:30", location="Gallery"
+                ),
+            ]
+        )
+
+
+def test_recurring_events():
+    recurring_list = LinkedEventList()
+    recurring_list.insert(
+        EventNode(title="", date="2026-09-02", time="10:00", location="")
+    )
+    seminar = RecurringEvent(
+        title="Seminar",
+        date="2026-09-01",
+        time="14:00",
+        location="",
+        until="2026-12-15",
+    )
+    recurring_list.insert(seminar)
+    # Recurring events are stored once, apart from the list
+    assert len(recurring_list) == 1
+    assert seminar.id == recurring_list[0].id + 1
+
+    # Catch conflicts with any occurrence
+    with pytest.raises(ValueError):
+        recurring_list.insert(
+            EventNode(title="", date="2026-10-13", time="14:30", location="")
+        )
+    with pytest.raises(ValueError):
+        recurring_list.extend(
+            [EventNode(title="", date="2026-10-13", time="14:30", location="")]
+        )
+    with pytest.raises(ValueError):
+        recurring_list.insert(
+            RecurringEvent(
+                title="",
+                date="2026-09-02",
+                time="09:30",
+                location="",
+                until="2026-12-01",
+            )
+        )
+
+    # Occurrences are expanded in list_all and range queries
+    assert len(recurring_list.list_all()) == 17
+    assert len(recurring_list.list_all(sort=False)) == 17
+    assert [event.title for event in recurring_list.list_all()[:3]] == [
+        "Seminar",
+        "",
+        "Seminar",
+    ]
+    overlapping = search_range(
+        recurring_list, datetime(2026, 9, 1), datetime(2026, 9, 9)
+    )
+    assert [event.start_time for event in overlapping] == [
+        datetime(2026, 9, 1, 14),
+        datetime(2026, 9, 2, 10),
+        datetime(2026, 9, 8, 14),
+    ]
+    assert recurring_list.find_free_slots(
+        after=datetime(2026, 9, 1, 13, 30), duration=timedelta(days=5)
+    ) == [(datetime(2026, 9, 2, 11), datetime(2026, 9, 8, 14))]
+
+    # Occurrences carry the ID of their recurring event, which can be looked up
+    occurrence = recurring_list.list_all()[0]
+    event_id = recurring_list[0].id
+    for algorithm in SearchAlgorithm:
+        # Prefix search only matches strings
+        if algorithm == SearchAlgorithm.PREFIX:
+            continue
+        assert recurring_list.search_by_id(occurrence.id, algorithm) is seminar
+        found = recurring_list.search_by_id([event_id, seminar.id, -1], algorithm)
+        assert found == {event_id: recurring_list[0], seminar.id: seminar, -1: None}
+
+    # Deleted recurring events no longer conflict
+    recurring_list.delete(event=seminar)
+    with pytest.raises(ValueError):
+        recurring_list.search_by_id(seminar.id)
+    assert len(recurring_list.list_all()) == 1
+    recurring_list.insert(
+        EventNode(title="", date="2026-10-13", time="14:30", location="")
+    )
+
+
+def test_list_all_by_attribute():
+    # Bulk loads are presorted by start time, which must not make sorting recurse once per event
+    records = [
+        {
+            "title": f"Event {i}",
+            "date": EPOCH + timedelta(hours=i),
+            "time": None,
+            "location": "",
+        }
+        for i in range(5000)
+    ]
+    sorted_list = LinkedEventList.from_records(records)
+    assert len(sorted_list.list_all()) == len(records)
+    assert len(sorted_list.list_all(sort=SortingAlgorithm.INTRO)) == len(records)
+
+    # Views by other attributes sort a copy, leaving the list order and other cached views untouched
+    order = [event.title for event in sorted_list]
+    by_start = sorted_list.list_all(readonly=True)
+    by_title = sorted_list.list_all(attribute="title")
+    assert [event.title for event in by_title] == sorted(
+        record["title"] for record in records
+    )
+    assert set(map(id, by_title)) == set(map(id, sorted_list))
+    assert [event.title for event in sorted_list] == order
+    assert sorted_list.list_all(readonly=True) is by_start
+    by_location = sorted_list.list_all(attribute="location", readonly=True)
+    assert sorted_list.list_all(attribute="title", readonly=True) == tuple(by_title)
+    assert sorted_list.list_all(attribute="location", readonly=True) is by_location
@@ -2,13 +2,32 @@ import pytest
 from random import sample
 from scheduler.search import (
     binary_search,
+    hash_search,
+    interpolation_search,
+    exponential_search,
+    prefix_search,
+    match_all,
+    match_prefix,
     linear_search,
     search_data,
+    search_range,
+    iter_range,
     SearchAlgorithm,
 )
-from scheduler.event import Event
+import numpy as np
+from datetime import datetime
+from types import GeneratorType
+from scheduler.event import Event, EventNode
+from scheduler.eventlist import EventList
+from scheduler.linkedeventlist import LinkedEventList
+from scheduler.skiplisteventlist import SkipListEventList
+from scheduler.columnareventlist import ColumnarEventList
+from scheduler.utils import get_attributes
 
 
+# Algorithms that do not need sorted data
+LINEAR_ALGORITHMS = [SearchAlgorithm.LINEAR, SearchAlgorithm.HASH]
+
 # Test parameters
 sorted_list = []
 for i in range(25):
@@ -75,11 +94,62 @@ def test_search(target, expected_target):
             == expected_target
         )
 
+    # Hash search
+    if expected_target is None:
+        assert hash_search(data=unsorted_list, target=target, attribute="_id") is None
+    else:
+        assert (
+            hash_search(data=unsorted_list, target=target, attribute="_id")
+            == expected_target
+        )
+
+
+@pytest.mark.parametrize("target", [-1, 0, 7, 10, 24, 25, 100])
+def test_sorted_search(target):
+    expected_target = sorted_list[target] if 0 <= target < 25 else None
+
+    # Interpolation search
+    assert (
+        interpolation_search(data=sorted_list, target=target, attribute="_id")
+        == expected_target
+    )
+    # Evenly spread datetimes
+    assert (
+        interpolation_search(
+            data=sorted_list, target=sorted_list[10].start_time, attribute="start_time"
+        )
+        == sorted_list[10]
+    )
+
+    # Exponential search, in ascending and descending order
+    assert (
+        exponential_search(data=sorted_list, target=target, attribute="_id")
+        == expected_target
+    )
+    assert (
+        exponential_search(data=sorted_list[::-1], target=target, attribute="_id")
+        == expected_target
+    )
+
+
+def test_sorted_search_duplicates():
+    data = [1, 1, 1, 2, 2, 5, 5, 5, 5, 9]
+    for target in range(11):
+        expected_target = target if target in data else None
+        assert interpolation_search(data=data, target=target) == expected_target
+        assert exponential_search(data=data, target=target) == expected_target
+    assert interpolation_search(data=[], target=1) is None
+    assert exponential_search(data=[], target=1) is None
+
 
 def test_searchalgorithm():
     expected_algorithms = {
         "LINEAR": linear_search,
         "BINARY": binary_search,
+        "HASH": hash_search,
+        "INTERPOLATION": interpolation_search,
+        "EXPONENTIAL": exponential_search,
+        "PREFIX": prefix_search,
     }
     assert list(expected_algorithms) == list(SearchAlgorithm.__members__)
     assert list(expected_algorithms.values()) == [alg.value for alg in SearchAlgorithm]
@@ -96,18 +166,18 @@ def test_search_data():
     expected_target.id = target_id
 
     # Linear search
-    assert vars(
+    assert get_attributes(
         search_data(
             data=unsorted_list, target=target_id, algorithm=SearchAlgorithm.LINEAR
         )
-    ) == vars(expected_target)
+    ) == get_attributes(expected_target)
 
     # Binary search
-    assert vars(
+    assert get_attributes(
         search_data(
             data=sorted_list, target=target_id, algorithm=SearchAlgorithm.BINARY
         )
-    ) == vars(expected_target)
+    ) == get_attributes(expected_target)
 
     # Catch value errors
     with pytest.raises(ValueError) as exception:
@@ -115,3 +185,201 @@ def test_search_data():
     assert "INVALID ALGORITHM is an invalid or undefined search algorithm." == str(
         exception.value
     )
+
+
+def test_search_batch():
+    targets = [10, 0, 100, 10]
+    expected = {10: sorted_list[10], 0: sorted_list[0], 100: None}
+    for algorithm in SearchAlgorithm:
+        # Prefix search only matches strings
+        if algorithm == SearchAlgorithm.PREFIX:
+            continue
+        data = unsorted_list if algorithm in LINEAR_ALGORITHMS else sorted_list
+        # Lists, sets, ranges and arrays are batches of targets
+        for batch in [targets, set(targets), frozenset(targets), np.array(targets)]:
+            assert search_data(data=data, target=batch, algorithm=algorithm) == expected
+        assert search_data(data=data, target=range(3), algorithm=algorithm) == {
+            0: sorted_list[0],
+            1: sorted_list[1],
+            2: sorted_list[2],
+        }
+        assert search_data(data=data, target=[], algorithm=algorithm) == {}
+
+    # Tuples are single targets
+    assert (
+        search_data(
+            data=unsorted_list,
+            target=sorted_list[3].key,
+            algorithm=SearchAlgorithm.HASH,
+            attribute="key",
+        )
+        is sorted_list[3]
+    )
+
+    # The first matching item is kept for every target
+    data = [1, 2, 2, 3]
+    for algorithm in SearchAlgorithm:
+        # Prefix search only matches strings
+        if algorithm == SearchAlgorithm.PREFIX:
+            continue
+        found = search_data(
+            data=data, target=[2, 3], attribute=None, algorithm=algorithm
+        )
+        assert found == {2: 2, 3: 3}
+
+    # Data sorted in descending order is joined in its own order
+    for batch in [[1, 3, 5], np.array([1, 3, 5])]:
+        found = search_data(
+            data=[5, 4, 3, 2, 1],
+            target=batch,
+            attribute=None,
+            algorithm=SearchAlgorithm.EXPONENTIAL,
+        )
+        assert found == {1: 1, 3: 3, 5: 5}
+    for batch in [targets, np.array(targets)]:
+        found = search_data(
+            data=sorted_list[::-1], target=batch, algorithm=SearchAlgorithm.EXPONENTIAL
+        )
+        assert found == expected
+
+
+def test_secondary_indexes():
+    events = [
+        Event(title=title, date=f"2025-10-0{i + 1}", time="12:00", location=location)
+        for i, (title, location) in enumerate(
+            [
+                ("Career Fair", "Hall"),
+                ("Concert", "Auditorium"),
+                ("career workshop", "Hall"),
+                ("Art Show", "Gallery"),
+            ]
+        )
+    ]
+
+    # Indexes are built on the fly for plain iterables
+    assert match_all(data=events, target="Hall", attribute="location") == [
+        events[0],
+        events[2],
+    ]
+    assert match_prefix(data=events, target="Career", attribute="title") == [
+        events[0],
+        events[2],
+    ]
+    assert prefix_search(data=events, target="CON", attribute="title") is events[1]
+    assert prefix_search(data=events, target="Zoo", attribute="title") is None
+
+    # Event lists keep attached indexes up to date
+    for event_list, event_type in [
+        (EventList(), Event),
+        (LinkedEventList(), EventNode),
+        (SkipListEventList(), Event),
+    ]:
+        event_list.add_index("location")
+        for event in events[:2]:
+            event_list.insert(
+                event_type(
+                    title=event.title,
+                    date=event.date,
+                    time=event.time,
+                    location=event.location,
+                )
+            )
+        event_list.add_index("title", prefix=True)
+        for event in events[2:]:
+            event_list.insert(
+                event_type(
+                    title=event.title,
+                    date=event.date,
+                    time=event.time,
+                    location=event.location,
+                )
+            )
+        assert [event.title for event in match_all(event_list, "Hall", "location")] == [
+            "Career Fair",
+            "career workshop",
+        ]
+        assert [
+            event.title for event in match_prefix(event_list, "career", "title")
+        ] == ["Career Fair", "career workshop"]
+        assert (
+            search_data(
+                data=event_list,
+                target="art",
+                algorithm=SearchAlgorithm.PREFIX,
+                attribute="title",
+            ).title
+            == "Art Show"
+        )
+        assert search_data(
+            data=event_list,
+            target=["conc", "zoo"],
+            algorithm=SearchAlgorithm.PREFIX,
+            attribute="title",
+        ) == {"conc": event_list[1], "zoo": None}
+
+        # Deleting and setting events updates the indexes
+        event_list.delete(index=0)
+        assert [
+            event.title for event in match_prefix(event_list, "career", "title")
+        ] == ["career workshop"]
+        if not isinstance(event_list, SkipListEventList):
+            event_list[0] = event_type(
+                title="Careers Panel", date="2025-10-02", time="12:00", location="Hall"
+            )
+            assert [
+                event.title for event in match_prefix(event_list, "career", "title")
+            ] == ["career workshop", "Careers Panel"]
+            assert len(match_all(event_list, "Hall", "location")) == 2
+            assert match_all(event_list, "Auditorium", "location") == []
+
+        # Catch indexes attached twice
+        with pytest.raises(ValueError) as exception:
+            event_list.add_index("title")
+        assert "Attribute title is already indexed" == str(exception.value)
+
+
+def test_search_range():
+    # Events last an hour, one a day at 01:30
+    start = datetime(2025, 10, 5, 2, 0)
+    end = datetime(2025, 10, 8, 1, 30)
+    expected_dates = ["2025-10-05", "2025-10-06", "2025-10-07"]
+
+    # Unindexed iterables are sorted by start time first
+    assert [event.date for event in search_range(unsorted_list, start, end)] == (
+        expected_dates
+    )
+
+    # Event lists bisect their own start time index
+    for event_list, event_type in [
+        (EventList(), Event),
+        (LinkedEventList(), EventNode),
+        (SkipListEventList(), Event),
+        (ColumnarEventList(), Event),
+    ]:
+        for event in unsorted_list:
+            event_list.insert(
+                event_type(
+                    title=event.title,
+                    date=event.date,
+                    time=event.time,
+                    location=event.location,
+                )
+            )
+        assert [event.date for event in search_range(event_list, start, end)] == (
+            expected_dates
+        )
+        # Windows touching an event's end or start do not overlap it
+        assert search_range(event_list, datetime(2025, 10, 5, 2, 30), start) == []
+        late_events = search_range(
+            event_list, datetime(2025, 12, 1), datetime(2026, 1, 1)
+        )
+        assert late_events == []
+        all_events = search_range(
+            event_list, datetime(2025, 1, 1), datetime(2026, 1, 1)
+        )
+        assert len(all_events) == len(unsorted_list)
+
+        # Lazy iterator form
+        events = iter_range(event_list, start, end)
+        assert isinstance(events, GeneratorType)
+        assert next(events).date == expected_dates[0]
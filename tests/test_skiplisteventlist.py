@@ -0,0 +1,228 @@
+import pytest
+from random import shuffle
+from scheduler.event import Event, RecurringEvent
+from datetime import datetime, timedelta
+from scheduler.sort import sort_data, SortingAlgorithm
+from scheduler.search import search_data, SearchAlgorithm
+from scheduler.skiplisteventlist import SkipListEventList
+
+
+# Initialize event list
+event_list = SkipListEventList()
+num_events = 25
+
+# Create random indices
+indices = list(range(num_events))
+shuffle(indices)
+
+# Add events to list (unsorted in time)
+for i, idx in enumerate(indices):
+    dt = datetime.strftime(
+        datetime(2025, 10, 15) + timedelta(hours=idx), "%Y-%m-%d %H:%M"
+    )
+    date, time = dt.split(" ")
+    event_list.insert(
+        Event(
+            title=f"Event {i + 1}", date=date, time=time, location=f"Location {idx + 1}"
+        )
+    )
+
+new_event = Event(title="", date="2050-10-15", time="23:59", location="")
+
+
+def test_magic_functions():
+    # Length
+    assert len(event_list) == num_events
+
+    # Iterator
+    for e in event_list:
+        assert isinstance(e, Event)
+
+    # Getitem
+    assert [event_list[i].location for i in range(num_events)] == [
+        f"Location {i + 1}" for i in range(num_events)
+    ]
+    assert event_list[-1] is event_list[num_events - 1]
+    with pytest.raises(IndexError) as exception:
+        event_list[num_events]
+    assert f"Index {num_events} is out of range" == str(exception.value)
+
+    # Setitem
+    original_event = event_list[2]
+    replacement = Event(
+        title="", date=original_event.date, time=original_event.time, location=""
+    )
+    event_list[2] = replacement
+    assert event_list[2] is replacement
+    event_list[2] = original_event
+    # Catch events out of order
+    with pytest.raises(ValueError) as exception:
+        event_list[2] = new_event
+    assert "Cannot set event out of start time order" == str(exception.value)
+    # Catch type errors
+    with pytest.raises(TypeError) as exception:
+        event_list["invalid_index"] = new_event
+    assert f"Invalid index type {str}" == str(exception.value)
+
+
+def test_insert():
+    # Events are ordered by start time, IDs by insertion
+    actual_ids = [event.id for event in event_list]
+    expected_ids = [indices.index(i) + 1 for i in range(num_events)]
+    assert actual_ids == expected_ids
+
+    # Catch invalid types
+    with pytest.raises(TypeError) as exception:
+        event_list.insert("invalid event")
+    assert f"Cannot insert event of type {str}" == str(exception.value)
+    recurring_event = RecurringEvent(
+        title="", date="2025-09-03", time="09:00", location="", until="2025-12-01"
+    )
+    with pytest.raises(TypeError) as exception:
+        event_list.insert(recurring_event)
+    assert f"Cannot insert event of type {RecurringEvent}" == str(exception.value)
+
+    # Catch conflicts
+    for conflicting_time in ["10:30", "11:00", "11:30"]:
+        with pytest.raises(ValueError) as exception:
+            event_list.insert(
+                Event(
+                    title="Conflicting Event",
+                    date="2025-10-15",
+                    time=conflicting_time,
+                    location="Anywhere",
+                )
+            )
+        assert "Conflict detected, cannot insert event" == str(exception.value)
+
+    # Insert in order
+    event_list.insert(event=new_event)
+    assert event_list[num_events] is new_event
+    event_list.delete(event=new_event)
+    assert len(event_list) == num_events
+
+
+def test_delete():
+    # Delete by index
+    index = 5
+    original_event = event_list[index]
+    event_list.delete(index=index)
+    assert event_list[index] != original_event
+    assert sum([event == original_event for event in event_list]) == 0
+    event_list.insert(original_event)
+    assert event_list[index] is original_event
+
+    # Delete by event
+    event_list.delete(event=original_event)
+    assert event_list[index] != original_event
+    assert sum([event == original_event for event in event_list]) == 0
+    event_list.insert(original_event)
+    assert event_list[index] is original_event
+
+    # Catch empty lists
+    with pytest.raises(IndexError) as exception:
+        SkipListEventList().delete()
+    assert "Trying to delete from empty list" == str(exception.value)
+
+
+def test_positional_access():
+    # Compare against a plain list under random inserts and deletes
+    another_event_list = SkipListEventList()
+    expected = []
+    hours = list(range(500))
+    shuffle(hours)
+    for hour in hours:
+        event = Event.from_datetime(
+            title="",
+            start_time=datetime(2025, 1, 1) + timedelta(hours=hour),
+            location="",
+        )
+        another_event_list.insert(event)
+        expected.append(event)
+    expected.sort(key=lambda event: event.start_time)
+    for index in [0, 498, 250, 17, 17, 300, -1]:
+        another_event_list.delete(index=index)
+        del expected[index]
+    assert len(another_event_list) == len(expected)
+    assert list(another_event_list) == expected
+    assert [another_event_list[i] for i in range(len(expected))] == expected
+
+
+def test_search_by_id():
+    # Events re-inserted by earlier tests get new IDs, so search for one that was not
+    event_id = event_list[0].id
+    found_event = event_list.search_by_id(id=event_id)
+    assert found_event.title == f"Event {event_id}"
+    for algorithm in SearchAlgorithm:
+        # Prefix search only matches strings
+        if algorithm == SearchAlgorithm.PREFIX:
+            continue
+        assert event_list.search_by_id(id=event_id, algorithm=algorithm) is found_event
+    with pytest.raises(ValueError) as exception:
+        event_list.search_by_id(id=1000)
+    assert "Could not find ID 1000 in event list" == str(exception.value)
+
+
+def test_sort_and_search_data():
+    # Already ordered by start time
+    assert sort_data(data=event_list) is event_list
+    # Binary search by start time through positional access
+    target = datetime(2025, 10, 15, 7)
+    found_event = search_data(
+        data=event_list,
+        target=target,
+        algorithm=SearchAlgorithm.BINARY,
+        attribute="start_time",
+    )
+    assert found_event.start_time == target
+
+
+def test_list_all():
+    # Check sorted list
+    actual = [event.location for event in event_list.list_all()]
+    expected = [f"Location {i + 1}" for i in range(num_events)]
+    assert actual == expected
+    assert [event.location for event in event_list.list_all(sort=False)] == expected
+
+    # Check list sorted by another attribute
+    actual = [event.id for event in event_list.list_all(attribute="_id")]
+    assert actual == sorted(event.id for event in event_list)
+    view = event_list.list_all(
+        sort=SortingAlgorithm.MERGE, attribute="_id", readonly=True
+    )
+    assert (
+        event_list.list_all(sort=SortingAlgorithm.MERGE, attribute="_id", readonly=True)
+        is view
+    )
+
+
+def test_find_free_slots():
+    free_list = SkipListEventList()
+    assert free_list.find_free_slots(after=datetime(2025, 11, 3, 8)) == [
+        (datetime(2025, 11, 3, 8), None)
+    ]
+    for time in ["12:30", "09:00", "15:00", "10:00"]:
+        free_list.insert(Event(title="", date="2025-11-03", time=time, location=""))
+
+    # Windows between back-to-back events are skipped
+    assert free_list.find_free_slots(
+        after=datetime(2025, 11, 3, 8), duration=timedelta(hours=1), limit=None
+    ) == [
+        (datetime(2025, 11, 3, 8), datetime(2025, 11, 3, 9)),
+        (datetime(2025, 11, 3, 11), datetime(2025, 11, 3, 12, 30)),
+        (datetime(2025, 11, 3, 13, 30), datetime(2025, 11, 3, 15)),
+        (datetime(2025, 11, 3, 16), None),
+    ]
+    # Windows start once the event running at after ends
+    assert free_list.find_free_slots(after=datetime(2025, 11, 3, 9, 30)) == [
+        (datetime(2025, 11, 3, 11), datetime(2025, 11, 3, 12, 30))
+    ]
+    assert free_list.find_free_slots(
+        after=datetime(2025, 11, 3, 8), duration=timedelta(hours=2), limit=2
+    ) == [(datetime(2025, 11, 3, 16), None)]
+
+    # Catch invalid durations and limits
+    with pytest.raises(ValueError):
+        free_list.find_free_slots(after=datetime(2025, 11, 3), duration=timedelta(0))
+    with pytest.raises(ValueError):
+        free_list.find_free_slots(after=datetime(2025, 11, 3), limit=0)
@@ -1,13 +1,23 @@
+import json
 from pytest import raises
-from random import sample
+from random import sample, randint
 from scheduler.sort import (
     insertion_sort,
     merge_sort,
     quick_sort,
+    intro_sort,
+    natural_merge_sort,
+    radix_sort,
+    parallel_merge_sort,
+    linked_merge_sort,
     sort_data,
+    external_sort,
     SortingAlgorithm,
 )
-from scheduler.event import Event
+from scheduler.event import Event, EventNode
+from scheduler.eventlist import EventList
+from scheduler.linkedeventlist import LinkedEventList
+from scheduler.skiplisteventlist import SkipListEventList
 
 
 # Test parameters
@@ -36,11 +46,153 @@ def test_quick_sort():
     assert quick_sort(data=unsorted_list, attribute="_id") == sorted_list
 
 
+def test_intro_sort(monkeypatch):
+    assert intro_sort(data=unsorted_list, attribute="_id") == sorted_list
+
+    # Sorted, reverse-sorted and repetitive data past the recursion limit
+    for data in [
+        list(range(5000)),
+        list(reversed(range(5000))),
+        [randint(0, 3) for _ in range(5000)],
+        sample(range(5000), k=5000),
+    ]:
+        assert intro_sort(data=list(data)) == sorted(data)
+
+    # Heap sort fallback once the depth bound is reached
+    monkeypatch.setattr("scheduler.sort.log2", lambda n: 0)
+    data = sample(range(1000), k=1000)
+    assert intro_sort(data=list(data)) == sorted(data)
+    assert intro_sort(data=list(unsorted_list), attribute="_id") == sorted_list
+
+
+def test_natural_merge_sort():
+    assert natural_merge_sort(data=unsorted_list, attribute="_id") == sorted_list
+
+    # Presorted, reverse-sorted, nearly sorted and repetitive data
+    for data in [
+        list(range(1000)),
+        list(reversed(range(1000))),
+        list(range(500)) + [250, 3, 999] + list(range(500, 1000)),
+        [randint(0, 3) for _ in range(1000)],
+        sample(range(1000), k=1000),
+    ]:
+        assert natural_merge_sort(data=list(data)) == sorted(data)
+
+    # Equal items keep their relative order, including within descending runs
+    data = [
+        Event(title=str(i), date=f"2025-10-{day}", time="01:30", location="")
+        for i, day in enumerate(["05", "04", "04", "03", "03", "01", "02", "01"])
+    ]
+    assert [
+        event.title for event in natural_merge_sort(data=data, attribute="start_time")
+    ] == ["5", "7", "6", "3", "4", "1", "2", "0"]
+
+
+def test_radix_sort():
+    assert radix_sort(data=unsorted_list, attribute="_id") == sorted_list
+    assert radix_sort(data=list(sorted_list[::-1]), attribute="start_time") == (
+        sorted_list
+    )
+
+    # Negative, repetitive and sparse integers
+    for data in [
+        sample(range(-500, 500), k=1000),
+        [randint(0, 3) for _ in range(1000)],
+        [randint(0, 2**40) * 60 for _ in range(1000)],
+    ]:
+        assert radix_sort(data=list(data)) == sorted(data)
+
+    # Equal keys keep their relative order
+    data = [
+        Event(title=str(i), date="2025-10-01", time=time, location="")
+        for i, time in enumerate(["10:00", "09:00", "10:00", "09:00"])
+    ]
+    assert [
+        event.title for event in radix_sort(data=data, attribute="start_time")
+    ] == ["1", "3", "0", "2"]
+
+    # Catch type errors
+    with raises(TypeError) as exception:
+        radix_sort(data=list(sorted_list), attribute="title")
+    assert f"Cannot radix sort values of type {str}" == str(exception.value)
+
+
+def test_parallel_merge_sort():
+    # Serial fallback below the threshold
+    assert parallel_merge_sort(data=unsorted_list, attribute="_id") == sorted_list
+
+    # Chunks sorted in worker processes
+    assert (
+        parallel_merge_sort(
+            data=list(reversed(sorted_list)), attribute="_id", workers=3, threshold=10
+        )
+        == sorted_list
+    )
+    data = [randint(0, 50) for _ in range(1000)]
+    assert parallel_merge_sort(data=list(data), workers=2, threshold=10) == sorted(
+        data
+    )
+
+    # Equal keys keep their relative order across chunks
+    data = [
+        Event(title=str(i), date="2025-10-01", time=time, location="")
+        for i, time in enumerate(["10:00", "09:00", "10:00", "09:00", "10:00"])
+    ]
+    assert [
+        event.title
+        for event in parallel_merge_sort(
+            data=data, attribute="start_time", workers=2, threshold=2
+        )
+    ] == ["1", "3", "0", "2", "4"]
+
+    # Options are passed through sort_data
+    assert (
+        sort_data(
+            data=list(unsorted_list),
+            algorithm=SortingAlgorithm.PARALLEL_MERGE,
+            attribute="_id",
+            workers=2,
+            threshold=2,
+        )
+        == sorted_list
+    )
+
+
+def test_linked_merge_sort():
+    # Link nodes in an unsorted order
+    nodes = [
+        EventNode(title="", date=event.date, time=event.time, location="")
+        for event in unsorted_list
+    ]
+    for node, event in zip(nodes, unsorted_list):
+        node.id = event.id
+    for node, next_node in zip(nodes, nodes[1:]):
+        node.next = next_node
+
+    # The same nodes are relinked in order
+    head = linked_merge_sort(head=nodes[0], attribute="_id")
+    relinked = []
+    while head is not None:
+        relinked.append(head)
+        head = head.next
+    assert relinked == sorted_list
+    assert sorted(map(id, relinked)) == sorted(map(id, nodes))
+
+    # Empty and single-node lists
+    assert linked_merge_sort(head=None) is None
+    single_node = EventNode(title="", date="2025-10-01", time="01:30", location="")
+    assert linked_merge_sort(head=single_node) is single_node
+
+
 def test_sortingalgorithm():
     expected_algorithms = {
         "INSERTION": insertion_sort,
         "MERGE": merge_sort,
         "QUICK": quick_sort,
+        "INTRO": intro_sort,
+        "NATURAL_MERGE": natural_merge_sort,
+        "RADIX": radix_sort,
+        "PARALLEL_MERGE": parallel_merge_sort,
     }
     assert list(expected_algorithms) == list(SortingAlgorithm.__members__)
     assert list(expected_algorithms.values()) == [alg.value for alg in SortingAlgorithm]
@@ -63,9 +215,217 @@ def test_sort_data():
         sort_data(data=unsorted_list, algorithm=SortingAlgorithm.QUICK) == sorted_list
     )
 
+    # Plain items without an attribute
+    assert sort_data(data=[3, 1, 2], attribute=None) == [1, 2, 3]
+
+    # Linked event lists are relinked in place without copying nodes
+    for doubly_linked in [False, True]:
+        linked_list = LinkedEventList(doubly_linked=doubly_linked)
+        for event in unsorted_list:
+            linked_list.insert(
+                EventNode(
+                    title=str(event.id), date=event.date, time=event.time, location=""
+                )
+            )
+        nodes = list(linked_list)
+        version = linked_list._version
+        assert sort_data(data=linked_list, attribute="title") is linked_list
+        assert [node.title for node in linked_list] == sorted(
+            node.title for node in nodes
+        )
+        assert sorted(map(id, linked_list)) == sorted(map(id, nodes))
+        assert linked_list.tail is list(linked_list)[-1]
+        assert list(reversed(linked_list)) == list(linked_list)[::-1]
+        assert linked_list._version > version
+
+        # Radix sort relinks the nodes in the sorted order too
+        assert sort_data(
+            data=linked_list, algorithm=SortingAlgorithm.RADIX, attribute="_id"
+        ) is linked_list
+        assert [node.id for node in linked_list] == sorted(node.id for node in nodes)
+        assert list(reversed(linked_list)) == list(linked_list)[::-1]
+
     # Catch value errors
     with raises(ValueError) as exception:
         sort_data(data=unsorted_list, algorithm="INVALID ALGORITHM")
     assert "INVALID ALGORITHM is an invalid or undefined sorting algorithm." == str(
         exception.value
     )
+
+
+def test_sort_data_keys(monkeypatch):
+    events = [
+        Event(title="", date="2025-10-02", time="09:00", location="B"),
+        Event(title="", date="2025-10-01", time="09:00", location="B"),
+        Event(title="", date="2025-10-03", time="09:00", location="A"),
+        Event(title="", date="2025-10-04", time="09:00", location="A"),
+    ]
+    for i, event in enumerate(events):
+        event.id = i
+    for algorithm in SortingAlgorithm:
+        if algorithm is SortingAlgorithm.RADIX:
+            continue
+        # Sort by several attributes in turn
+        data = list(events)
+        assert sort_data(
+            data=data, algorithm=algorithm, attribute=("location", "start_time")
+        ) == [events[2], events[3], events[1], events[0]]
+        assert data == [events[2], events[3], events[1], events[0]]
+
+        # Sort with a key function
+        assert sort_data(
+            data=list(events), algorithm=algorithm, key=lambda event: -event.id
+        ) == events[::-1]
+
+        # Reverse ordering keeps events with equal keys in their original order
+        assert sort_data(
+            data=list(events), algorithm=algorithm, attribute="location", reverse=True
+        ) == [events[0], events[1], events[2], events[3]]
+        assert sort_data(
+            data=list(events), algorithm=algorithm, attribute="start_time", reverse=True
+        ) == [events[3], events[2], events[0], events[1]]
+
+    # Radix sort only supports integer and datetime keys
+    assert sort_data(
+        data=list(events), algorithm=SortingAlgorithm.RADIX, key=lambda event: -event.id
+    ) == events[::-1]
+    assert sort_data(
+        data=list(events),
+        algorithm=SortingAlgorithm.RADIX,
+        attribute="start_time",
+        reverse=True,
+    ) == [events[3], events[2], events[0], events[1]]
+    with raises(TypeError):
+        sort_data(
+            data=list(events),
+            algorithm=SortingAlgorithm.RADIX,
+            attribute=("location", "start_time"),
+        )
+
+    # The data is left untouched if sorting fails
+    data = list(events)
+    with raises(TypeError):
+        sort_data(data=data, key=lambda event: None if event.id == 3 else event.id)
+    assert data == events
+
+    # Linked event lists are relinked in the sorted order
+    linked_list = LinkedEventList(doubly_linked=True)
+    for event in events:
+        linked_list.insert(
+            EventNode(
+                title=str(event.id),
+                date=event.date,
+                time=event.time,
+                location=event.location,
+            )
+        )
+    assert sort_data(
+        data=linked_list, attribute=("location", "start_time"), reverse=True
+    ) is linked_list
+    assert [node.title for node in linked_list] == ["0", "1", "3", "2"]
+    assert [node.title for node in reversed(linked_list)] == ["2", "3", "1", "0"]
+
+    # Event lists are reordered in place without re-indexing every event
+    def _setitem(self, index, value):
+        raise AssertionError("Reordering went through __setitem__")
+
+    event_list = EventList()
+    for event in events:
+        event_list.insert(
+            Event(
+                title=str(event.id),
+                date=event.date,
+                time=event.time,
+                location=event.location,
+            )
+        )
+    monkeypatch.setattr(EventList, "__setitem__", _setitem)
+    result = sort_data(data=event_list, attribute=("location", "start_time"))
+    assert result is event_list
+    assert [event.title for event in event_list] == ["2", "3", "1", "0"]
+    assert len(event_list._index) == len(events)
+    assert event_list.search_by_id(id=event_list[0].id) is event_list[0]
+
+    # Containers kept in start time order return a sorted list instead
+    skip_list = SkipListEventList()
+    for event in events:
+        skip_list.insert(event)
+    assert sort_data(data=skip_list, attribute="location") == [
+        events[2],
+        events[3],
+        events[1],
+        events[0],
+    ]
+    assert list(skip_list) == [events[1], events[0], events[2], events[3]]
+
+
+def test_external_sort(tmp_path, monkeypatch):
+    records = [
+        {
+            "title": f"Event {i}",
+            "date": f"2025-10-{str(1 + i % 25).zfill(2)}",
+            "time": "01:30" if i < 50 else "12:00",
+            "location": "Room",
+        }
+        for i in sample(range(100), k=100)
+    ]
+    expected = sorted(records, key=lambda record: (record["date"], record["time"]))
+
+    # Runs spilled to temporary files are merged back in order
+    for algorithm in [SortingAlgorithm.NATURAL_MERGE, SortingAlgorithm.RADIX]:
+        events = external_sort(records=records, memory=2000, algorithm=algorithm)
+        assert [event.title for event in events] == [
+            record["title"] for record in expected
+        ]
+
+    # Events from a JSON Lines file keep their IDs and attributes
+    path = tmp_path / "events.jsonl"
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n")
+    events = list(external_sort(records=path, memory=2000))
+    assert events == [Event(**record) for record in expected]
+    events = list(external_sort(records=sorted_list[::-1], memory=1))
+    assert events == sorted_list
+    assert [event.id for event in events] == [event.id for event in sorted_list]
+
+    # Runs are merged in several passes when there are more of them than the fan-in,
+    # without ever holding more than fan_in files open
+    files = []
+    peak = 0
+
+    def _open(*args, **kwargs):
+        nonlocal peak
+        files.append(open(*args, **kwargs))
+        peak = max(peak, sum(not file.closed for file in files))
+        return files[-1]
+
+    monkeypatch.setattr("scheduler.sort.open", _open, raising=False)
+    for fan_in in [3, 4, 8]:
+        peak = 0
+        events = external_sort(records=records, memory=1, fan_in=fan_in)
+        assert [event.title for event in events] == [
+            record["title"] for record in expected
+        ]
+        assert 1 < peak <= fan_in
+
+    # Runs left unread are closed with the generator
+    events = external_sort(records=records, memory=1, fan_in=3)
+    next(events)
+    events.close()
+    assert all(file.closed for file in files)
+    monkeypatch.undo()
+
+    # Catch invalid arguments
+    with raises(ValueError) as exception:
+        external_sort(records=records, memory=0)
+    assert "Memory budget must be positive, got 0" == str(exception.value)
+    with raises(ValueError) as exception:
+        external_sort(records=records, fan_in=2)
+    assert "Fan-in must be at least 3, got 2" == str(exception.value)
+    with raises(ValueError) as exception:
+        external_sort(records=records, algorithm="INVALID ALGORITHM")
+    assert "INVALID ALGORITHM is an invalid or undefined sorting algorithm." == str(
+        exception.value
+    )
+    with raises(TypeError) as exception:
+        list(external_sort(records=["invalid event"]))
+    assert f"Cannot sort event of type {str}" == str(exception.value)
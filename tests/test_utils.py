@@ -1,4 +1,4 @@
-from scheduler.utils import parse_object
+from scheduler.utils import parse_object, get_attributes
 
 
 class DummyClass:
@@ -6,6 +6,17 @@ class DummyClass:
         self.property = property
 
 
+class SlottedDummyClass:
+    __slots__ = ("property", "unset_property")
+
+    def __init__(self, property):
+        self.property = property
+
+
+class SlottedDummySubclass(SlottedDummyClass):
+    __slots__ = ("another_property",)
+
+
 def test_parse_object():
     dummy_object = DummyClass(property="test")
 
@@ -17,3 +28,15 @@ def test_parse_object():
     # Parsing for attribute
     attribute = parse_object(dummy_object, attribute="property")
     assert attribute == "test"
+
+    # Parsing for attribute stored in slots
+    attribute = parse_object(SlottedDummyClass(property="test"), attribute="property")
+    assert attribute == "test"
+
+
+def test_get_attributes():
+    assert get_attributes(DummyClass(property="test")) == {"property": "test"}
+    assert get_attributes(SlottedDummyClass(property="test")) == {"property": "test"}
+    slotted_object = SlottedDummySubclass(property="test")
+    slotted_object.another_property = 1
+    assert get_attributes(slotted_object) == {"another_property": 1, "property": "test"}